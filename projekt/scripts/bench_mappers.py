@@ -0,0 +1,110 @@
+"""A benchmark of building models from 10k fetched rows.
+
+It compares the mappers of `src.infrastructure.utils.mappers` with the
+validating `Model(**dict(record))` construction they replaced. The rows
+are tuples in the column order of the tables, as the asyncpg rows of a
+listing are, so no DB is needed. Run it from the `projekt` directory with
+`python -m scripts.bench_mappers`.
+"""
+
+import timeit
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable
+
+from src.core.domain.match import Match
+from src.core.domain.team import Team
+from src.db import league_table, user_table
+from src.infrastructure.dto.leaguedto import LeagueDTO
+from src.infrastructure.utils.mappers import (
+    MATCH_COLUMNS,
+    TEAM_COLUMNS,
+    map_league,
+    map_match,
+    map_team,
+)
+
+ROWS = 10_000
+REPEAT = 5
+KICKOFF = datetime(2024, 3, 1, 18, tzinfo=timezone.utc)
+
+# Keys of a league row joined with users, as named by `databases`.
+LEAGUE_KEYS = tuple(league_table.c.keys()) + tuple(
+    f"{key}_1" if key == "id" else key for key in user_table.c.keys()
+)
+
+
+def _rows() -> dict[str, list[tuple]]:
+    """A function building the fetched rows of every mapped table.
+
+    Returns:
+        dict[str, list[tuple]]: The rows by the name of the table.
+    """
+    return {
+        "matches": [
+            (
+                row_id, 1, row_id % 20 + 1, (row_id + 7) % 20 + 1,
+                2, 1, KICKOFF + timedelta(hours=row_id), "finished", 1,
+            )
+            for row_id in range(ROWS)
+        ],
+        "teams": [
+            (row_id, f"Team {row_id}", 1, row_id)
+            for row_id in range(ROWS)
+        ],
+        "leagues": [
+            (
+                row_id, f"League {row_id}", "Siedlce", "football", False,
+                1, "active", 1, "owner@example.com", "-",
+            )
+            for row_id in range(ROWS)
+        ],
+    }
+
+
+def _best(mapper: Callable[[Any], Any], rows: list[tuple]) -> float:
+    """A function timing the mapping of all rows.
+
+    Args:
+        mapper (Callable[[Any], Any]): The function mapping one row.
+        rows (list[tuple]): The fetched rows.
+
+    Returns:
+        float: The best time of mapping the rows, in seconds.
+    """
+    return min(timeit.repeat(
+        lambda: [mapper(row) for row in rows],
+        number=1,
+        repeat=REPEAT,
+    ))
+
+
+def main() -> None:
+    """A function running the benchmark."""
+    rows = _rows()
+    paths = {
+        "matches": (
+            lambda row: Match(**dict(zip(MATCH_COLUMNS, row))),
+            map_match,
+        ),
+        "teams": (
+            lambda row: Team(**dict(zip(TEAM_COLUMNS, row))),
+            map_team,
+        ),
+        "leagues": (
+            lambda row: LeagueDTO.from_record(dict(zip(LEAGUE_KEYS, row))),
+            map_league,
+        ),
+    }
+
+    print(f"{'rows':<8} {'validated':>12} {'mapped':>12} {'speedup':>8}")
+    for name, (validated, mapped) in paths.items():
+        before = _best(validated, rows[name])
+        after = _best(mapped, rows[name])
+        print(
+            f"{name:<8} {before * 1000:9.1f} ms {after * 1000:9.1f} ms "
+            f"{before / after:7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""A benchmark of the league matches endpoint serialization.
+
+It compares `/matches/league/{id}` answered with `ModelResponse` against
+the same handler returning the models for FastAPI to validate against the
+`response_model` and encode. The match service is replaced with one
+returning 500 matches, so only the request handling and serialization are
+measured. Run it from the `projekt` directory with
+`python -m scripts.bench_responses`.
+"""
+
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Iterable
+
+import httpx
+from dependency_injector import providers
+from dependency_injector.wiring import Provide, inject
+from fastapi import Depends, FastAPI
+
+from src.container import Container
+from src.core.domain.match import Match, MatchStatus
+from src.infrastructure.services.imatch import IMatchService
+from src.main import app, container
+
+MATCHES = 500
+REQUESTS = 500
+WARMUP = 50
+KICKOFF = datetime(2024, 3, 1, 18, tzinfo=timezone.utc)
+
+before = FastAPI()
+
+
+@before.get(
+    "/matches/league/{league_id}",
+    response_model=Iterable[Match],
+    status_code=200,
+)
+@inject
+async def get_matches_by_league(
+    league_id: int,
+    service: IMatchService = Depends(Provide[Container.match_service]),
+) -> Iterable:
+    """The handler returning the models for FastAPI to serialize."""
+    return await service.get_matches_by_league(league_id)
+
+
+class LeagueMatches:
+    """A match service returning the same matches for every league."""
+
+    def __init__(self, matches: list[Match]) -> None:
+        """The initializer of the service.
+
+        Args:
+            matches (list[Match]): The matches to return.
+        """
+        self._matches = matches
+
+    async def get_matches_by_league(self, league_id: int) -> list[Match]:
+        """Get the matches of a league.
+
+        Args:
+            league_id (int): The ID of the league.
+
+        Returns:
+            list[Match]: The matches.
+        """
+        return self._matches
+
+
+def _matches() -> list[Match]:
+    """A function building the matches returned by the service.
+
+    Returns:
+        list[Match]: The matches, half of them finished.
+    """
+    return [
+        Match(
+            id=match_id,
+            league_id=1,
+            home_team_id=match_id % 20 + 1,
+            away_team_id=(match_id + 7) % 20 + 1,
+            home_score=2 if match_id % 2 else None,
+            away_score=1 if match_id % 2 else None,
+            date=KICKOFF + timedelta(days=match_id // 10),
+            status=MatchStatus.FINISHED if match_id % 2 else MatchStatus.SCHEDULED,
+            submitted_by=1,
+        )
+        for match_id in range(1, MATCHES + 1)
+    ]
+
+
+async def _measure(target: FastAPI) -> tuple[float, int]:
+    """A function sending the requests to an app one after another.
+
+    Args:
+        target (FastAPI): The app to call.
+
+    Returns:
+        tuple[float, int]: The requests per second and the body size.
+    """
+    transport = httpx.ASGITransport(app=target)
+    async with httpx.AsyncClient(
+        transport=transport,
+        base_url="http://bench",
+    ) as client:
+        for _ in range(WARMUP):
+            response = await client.get("/matches/league/1")
+            response.raise_for_status()
+
+        started = time.perf_counter()
+        for _ in range(REQUESTS):
+            await client.get("/matches/league/1")
+        elapsed = time.perf_counter() - started
+
+    return REQUESTS / elapsed, len(response.content)
+
+
+async def main() -> None:
+    """A function running the benchmark."""
+    container.wire(modules=[__name__])
+    container.match_service.override(
+        providers.Object(LeagueMatches(_matches()))
+    )
+
+    results = {
+        "validated": await _measure(before),
+        "ModelResponse": await _measure(app),
+    }
+
+    for name, (rate, size) in results.items():
+        print(f"{name:<14} {rate:8.1f} req/s {size:10,} bytes")
+
+    speedup = results["ModelResponse"][0] / results["validated"][0]
+    print(f"speedup        {speedup:8.2f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
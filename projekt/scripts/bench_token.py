@@ -0,0 +1,69 @@
+"""A microbenchmark of resolving the user of a bearer token.
+
+It compares verifying the JWT on every request with the verified-token
+cache used by `get_current_user_id`. Run it from the `projekt` directory
+with `python -m scripts.bench_token`.
+"""
+
+import timeit
+from datetime import datetime, timedelta, timezone
+
+from jose import jwt
+
+from src.infrastructure.utils.cache import LRUCache
+from src.infrastructure.utils.consts import ALGORITHM, SECRET_KEY
+from src.infrastructure.utils.token import decode_user_token
+
+NUMBER = 20_000
+
+
+def _token() -> str:
+    """A function encoding a token of a user valid for an hour.
+
+    Returns:
+        str: The encoded JWT token.
+    """
+    expire = datetime.now(timezone.utc) + timedelta(hours=1)
+
+    return jwt.encode(
+        {"sub": "42", "exp": expire},
+        key=SECRET_KEY,
+        algorithm=ALGORITHM,
+    )
+
+
+def _report(name: str, seconds: float) -> None:
+    """A function printing the time of one call and the calls per second.
+
+    Args:
+        name (str): The name of the measured path.
+        seconds (float): The total time of `NUMBER` calls.
+    """
+    print(
+        f"{name:<12} {seconds / NUMBER * 1e6:8.2f} us/call "
+        f"{NUMBER / seconds:12,.0f} calls/s"
+    )
+
+
+def main() -> None:
+    """A function running the benchmark."""
+    token = _token()
+    cache = LRUCache(max_size=16)
+    decode_user_token(token, cache)
+
+    verify = timeit.timeit(
+        lambda: int(jwt.decode(token, SECRET_KEY, [ALGORITHM])["sub"]),
+        number=NUMBER,
+    )
+    cached = timeit.timeit(
+        lambda: decode_user_token(token, cache),
+        number=NUMBER,
+    )
+
+    _report("jwt.decode", verify)
+    _report("cached", cached)
+    print(f"speedup      {verify / cached:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
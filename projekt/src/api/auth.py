@@ -0,0 +1,41 @@
+"""A module containing authentication dependencies for the routers."""
+
+from dependency_injector.wiring import inject, Provide
+from fastapi import Depends, HTTPException
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+
+from src.container import Container
+from src.infrastructure.utils.cache import LRUCache
+from src.infrastructure.utils.token import decode_user_token
+
+bearer_scheme = HTTPBearer()
+
+
+@inject
+async def get_current_user_id(
+    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
+    cache: LRUCache = Depends(Provide[Container.token_cache]),
+) -> int:
+    """A dependency resolving the ID of the authenticated user.
+
+    Args:
+        credentials (HTTPAuthorizationCredentials, optional): The credentials.
+        cache (LRUCache, optional): The injected cache of verified tokens.
+
+    Raises:
+        HTTPException: 401 if the token is invalid or expired.
+
+    Returns:
+        int: The ID of the authenticated user.
+    """
+
+    user_id = decode_user_token(credentials.credentials, cache)
+
+    if user_id is None:
+        raise HTTPException(
+            status_code=401,
+            detail="Invalid token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    return user_id
@@ -0,0 +1,88 @@
+"""A module containing custom response classes for the routers."""
+
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any
+
+from fastapi import Request, Response
+from fastapi.responses import StreamingResponse
+from pydantic_core import to_json
+
+from src.infrastructure.utils.consts import CALENDAR_CACHE_CONTROL
+from src.infrastructure.utils.ics import CalendarFeed
+
+
+class ModelResponse(Response):
+    """A JSON response serializing trusted models in a single pass.
+
+    Returning it from a handler skips the `response_model` validation of
+    FastAPI, so it may only wrap models the handler already trusts, e.g.
+    the ones built by repositories. The `response_model` of the route is
+    still used for the OpenAPI schema.
+    """
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        """Serialize the content straight to JSON bytes.
+
+        Args:
+            content (Any): The models, or collections of models, to send.
+
+        Returns:
+            bytes: The encoded body.
+        """
+        return to_json(content)
+
+
+def calendar_response(request: Request, feed: CalendarFeed) -> Response:
+    """A function answering a request for a calendar feed.
+
+    Conditional requests matching the feed are answered with 304, so
+    polling clients only download the feed after it changed.
+
+    Args:
+        request (Request): The incoming HTTP request.
+        feed (CalendarFeed): The requested feed.
+
+    Returns:
+        Response: The streamed feed or the 304 response.
+    """
+    headers = {
+        "ETag": feed.etag,
+        "Last-Modified": format_datetime(feed.last_modified, usegmt=True),
+        "Cache-Control": CALENDAR_CACHE_CONTROL,
+    }
+
+    if _is_not_modified(request, feed):
+        return Response(status_code=304, headers=headers)
+
+    return StreamingResponse(
+        iter(feed.chunks),
+        media_type="text/calendar; charset=utf-8",
+        headers=headers,
+    )
+
+
+def _is_not_modified(request: Request, feed: CalendarFeed) -> bool:
+    """A function checking the validators of a conditional request.
+
+    `If-None-Match` takes precedence over `If-Modified-Since`.
+
+    Args:
+        request (Request): The incoming HTTP request.
+        feed (CalendarFeed): The requested feed.
+
+    Returns:
+        bool: True if the client already has the feed.
+    """
+    if (tags := request.headers.get("if-none-match")) is not None:
+        return tags.strip() == "*" or feed.etag in {
+            tag.strip().removeprefix("W/") for tag in tags.split(",")
+        }
+
+    if since := request.headers.get("if-modified-since"):
+        try:
+            return feed.last_modified <= parsedate_to_datetime(since)
+        except (TypeError, ValueError):
+            return False
+
+    return False
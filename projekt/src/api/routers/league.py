@@ -3,72 +3,160 @@
 from typing import Iterable
 
 from dependency_injector.wiring import inject, Provide
-from fastapi import APIRouter, Depends, HTTPException
-from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from jose import jwt
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 
 from src.infrastructure.utils import consts
+from src.api.auth import get_current_user_id
+from src.api.responses import ModelResponse, calendar_response
 from src.container import Container
-from src.core.domain.league import LeagueIn, LeagueUpdate, LeagueBroker, League
-from src.infrastructure.dto.leaguedto import LeagueDTO
+from src.core.domain.imports import ImportReport
+from src.core.domain.invitation import (
+    Invitation,
+    InvitationAcceptIn,
+    InvitationsIn,
+)
+from src.core.domain.league import (
+    LeagueIn,
+    LeagueUpdate,
+    LeagueBroker,
+    League,
+    LeagueFilter,
+    LeagueStatus,
+    ScheduleIn,
+    SportType,
+)
+from src.core.domain.match import Match
+from src.core.domain.standing import Standing
+from src.core.domain.team import Team
+from src.infrastructure.dto.leaguedto import LeagueDTO, LeagueOverviewDTO
+from src.infrastructure.dto.pagedto import CountedPageDTO, PageDTO
+from src.infrastructure.services.icalendar import ICalendarService
+from src.infrastructure.services.iimport import IImportService
+from src.infrastructure.services.iinvitation import IInvitationService
 from src.infrastructure.services.ileague import ILeagueService
 from src.infrastructure.services.iteam import ITeamService
 
-bearer_scheme = HTTPBearer()
-
 router = APIRouter()
 
 
+def _archived_headers(league: LeagueDTO) -> dict[str, str] | None:
+    """A function getting the caching headers of league reads.
+
+    Args:
+        league (LeagueDTO): The read league.
+
+    Returns:
+        dict[str, str] | None: The long-lived caching headers if the league
+            is archived.
+    """
+    if league.status == LeagueStatus.ARCHIVED:
+        return {"Cache-Control": consts.ARCHIVED_CACHE_CONTROL}
+
+    return None
+
+
 @router.post("/create", response_model=LeagueDTO, status_code=201)
 @inject
 async def create_league(
     league: LeagueIn,
     service: ILeagueService = Depends(Provide[Container.league_service]),
-    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
-) -> dict:
+    user_id: int = Depends(get_current_user_id),
+) -> ModelResponse:
     """An endpoint for creating a new league.
 
     Args:
         league (LeagueIn): The league data.
         service (ILeagueService, optional): The injected service dependency.
-        credentials (HTTPAuthorizationCredentials, optional): The credentials.
+        user_id (int, optional): The ID of the authenticated user.
 
     Returns:
-        dict: The new league attributes.
+        ModelResponse: The new league attributes.
     """
 
-    token = credentials.credentials
-    token_payload = jwt.decode(
-        token,
-        key=consts.SECRET_KEY,
-        algorithms=[consts.ALGORITHM],
-    )
-    user_id = int(token_payload.get("sub"))
-
-    if not user_id:
-        raise HTTPException(status_code=403, detail="Unauthorized")
-
     league_broker = LeagueBroker(**league.model_dump(), owner_id=int(user_id))
     new_league = await service.add_league(league_broker)
 
-    return new_league.model_dump() if new_league else {}
+    return ModelResponse(new_league or {}, status_code=201)
+
+
+@router.get("", response_model=CountedPageDTO[LeagueDTO], status_code=200)
+@inject
+async def list_leagues(
+    city: str | None = None,
+    sport_type: SportType | None = None,
+    status: LeagueStatus | None = None,
+    owner_id: int | None = None,
+    is_private: bool | None = None,
+    ids: list[int] | None = Query(None, max_length=consts.MAX_PAGE_SIZE),
+    include_total: bool = False,
+    limit: int = Query(consts.DEFAULT_PAGE_SIZE, ge=1, le=consts.MAX_PAGE_SIZE),
+    after: str | None = None,
+    service: ILeagueService = Depends(Provide[Container.league_service]),
+) -> ModelResponse:
+    """An endpoint for getting a page of leagues matching optional filters.
+
+    Args:
+        city (str | None, optional): The city of the leagues.
+        sport_type (SportType | None, optional): The sport type.
+        status (LeagueStatus | None, optional): The status of the leagues.
+        owner_id (int | None, optional): The ID of the owner.
+        is_private (bool | None, optional): The privacy of the leagues.
+        ids (list[int] | None, optional): The IDs of the leagues.
+        include_total (bool, optional): Whether to count all matching
+            leagues; large counts are estimated.
+        limit (int, optional): The maximum number of leagues on the page.
+        after (str | None, optional): The cursor of the previous page.
+        service (ILeagueService, optional): The injected service dependency.
+
+    Raises:
+        HTTPException: 400 if the cursor is malformed.
+
+    Returns:
+        ModelResponse: The page of league attributes.
+    """
+    filters = LeagueFilter(
+        city=city,
+        sport_type=sport_type,
+        status=status,
+        owner_id=owner_id,
+        is_private=is_private,
+        ids=ids,
+    )
+
+    try:
+        page = await service.list_leagues(filters, limit, after, include_total)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    return ModelResponse(page, status_code=200)
 
 
-@router.get("/all", response_model=Iterable[LeagueDTO], status_code=200)
+@router.get("/all", response_model=PageDTO[LeagueDTO], status_code=200)
 @inject
 async def get_all_leagues(
+    limit: int = Query(consts.DEFAULT_PAGE_SIZE, ge=1, le=consts.MAX_PAGE_SIZE),
+    after: str | None = None,
     service: ILeagueService = Depends(Provide[Container.league_service]),
-) -> Iterable:
-    """An endpoint for getting all public leagues.
+) -> ModelResponse:
+    """An endpoint for getting a page of public leagues.
 
     Args:
+        limit (int, optional): The maximum number of leagues on the page.
+        after (str | None, optional): The cursor of the previous page.
         service (ILeagueService, optional): The injected service dependency.
 
+    Raises:
+        HTTPException: 400 if the cursor is malformed.
+
     Returns:
-        Iterable: The league attributes collection.
+        ModelResponse: The page of league attributes.
     """
-    leagues = await service.get_public_leagues()
-    return leagues
+    try:
+        page = await service.get_public_leagues(limit, after)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    return ModelResponse(page, status_code=200)
 
 
 @router.get("/by-city", response_model=Iterable[LeagueDTO], status_code=200)
@@ -76,7 +164,7 @@ async def get_all_leagues(
 async def get_leagues_by_city(
     city: str,
     service: ILeagueService = Depends(Provide[Container.league_service]),
-) -> Iterable:
+) -> ModelResponse:
     """An endpoint for getting all public leagues filtered by city.
 
     Args:
@@ -84,61 +172,96 @@ async def get_leagues_by_city(
         service (ILeagueService, optional): The injected service dependency.
 
     Returns:
-        Iterable: The league attributes collection.
+        ModelResponse: The league attributes collection.
     """
     leagues = await service.get_leagues_by_city(city)
-    return leagues
+    return ModelResponse(leagues, status_code=200)
+
+
+@router.get("/search", response_model=PageDTO[LeagueDTO], status_code=200)
+@inject
+async def search_leagues(
+    q: str = Query(min_length=consts.SEARCH_MIN_LENGTH),
+    sport_type: SportType | None = None,
+    limit: int = Query(consts.DEFAULT_PAGE_SIZE, ge=1, le=consts.MAX_PAGE_SIZE),
+    after: str | None = None,
+    service: ILeagueService = Depends(Provide[Container.league_service]),
+) -> ModelResponse:
+    """An endpoint for searching active public leagues by name and city.
+
+    Args:
+        q (str): The searched phrase.
+        sport_type (SportType | None, optional): The sport type to filter by.
+        limit (int, optional): The maximum number of leagues on the page.
+        after (str | None, optional): The cursor of the previous page.
+        service (ILeagueService, optional): The injected service dependency.
+
+    Raises:
+        HTTPException: 400 if the cursor is malformed.
+
+    Returns:
+        ModelResponse: The page of leagues ranked by similarity.
+    """
+    try:
+        page = await service.search_leagues(q, sport_type, limit, after)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    return ModelResponse(page, status_code=200)
 
 
 @router.get("/my", response_model=Iterable[LeagueDTO], status_code=200)
 @inject
 async def get_my_leagues(
     service: ILeagueService = Depends(Provide[Container.league_service]),
-    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
-) -> Iterable:
+    user_id: int = Depends(get_current_user_id),
+) -> ModelResponse:
     """An endpoint for getting all leagues owned by the current user.
 
     Args:
         service (ILeagueService, optional): The injected service dependency.
-        credentials (HTTPAuthorizationCredentials, optional): The credentials.
+        user_id (int, optional): The ID of the authenticated user.
 
     Returns:
-        Iterable: The league attributes collection.
+        ModelResponse: The league attributes collection.
     """
 
-    token = credentials.credentials
-    token_payload = jwt.decode(
-        token,
-        key=consts.SECRET_KEY,
-        algorithms=[consts.ALGORITHM],
-    )
-    user_id = int(token_payload.get("sub"))
-
-    if not user_id:
-        raise HTTPException(status_code=403, detail="Unauthorized")
-
     leagues = await service.get_my_leagues(user_id)
 
-    return leagues
+    return ModelResponse(leagues, status_code=200)
 
 
-@router.get("/archived", response_model=Iterable[LeagueDTO], status_code=200)
+@router.get("/archived", response_model=PageDTO[LeagueDTO], status_code=200)
 @inject
 async def get_archived_leagues(
+    limit: int = Query(consts.DEFAULT_PAGE_SIZE, ge=1, le=consts.MAX_PAGE_SIZE),
+    after: str | None = None,
     service: ILeagueService = Depends(Provide[Container.league_service]),
-) -> Iterable:
-    """An endpoint for getting all archived leagues.
+) -> ModelResponse:
+    """An endpoint for getting a page of archived leagues.
 
     Args:
+        limit (int, optional): The maximum number of leagues on the page.
+        after (str | None, optional): The cursor of the previous page.
         service (ILeagueService, optional): The injected service dependency.
 
+    Raises:
+        HTTPException: 400 if the cursor is malformed.
+
     Returns:
-        Iterable: The archived league attributes collection.
+        ModelResponse: The page of archived league attributes.
     """
 
-    leagues = await service.get_archived_leagues()
+    try:
+        page = await service.get_archived_leagues(limit, after)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
 
-    return leagues
+    return ModelResponse(
+        page,
+        status_code=200,
+        headers={"Cache-Control": consts.ARCHIVED_LIST_CACHE_CONTROL},
+    )
 
 
 @router.get(
@@ -150,7 +273,7 @@ async def get_archived_leagues(
 async def get_league_by_id(
     league_id: int,
     service: ILeagueService = Depends(Provide[Container.league_service]),
-) -> dict | None:
+) -> ModelResponse:
     """An endpoint for getting league by ID.
 
     Args:
@@ -161,11 +284,15 @@ async def get_league_by_id(
         HTTPException: 404 if league does not exist.
 
     Returns:
-        dict | None: The league details.
+        ModelResponse: The league details.
     """
 
     if league := await service.get_by_id(league_id):
-        return league.model_dump()
+        return ModelResponse(
+            league,
+            status_code=200,
+            headers=_archived_headers(league),
+        )
 
     raise HTTPException(status_code=404, detail="League not found")
 
@@ -179,22 +306,25 @@ async def get_league_by_id(
 async def archive_league(
     league_id: int,
     service: ILeagueService = Depends(Provide[Container.league_service]),
-) -> dict:
+    user_id: int = Depends(get_current_user_id),
+) -> ModelResponse:
     """An endpoint for archiving a league.
 
     Args:
         league_id (int): The ID of the league.
         service (ILeagueService, optional): The injected service dependency.
+        user_id (int, optional): The ID of the authenticated user.
 
     Raises:
         HTTPException: 404 if league does not exist.
+        HTTPException: 403 if user is not the league owner.
 
     Returns:
-        dict: The updated league details.
+        ModelResponse: The updated league details.
     """
 
-    if updated_league := await service.archive_league(league_id):
-        return updated_league.model_dump()
+    if updated_league := await service.archive_league(league_id, user_id):
+        return ModelResponse(updated_league, status_code=201)
 
     raise HTTPException(status_code=404, detail="League not found")
 
@@ -205,37 +335,27 @@ async def update_league(
     league_id: int,
     league_update: LeagueUpdate,
     service: ILeagueService = Depends(Provide[Container.league_service]),
-    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
-) -> dict:
+    user_id: int = Depends(get_current_user_id),
+) -> ModelResponse:
     """An endpoint for updating a league.
 
     Args:
         league_id (int): The ID of the league.
         league_update (LeagueUpdate): The updated league details.
         service (ILeagueService, optional): The injected service dependency.
-        credentials (HTTPAuthorizationCredentials, optional): The credentials.
+        user_id (int, optional): The ID of the authenticated user.
 
     Raises:
         HTTPException: 404 if league does not exist.
         HTTPException: 403 if user is not the league owner.
+        HTTPException: 400 if the league is archived.
 
     Returns:
-        dict: The updated league details.
+        ModelResponse: The updated league details.
     """
 
-    token = credentials.credentials
-    token_payload = jwt.decode(
-        token,
-        key=consts.SECRET_KEY,
-        algorithms=[consts.ALGORITHM],
-    )
-    user_id = int(token_payload.get("sub"))
-
-    if not user_id:
-        raise HTTPException(status_code=403, detail="Unauthorized")
-
     if updated_league := await service.update_league(league_id, league_update, user_id):
-        return updated_league.model_dump()
+        return ModelResponse(updated_league, status_code=201)
 
     raise HTTPException(status_code=404, detail="League not found")
 
@@ -245,44 +365,280 @@ async def update_league(
 async def delete_league(
     league_id: int,
     service: ILeagueService = Depends(Provide[Container.league_service]),
-    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
+    user_id: int = Depends(get_current_user_id),
 ) -> None:
     """An endpoint for deleting a league.
 
     Args:
         league_id (int): The ID of the league.
         service (ILeagueService, optional): The injected service dependency.
-        credentials (HTTPAuthorizationCredentials, optional): The credentials.
+        user_id (int, optional): The ID of the authenticated user.
 
     Raises:
         HTTPException: 404 if league does not exist.
         HTTPException: 403 if user is not the league owner.
     """
 
-    token = credentials.credentials
-    token_payload = jwt.decode(
-        token,
-        key=consts.SECRET_KEY,
-        algorithms=[consts.ALGORITHM],
-    )
-    user_id = int(token_payload.get("sub"))
-
-    if not user_id:
-        raise HTTPException(status_code=403, detail="Unauthorized")
-
     if await service.get_by_id(league_id):
         await service.delete_league(league_id, user_id)
         return
 
     raise HTTPException(status_code=404, detail="League not found")
 
-@router.get("/{league_id}/standings", status_code=200)
+@router.get(
+        "/{league_id}/standings",
+        response_model=Iterable[Standing],
+        status_code=200,
+)
 @inject
 async def get_standings(
     league_id: int,
     service: ILeagueService = Depends(Provide[Container.league_service]),
-) -> list:
-    
-    standings = await service.get_standings(league_id)
-    
-    return standings
+) -> ModelResponse:
+    """An endpoint for getting the league table.
+
+    Args:
+        league_id (int): The ID of the league.
+        service (ILeagueService, optional): The injected service dependency.
+
+    Raises:
+        HTTPException: 404 if league does not exist.
+
+    Returns:
+        ModelResponse: The ordered standings.
+    """
+
+    # The service reads the league through the same per-request loader,
+    # so the lookup is not repeated when the standings are not cached.
+    if not (league := await service.get_by_id(league_id)):
+        raise HTTPException(status_code=404, detail="League not found")
+
+    return ModelResponse(
+        await service.get_standings(league_id),
+        status_code=200,
+        headers=_archived_headers(league),
+    )
+
+
+@router.get(
+        "/{league_id}/overview",
+        response_model=LeagueOverviewDTO,
+        status_code=200,
+)
+@inject
+async def get_overview(
+    league_id: int,
+    service: ILeagueService = Depends(Provide[Container.league_service]),
+) -> ModelResponse:
+    """An endpoint for getting the league front page data in one payload.
+
+    Args:
+        league_id (int): The ID of the league.
+        service (ILeagueService, optional): The injected service dependency.
+
+    Raises:
+        HTTPException: 404 if league does not exist.
+
+    Returns:
+        ModelResponse: The league with its teams, matches and standings.
+    """
+
+    if overview := await service.get_overview(league_id):
+        return ModelResponse(
+            overview,
+            status_code=200,
+            headers=_archived_headers(overview.league),
+        )
+
+    raise HTTPException(status_code=404, detail="League not found")
+
+
+@router.post(
+        "/{league_id}/generate-schedule",
+        response_model=Iterable[Match],
+        status_code=201,
+)
+@inject
+async def generate_schedule(
+    league_id: int,
+    schedule: ScheduleIn,
+    service: ILeagueService = Depends(Provide[Container.league_service]),
+    user_id: int = Depends(get_current_user_id),
+) -> ModelResponse:
+    """An endpoint for generating a round-robin schedule of the league.
+
+    Args:
+        league_id (int): The ID of the league.
+        schedule (ScheduleIn): The schedule parameters.
+        service (ILeagueService, optional): The injected service dependency.
+        user_id (int, optional): The ID of the authenticated user.
+
+    Raises:
+        HTTPException: 404 if league does not exist.
+        HTTPException: 403 if user is not the league owner.
+        HTTPException: 400 if the league is archived or has too few teams.
+        HTTPException: 409 if the league already has matches.
+
+    Returns:
+        ModelResponse: The created matches.
+    """
+
+    matches = await service.generate_schedule(league_id, user_id, schedule)
+
+    return ModelResponse(matches, status_code=201)
+
+
+@router.post(
+        "/{league_id}/import",
+        response_model=ImportReport,
+        status_code=200,
+)
+@inject
+async def import_league(
+    league_id: int,
+    request: Request,
+    service: IImportService = Depends(Provide[Container.import_service]),
+    user_id: int = Depends(get_current_user_id),
+) -> ModelResponse:
+    """An endpoint for importing teams and matches into a league.
+
+    The body is a CSV file with a header row (`text/csv`), a JSON array
+    (`application/json`) or one JSON object per line
+    (`application/x-ndjson`). Every row has a `kind`: `team` rows give
+    the `name` of a new team, `match` rows the `home_team` and `away_team`
+    names and the `date` of a match. Valid rows are imported and the
+    others reported.
+
+    Args:
+        league_id (int): The ID of the league.
+        request (Request): The incoming HTTP request with the upload.
+        service (IImportService, optional): The injected service dependency.
+        user_id (int, optional): The ID of the authenticated user.
+
+    Raises:
+        HTTPException: 404 if league does not exist.
+        HTTPException: 403 if user is not the league owner.
+        HTTPException: 400 if the league is archived or the upload cannot
+            be parsed.
+        HTTPException: 413 if the upload has too many rows.
+        HTTPException: 415 if the media type is not supported.
+
+    Returns:
+        ModelResponse: The numbers of created teams and matches with the
+            rejected rows.
+    """
+
+    media_type = request.headers.get("content-type", "")
+    report = await service.import_league(
+        league_id,
+        user_id,
+        media_type.split(";")[0].strip().lower(),
+        request.stream(),
+    )
+
+    return ModelResponse(report, status_code=200)
+
+
+@router.post(
+        "/{league_id}/invitations",
+        response_model=Iterable[Invitation],
+        status_code=201,
+)
+@inject
+async def create_invitations(
+    league_id: int,
+    invitations: InvitationsIn,
+    service: IInvitationService = Depends(
+        Provide[Container.invitation_service]
+    ),
+    user_id: int = Depends(get_current_user_id),
+) -> ModelResponse:
+    """An endpoint for inviting teams to a private league.
+
+    Args:
+        league_id (int): The ID of the league.
+        invitations (InvitationsIn): The number and validity of invitations.
+        service (IInvitationService, optional): The injected service
+            dependency.
+        user_id (int, optional): The ID of the authenticated user.
+
+    Raises:
+        HTTPException: 404 if league does not exist.
+        HTTPException: 403 if user is not the league owner.
+        HTTPException: 400 if the league is not an active private league.
+
+    Returns:
+        ModelResponse: The created invitations.
+    """
+
+    created = await service.create_invitations(league_id, user_id, invitations)
+
+    return ModelResponse(created, status_code=201)
+
+
+@router.post(
+        "/accept-invite/{token}",
+        response_model=Team,
+        status_code=201,
+)
+@inject
+async def accept_invitation(
+    token: str,
+    invitation: InvitationAcceptIn,
+    service: IInvitationService = Depends(
+        Provide[Container.invitation_service]
+    ),
+    user_id: int = Depends(get_current_user_id),
+) -> ModelResponse:
+    """An endpoint for joining a private league with an invitation.
+
+    Args:
+        token (str): The token of the invitation.
+        invitation (InvitationAcceptIn): The details of the new team.
+        service (IInvitationService, optional): The injected service
+            dependency.
+        user_id (int, optional): The ID of the authenticated user.
+
+    Raises:
+        HTTPException: 404 if the invitation is invalid, used or expired,
+            or the user already has a team in the league.
+
+    Returns:
+        ModelResponse: The new team.
+    """
+
+    if team := await service.accept_invitation(token, user_id, invitation):
+        return ModelResponse(team, status_code=201)
+
+    raise HTTPException(
+        status_code=404,
+        detail="Invitation is invalid, used or expired",
+    )
+
+
+@router.get("/{league_id}/calendar.ics", response_class=Response)
+@inject
+async def get_league_calendar(
+    league_id: int,
+    request: Request,
+    service: ICalendarService = Depends(Provide[Container.calendar_service]),
+) -> Response:
+    """An endpoint for subscribing to the matches of a league.
+
+    Args:
+        league_id (int): The ID of the league.
+        request (Request): The incoming HTTP request.
+        service (ICalendarService, optional): The injected service
+            dependency.
+
+    Raises:
+        HTTPException: 404 if league does not exist.
+
+    Returns:
+        Response: The iCalendar feed, or 304 if the client has it.
+    """
+
+    if feed := await service.get_league_calendar(league_id):
+        return calendar_response(request, feed)
+
+    raise HTTPException(status_code=404, detail="League not found")
@@ -1,77 +1,146 @@
 """A module containing match endpoints."""
 
+from datetime import datetime
 from typing import Iterable
 
 from dependency_injector.wiring import inject, Provide
-from fastapi import APIRouter, Depends, HTTPException
-from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from jose import jwt
+from fastapi import APIRouter, Depends, HTTPException, Query
 
+from src.api.auth import get_current_user_id
+from src.api.responses import ModelResponse
 from src.container import Container
-from src.core.domain.match import Match, MatchBroker, MatchIn, MatchUpdateIn
+from src.core.domain.match import (
+    Match,
+    MatchBroker,
+    MatchCreateFailure,
+    MatchFilter,
+    MatchIn,
+    MatchUpdateIn,
+)
+from src.infrastructure.dto.pagedto import PageDTO
 from src.infrastructure.services.imatch import IMatchService
 from src.infrastructure.utils import consts
 
-bearer_scheme = HTTPBearer()
-
 router = APIRouter()
 
+CREATE_FAILURE_ERRORS = {
+    MatchCreateFailure.LEAGUE_NOT_FOUND: (
+        404, "League not found or not active",
+    ),
+    MatchCreateFailure.NOT_LEAGUE_OWNER: (
+        403, "Only the league owner can add matches",
+    ),
+    MatchCreateFailure.HOME_TEAM_NOT_IN_LEAGUE: (
+        400, "Home team does not belong to the league",
+    ),
+    MatchCreateFailure.AWAY_TEAM_NOT_IN_LEAGUE: (
+        400, "Away team does not belong to the league",
+    ),
+}
+
 
 @router.post("/create", response_model=Match, status_code=201)
 @inject
 async def create_match(
     match: MatchIn,
     service: IMatchService = Depends(Provide[Container.match_service]),
-    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
-) -> dict:
+    user_id: int = Depends(get_current_user_id),
+) -> ModelResponse:
     """Create a new match in a league.
     
     Args:
         match: Match data (league_id, home_team_id, away_team_id, date)
         service: Injected match service
-        credentials: JWT token for authentication
+        user_id: The ID of the authenticated user
         
     Returns:
         Created match data
     """
     
-    token = credentials.credentials
-    token_payload = jwt.decode(
-        token,
-        key=consts.SECRET_KEY,
-        algorithms=[consts.ALGORITHM],
-    )
-    user_id = int(token_payload.get("sub"))
-    
-    if not user_id:
-        raise HTTPException(status_code=403, detail="Unauthorized")
-    
     match_broker = MatchBroker(
         submitted_by=user_id,
         **match.model_dump(),
     )
     new_match = await service.create_match(match_broker)
 
-    if not new_match:
-        raise HTTPException(
-            status_code=400,
-            detail="Could not create match. League may not exist, may be inactive, or teams may not belong to the league."
-        )
+    if isinstance(new_match, MatchCreateFailure):
+        status_code, detail = CREATE_FAILURE_ERRORS[new_match]
+        raise HTTPException(status_code=status_code, detail=detail)
 
-    return new_match.model_dump()
+    return ModelResponse(new_match, status_code=201)
 
 
-@router.get("/all", response_model=Iterable[Match], status_code=200)
+@router.get("", response_model=PageDTO[Match], status_code=200)
+@inject
+async def list_matches(
+    date_from: datetime | None = Query(None, alias="from"),
+    date_to: datetime | None = Query(None, alias="to"),
+    league_id: int | None = None,
+    team_id: int | None = None,
+    ids: list[int] | None = Query(None, max_length=consts.MAX_PAGE_SIZE),
+    limit: int = Query(consts.DEFAULT_PAGE_SIZE, ge=1, le=consts.MAX_PAGE_SIZE),
+    after: str | None = None,
+    service: IMatchService = Depends(Provide[Container.match_service]),
+) -> ModelResponse:
+    """Get a page of matches matching optional filters, ordered by date.
+
+    Args:
+        date_from: The earliest time of the matches, inclusive.
+        date_to: The latest time of the matches, exclusive.
+        league_id: The ID of the league.
+        team_id: The ID of the home or away team.
+        ids: The IDs of the matches.
+        limit: The maximum number of matches on the page.
+        after: The cursor of the previous page.
+
+    Raises:
+        HTTPException: 400 if the range is empty or the cursor is malformed.
+
+    Returns:
+        The page of matches.
+    """
+    filters = MatchFilter(
+        date_from=date_from,
+        date_to=date_to,
+        league_id=league_id,
+        team_id=team_id,
+        ids=ids,
+    )
+
+    if filters.date_from and filters.date_to and \
+            filters.date_from >= filters.date_to:
+        raise HTTPException(status_code=400, detail="Invalid date range")
+
+    try:
+        page = await service.get_filtered(filters, limit, after)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    return ModelResponse(page, status_code=200)
+
+
+@router.get("/all", response_model=PageDTO[Match], status_code=200)
 @inject
 async def get_all_matches(
+    limit: int = Query(consts.DEFAULT_PAGE_SIZE, ge=1, le=consts.MAX_PAGE_SIZE),
+    after: str | None = None,
     service: IMatchService = Depends(Provide[Container.match_service]),
-) -> Iterable:
-    """Get all matches.
+) -> ModelResponse:
+    """Get a page of all matches.
+
+    Args:
+        limit: The maximum number of matches on the page.
+        after: The cursor of the previous page.
 
     Returns:
-        All matches collection.
+        The page of matches.
     """
-    return await service.get_all_matches()
+    try:
+        page = await service.get_all_matches(limit, after)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    return ModelResponse(page, status_code=200)
 
 
 @router.get("/league/{league_id}", response_model=Iterable[Match], status_code=200)
@@ -79,7 +148,7 @@ async def get_all_matches(
 async def get_matches_by_league(
     league_id: int,
     service: IMatchService = Depends(Provide[Container.match_service]),
-) -> Iterable:
+) -> ModelResponse:
     """Get all matches in a league.
 
     Args:
@@ -88,46 +157,59 @@ async def get_matches_by_league(
     Returns:
         Matches in the league.
     """
-    return await service.get_matches_by_league(league_id)
+    matches = await service.get_matches_by_league(league_id)
+    return ModelResponse(matches, status_code=200)
 
 
-@router.get("/team/{team_id}", response_model=Iterable[Match], status_code=200)
+@router.get("/team/{team_id}", response_model=PageDTO[Match], status_code=200)
 @inject
 async def get_matches_by_team(
     team_id: int,
+    limit: int = Query(consts.DEFAULT_PAGE_SIZE, ge=1, le=consts.MAX_PAGE_SIZE),
+    after: str | None = None,
     service: IMatchService = Depends(Provide[Container.match_service]),
-) -> Iterable:
-    """Get all matches for a team.
+) -> ModelResponse:
+    """Get a page of matches for a team.
 
     Args:
         team_id: The ID of the team.
+        limit: The maximum number of matches on the page.
+        after: The cursor of the previous page.
 
     Returns:
-        Matches for the team.
+        The page of matches for the team.
     """
-    return await service.get_matches_by_team(team_id)
+    try:
+        page = await service.get_matches_by_team(team_id, limit, after)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    return ModelResponse(page, status_code=200)
 
 
 @router.get("/{match_id}", response_model=Match, status_code=200)
 @inject
 async def get_match_by_id(
     match_id: int,
+    league_id: int | None = None,
     service: IMatchService = Depends(Provide[Container.match_service]),
-) -> dict:
+) -> ModelResponse:
     """Get match by ID.
 
     Args:
         match_id: The ID of the match.
+        league_id: The ID of the league of the match, which saves looking
+            the league up.
 
     Returns:
         Match details.
     """
-    match = await service.get_match_by_id(match_id)
+    match = await service.get_match_by_id(match_id, league_id)
     
     if not match:
         raise HTTPException(status_code=404, detail="Match not found")
     
-    return match.model_dump()
+    return ModelResponse(match, status_code=200)
 
 
 @router.put("/{match_id}", response_model=Match, status_code=200)
@@ -135,59 +217,47 @@ async def get_match_by_id(
 async def update_match(
     match_id: int,
     match_update: MatchUpdateIn,
+    league_id: int | None = None,
     service: IMatchService = Depends(Provide[Container.match_service]),
-    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
-) -> dict:
+    user_id: int = Depends(get_current_user_id),
+) -> ModelResponse:
     """Update match score and/or date.
 
     Args:
         match_id: The ID of the match.
         match_update: The updated match data.
+        league_id: The ID of the league of the match, which saves looking
+            the league up.
 
     Returns:
         Updated match details.
     """
-    token = credentials.credentials
-    token_payload = jwt.decode(
-        token,
-        key=consts.SECRET_KEY,
-        algorithms=[consts.ALGORITHM],
+    updated_match = await service.update_match(
+        match_id,
+        match_update,
+        league_id,
     )
-    user_id = int(token_payload.get("sub"))
-    
-    if not user_id:
-        raise HTTPException(status_code=403, detail="Unauthorized")
-
-    updated_match = await service.update_match(match_id, match_update)
     
     if not updated_match:
         raise HTTPException(status_code=404, detail="Match not found")
     
-    return updated_match.model_dump()
+    return ModelResponse(updated_match, status_code=200)
 
 
 @router.delete("/{match_id}", status_code=204)
 @inject
 async def delete_match(
     match_id: int,
+    league_id: int | None = None,
     service: IMatchService = Depends(Provide[Container.match_service]),
-    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
+    user_id: int = Depends(get_current_user_id),
 ) -> None:
     """Delete a match.
 
     Args:
         match_id: The ID of the match.
+        league_id: The ID of the league of the match, which saves looking
+            the league up.
     """
-    token = credentials.credentials
-    token_payload = jwt.decode(
-        token,
-        key=consts.SECRET_KEY,
-        algorithms=[consts.ALGORITHM],
-    )
-    user_id = int(token_payload.get("sub"))
-    
-    if not user_id:
-        raise HTTPException(status_code=403, detail="Unauthorized")
-
-    if not await service.delete_match(match_id):
+    if not await service.delete_match(match_id, league_id):
         raise HTTPException(status_code=404, detail="Match not found")
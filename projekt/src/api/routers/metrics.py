@@ -0,0 +1,123 @@
+"""A module containing runtime metrics endpoints."""
+
+from typing import Iterable
+
+from dependency_injector.wiring import inject, Provide
+from fastapi import APIRouter, Depends, HTTPException
+
+from src.container import Container
+from src.db import match_partitions, pool_stats
+from src.infrastructure.dto.metricsdto import (
+    CacheStatsDTO,
+    PartitionStatsDTO,
+    PasswordStatsDTO,
+    PoolStatsDTO,
+    StatementStatsDTO,
+)
+from src.infrastructure.utils.cache import LRUCache
+from src.infrastructure.utils.password import PasswordHasher
+from src.infrastructure.utils.statements import statements
+
+router = APIRouter()
+
+
+@router.get("/pool", response_model=PoolStatsDTO, status_code=200)
+async def get_pool_stats() -> dict:
+    """An endpoint for getting the DB connection pool statistics.
+
+    Raises:
+        HTTPException: 503 if the DB is not connected.
+
+    Returns:
+        dict: The pool statistics.
+    """
+
+    if stats := pool_stats():
+        return stats
+
+    raise HTTPException(status_code=503, detail="Database is not connected")
+
+
+@router.get(
+        "/standings-cache",
+        response_model=CacheStatsDTO,
+        status_code=200,
+)
+@inject
+async def get_standings_cache_stats(
+    cache: LRUCache = Depends(Provide[Container.standings_cache]),
+) -> dict:
+    """An endpoint for getting the standings cache statistics.
+
+    Args:
+        cache (LRUCache, optional): The injected standings cache.
+
+    Returns:
+        dict: The cache statistics.
+    """
+
+    return cache.stats()
+
+
+@router.get("/token-cache", response_model=CacheStatsDTO, status_code=200)
+@inject
+async def get_token_cache_stats(
+    cache: LRUCache = Depends(Provide[Container.token_cache]),
+) -> dict:
+    """An endpoint for getting the verified token cache statistics.
+
+    Args:
+        cache (LRUCache, optional): The injected token cache.
+
+    Returns:
+        dict: The cache statistics.
+    """
+
+    return cache.stats()
+
+
+@router.get("/passwords", response_model=PasswordStatsDTO, status_code=200)
+@inject
+async def get_password_stats(
+    hasher: PasswordHasher = Depends(Provide[Container.password_hasher]),
+) -> dict:
+    """An endpoint for getting the password hashing pool statistics.
+
+    Args:
+        hasher (PasswordHasher, optional): The injected password hasher.
+
+    Returns:
+        dict: The queue state and hashing timings.
+    """
+
+    return hasher.stats()
+
+
+@router.get(
+        "/statements",
+        response_model=Iterable[StatementStatsDTO],
+        status_code=200,
+)
+async def get_statement_stats() -> Iterable:
+    """An endpoint for getting the prepared statement statistics.
+
+    Returns:
+        Iterable: The call counts and timings, slowest in total first.
+    """
+
+    return statements.stats()
+
+
+@router.get(
+        "/partitions",
+        response_model=Iterable[PartitionStatsDTO],
+        status_code=200,
+)
+async def get_partition_stats() -> Iterable:
+    """An endpoint for getting the partitions of the matches table.
+
+    Returns:
+        Iterable: The bound, estimated rows and size of every partition.
+    """
+
+    return await match_partitions()
@@ -1,17 +1,17 @@
 from typing import Iterable
 
 from dependency_injector.wiring import inject, Provide
-from fastapi import APIRouter, Depends, HTTPException
-from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from jose import jwt
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 
+from src.api.auth import get_current_user_id
+from src.api.responses import ModelResponse, calendar_response
 from src.container import Container
 from src.core.domain.team import Team, TeamBroker, TeamIn
+from src.infrastructure.dto.pagedto import PageDTO
+from src.infrastructure.services.icalendar import ICalendarService
 from src.infrastructure.services.iteam import ITeamService
 from src.infrastructure.utils import consts
 
-bearer_scheme = HTTPBearer()
-
 router = APIRouter()
 
 
@@ -20,21 +20,10 @@ router = APIRouter()
 async def create_team(
     team: TeamIn,
     service: ITeamService = Depends(Provide[Container.team_service]),
-    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
-) -> dict:
+    user_id: int = Depends(get_current_user_id),
+) -> ModelResponse:
     """Create a new team in a league."""
     
-    token = credentials.credentials
-    token_payload = jwt.decode(
-        token,
-        key=consts.SECRET_KEY,
-        algorithms=[consts.ALGORITHM],
-    )
-    user_id = int(token_payload.get("sub"))
-    
-    if not user_id:
-        raise HTTPException(status_code=403, detail="Unauthorized")
-    
     extended_team_data = TeamBroker(
         captain_id=user_id,
         **team.model_dump(),
@@ -47,15 +36,33 @@ async def create_team(
             detail="Could not create team. League may not exist, may be inactive, may be private, or you may already have a team in this league."
         )
 
-    return new_team.model_dump()
+    return ModelResponse(new_team, status_code=201)
+
+@router.get("", response_model=Iterable[Team], status_code=200)
+@inject
+async def get_teams_by_ids(
+    ids: list[int] = Query(min_length=1, max_length=consts.MAX_PAGE_SIZE),
+    service: ITeamService = Depends(Provide[Container.team_service]),
+) -> ModelResponse:
+    """Get many teams by IDs, in the order of the IDs."""
+    teams = await service.get_teams_by_ids(ids)
+    return ModelResponse(teams, status_code=200)
+
 
-@router.get("/all", response_model=Iterable[Team], status_code=200)
+@router.get("/all", response_model=PageDTO[Team], status_code=200)
 @inject
 async def get_all_teams(
+    limit: int = Query(consts.DEFAULT_PAGE_SIZE, ge=1, le=consts.MAX_PAGE_SIZE),
+    after: str | None = None,
     service: ITeamService = Depends(Provide[Container.team_service]),
-) -> Iterable:
-    """Get all teams."""
-    return await service.get_all_teams()
+) -> ModelResponse:
+    """Get a page of all teams."""
+    try:
+        page = await service.get_all_teams(limit, after)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    return ModelResponse(page, status_code=200)
 
 
 @router.get("/league/{league_id}", response_model=Iterable[Team], status_code=200)
@@ -63,9 +70,10 @@ async def get_all_teams(
 async def get_teams_by_league(
     league_id: int,
     service: ITeamService = Depends(Provide[Container.team_service]),
-) -> Iterable:
+) -> ModelResponse:
     """Get all teams in a league."""
-    return await service.get_teams_by_league(league_id)
+    teams = await service.get_teams_by_league(league_id)
+    return ModelResponse(teams, status_code=200)
 
 
 @router.get("/{team_id}", response_model=Team, status_code=200)
@@ -73,14 +81,28 @@ async def get_teams_by_league(
 async def get_team_by_id(
     team_id: int,
     service: ITeamService = Depends(Provide[Container.team_service]),
-) -> dict:
+) -> ModelResponse:
     """Get team by ID."""
     team = await service.get_team_by_id(team_id)
     
     if not team:
         raise HTTPException(status_code=404, detail="Team not found")
     
-    return team.model_dump()
+    return ModelResponse(team, status_code=200)
+
+
+@router.get("/{team_id}/calendar.ics", response_class=Response)
+@inject
+async def get_team_calendar(
+    team_id: int,
+    request: Request,
+    service: ICalendarService = Depends(Provide[Container.calendar_service]),
+) -> Response:
+    """Subscribe to the matches of a team as an iCalendar feed."""
+    if feed := await service.get_team_calendar(team_id):
+        return calendar_response(request, feed)
+
+    raise HTTPException(status_code=404, detail="Team not found")
 
 
 @router.put("/{team_id}", response_model=Team, status_code=200)
@@ -89,26 +111,26 @@ async def update_team(
     team_id: int,
     team_update: TeamIn,
     service: ITeamService = Depends(Provide[Container.team_service]),
-    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
-) -> dict:
+    user_id: int = Depends(get_current_user_id),
+) -> ModelResponse:
     """Update team data."""
-    token = credentials.credentials
-    token_payload = jwt.decode(
-        token,
-        key=consts.SECRET_KEY,
-        algorithms=[consts.ALGORITHM],
-    )
-    user_id = int(token_payload.get("sub"))
-    
-    if not user_id:
-        raise HTTPException(status_code=403, detail="Unauthorized")
+    team = await service.get_team_by_id(team_id)
+
+    if not team:
+        raise HTTPException(status_code=404, detail="Team not found")
+
+    if team.league_id != team_update.league_id:
+        raise HTTPException(
+            status_code=400,
+            detail="Teams cannot be moved to another league",
+        )
 
     updated_team = await service.update_team(team_id, team_update)
     
     if not updated_team:
         raise HTTPException(status_code=404, detail="Team not found")
     
-    return updated_team.model_dump()
+    return ModelResponse(updated_team, status_code=200)
 
 
 @router.delete("/{team_id}", status_code=204)
@@ -116,19 +138,8 @@ async def update_team(
 async def delete_team(
     team_id: int,
     service: ITeamService = Depends(Provide[Container.team_service]),
-    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
+    user_id: int = Depends(get_current_user_id),
 ) -> None:
     """Delete a team."""
-    token = credentials.credentials
-    token_payload = jwt.decode(
-        token,
-        key=consts.SECRET_KEY,
-        algorithms=[consts.ALGORITHM],
-    )
-    user_id = int(token_payload.get("sub"))
-    
-    if not user_id:
-        raise HTTPException(status_code=403, detail="Unauthorized")
-
     if not await service.delete_team(team_id):
         raise HTTPException(status_code=404, detail="Team not found")
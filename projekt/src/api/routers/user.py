@@ -8,6 +8,7 @@ from src.core.domain.user import UserIn
 from src.infrastructure.dto.tokendto import TokenDTO
 from src.infrastructure.dto.userdto import UserDTO
 from src.infrastructure.services.iuser import IUserService
+from src.infrastructure.utils.password import PasswordQueueFullError
 
 router = APIRouter()
 
@@ -24,11 +25,23 @@ async def register_user(
         user (UserIn): The user input data.
         service (IUserService, optional): The injected user service.
 
+    Raises:
+        HTTPException: 503 if too many passwords are being hashed.
+
     Returns:
         dict: The user DTO details.
     """
 
-    if new_user := await service.register_user(user):
+    try:
+        new_user = await service.register_user(user)
+    except PasswordQueueFullError:
+        raise HTTPException(
+            status_code=503,
+            detail="Too many pending requests, try again later",
+            headers={"Retry-After": "1"},
+        )
+
+    if new_user:
         return UserDTO(**dict(new_user)).model_dump()
 
     raise HTTPException(
@@ -49,11 +62,23 @@ async def authenticate_user(
         user (UserIn): The user input data.
         service (IUserService, optional): The injected user service.
 
+    Raises:
+        HTTPException: 503 if too many passwords are being verified.
+
     Returns:
         dict: The token DTO details.
     """
 
-    if token_details := await service.authenticate_user(user):
+    try:
+        token_details = await service.authenticate_user(user)
+    except PasswordQueueFullError:
+        raise HTTPException(
+            status_code=503,
+            detail="Too many pending requests, try again later",
+            headers={"Retry-After": "1"},
+        )
+
+    if token_details:
         print("user confirmed")
         return token_details.model_dump()
 
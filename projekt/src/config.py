@@ -15,6 +15,20 @@ class AppConfig(BaseConfig):
     DB_NAME: Optional[str] = None
     DB_USER: Optional[str] = None
     DB_PASSWORD: Optional[str] = None
+    DB_POOL_MIN_SIZE: int = 5
+    DB_POOL_MAX_SIZE: int = 20
+    DB_POOL_ACQUIRE_TIMEOUT: float = 10.0
+    DB_POOL_PRE_PING: bool = False
+    DB_POOL_PING_IDLE: float = 30.0
+    DB_STATEMENT_CACHE_SIZE: int = 256
+    STANDINGS_CACHE_SIZE: int = 1024
+    PASSWORD_WORKERS: int = 2
+    PASSWORD_MAX_PENDING: int = 64
+    TOKEN_CACHE_SIZE: int = 4096
+    VALIDATE_RECORDS: bool = False
+    INVITATION_PURGE_INTERVAL: float = 3600.0
+    MATCH_PARTITIONS: int = 8
+    CALENDAR_CACHE_SIZE: int = 1024
 
 
 config = AppConfig()
@@ -3,32 +3,87 @@
 from dependency_injector.containers import DeclarativeContainer
 from dependency_injector.providers import Factory, Singleton
 
+from src.config import config
+from src.infrastructure.repositories.importdb import ImportRepository
+from src.infrastructure.repositories.invitationdb import InvitationRepository
 from src.infrastructure.repositories.user import UserRepository
 from src.infrastructure.repositories.leaguedb import LeagueRepository
 from src.infrastructure.repositories.teamdb import TeamRepository
 from src.infrastructure.repositories.matchdb import MatchRepository
+from src.infrastructure.repositories.standingsdb import StandingsRepository
+from src.infrastructure.services.calendar import CalendarService
+from src.infrastructure.services.imports import ImportService
+from src.infrastructure.services.invitation import InvitationService
 from src.infrastructure.services.user import UserService
 from src.infrastructure.services.league import LeagueService
 from src.infrastructure.services.team import TeamService
 from src.infrastructure.services.match import MatchService
+from src.infrastructure.utils.cache import LRUCache
+from src.infrastructure.utils.password import PasswordHasher
 
 
 class Container(DeclarativeContainer):
     """Container class for dependency injecting purposes."""
-    user_repository = Singleton(UserRepository)
+    standings_cache = Singleton(
+        LRUCache,
+        max_size=config.STANDINGS_CACHE_SIZE,
+    )
+
+    calendar_cache = Singleton(
+        LRUCache,
+        max_size=config.CALENDAR_CACHE_SIZE,
+    )
+
+    token_cache = Singleton(
+        LRUCache,
+        max_size=config.TOKEN_CACHE_SIZE,
+    )
+
+    password_hasher = Singleton(
+        PasswordHasher,
+        workers=config.PASSWORD_WORKERS,
+        max_pending=config.PASSWORD_MAX_PENDING,
+    )
+
+    user_repository = Singleton(
+        UserRepository,
+        password_hasher=password_hasher,
+    )
     league_repository = Singleton(LeagueRepository)
-    team_repository = Singleton(TeamRepository)
-    match_repository = Singleton(MatchRepository)
+    team_repository = Singleton(
+        TeamRepository,
+        standings_cache=standings_cache,
+        calendar_cache=calendar_cache,
+    )
+    match_repository = Singleton(
+        MatchRepository,
+        standings_cache=standings_cache,
+        calendar_cache=calendar_cache,
+    )
+    standings_repository = Singleton(StandingsRepository)
+    invitation_repository = Singleton(
+        InvitationRepository,
+        standings_cache=standings_cache,
+    )
+    import_repository = Singleton(
+        ImportRepository,
+        standings_cache=standings_cache,
+        calendar_cache=calendar_cache,
+    )
 
     user_service = Factory(
         UserService,
         repository=user_repository,
+        password_hasher=password_hasher,
     )
     league_service = Factory(
         LeagueService,
         repository=league_repository,
         match_repository=match_repository,
         team_repository=team_repository,
+        standings_repository=standings_repository,
+        standings_cache=standings_cache,
+        calendar_cache=calendar_cache,
     )
     team_service = Factory(
         TeamService,
@@ -38,3 +93,20 @@ class Container(DeclarativeContainer):
         MatchService,
         repository=match_repository,
     )
+    invitation_service = Factory(
+        InvitationService,
+        repository=invitation_repository,
+        league_repository=league_repository,
+    )
+    calendar_service = Factory(
+        CalendarService,
+        match_repository=match_repository,
+        league_repository=league_repository,
+        team_repository=team_repository,
+        calendar_cache=calendar_cache,
+    )
+    import_service = Factory(
+        ImportService,
+        repository=import_repository,
+        league_repository=league_repository,
+    )
@@ -0,0 +1,62 @@
+"""A model containing league import-related models."""
+
+from enum import Enum
+
+from pydantic import BaseModel, model_validator
+
+from src.core.domain.match import MatchTime
+
+
+class ImportKind(str, Enum):
+    TEAM = "team"
+    MATCH = "match"
+
+
+class ImportRow(BaseModel):
+    """An input model of one row of a league import.
+
+    Team rows need the `name` of the team. Match rows need the names of
+    the home and away teams, which are either in the league or imported
+    with the same upload, and the `date` of the match.
+    """
+    kind: ImportKind
+    name: str | None = None
+    home_team: str | None = None
+    away_team: str | None = None
+    date: MatchTime | None = None
+
+    @model_validator(mode="after")
+    def check_kind(self) -> "ImportRow":
+        """A validator checking the fields required by the kind of row.
+
+        Raises:
+            ValueError: If a required field is missing.
+
+        Returns:
+            ImportRow: The validated row.
+        """
+        if self.kind == ImportKind.TEAM:
+            if not self.name:
+                raise ValueError("Team rows require a name")
+            return self
+
+        if not self.home_team or not self.away_team or not self.date:
+            raise ValueError("Match rows require home_team, away_team and date")
+
+        if self.home_team == self.away_team:
+            raise ValueError("A team cannot play against itself")
+
+        return self
+
+
+class ImportRowError(BaseModel):
+    """A model of the problems of a rejected import row."""
+    row: int
+    errors: list[str]
+
+
+class ImportReport(BaseModel):
+    """A model of the result of a league import."""
+    teams_created: int = 0
+    matches_created: int = 0
+    errors: list[ImportRowError] = []
@@ -0,0 +1,27 @@
+"""A model containing invitation-related models."""
+
+from datetime import datetime
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class InvitationsIn(BaseModel):
+    """An input model for generating invitations to a league."""
+    count: int = Field(default=1, ge=1, le=100)
+    valid_hours: int = Field(default=72, ge=1, le=720)
+
+
+class InvitationAcceptIn(BaseModel):
+    """An input model for joining a league with an invitation."""
+    team_name: str
+
+
+class Invitation(BaseModel):
+    """The invitation model class."""
+    id: int
+    league_id: int
+    token: str
+    expires_at: datetime
+    used_by: int | None = None
+
+    model_config = ConfigDict(from_attributes=True, extra="ignore")
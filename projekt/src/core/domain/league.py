@@ -1,6 +1,7 @@
 """A model containing league-related models."""
 
-from pydantic import BaseModel, ConfigDict, UUID1
+from pydantic import BaseModel, ConfigDict, Field, UUID1
+from datetime import date
 from enum import Enum
 
 
@@ -45,3 +46,19 @@ class LeagueUpdate(BaseModel):
     sport_type: SportType | None = None
     is_private: bool | None = None
 
+
+class LeagueFilter(BaseModel):
+    """A model of the optional league listing filters."""
+    city: str | None = None
+    sport_type: SportType | None = None
+    status: LeagueStatus | None = None
+    owner_id: int | None = None
+    is_private: bool | None = None
+    ids: list[int] | None = None
+
+
+class ScheduleIn(BaseModel):
+    """An input model for generating a league schedule."""
+    start_date: date
+    days_between_rounds: int = Field(default=7, ge=1)
+    double_round_robin: bool = False
@@ -1,8 +1,27 @@
 """A model containing match-related models."""
 
-from pydantic import BaseModel, ConfigDict
-from datetime import datetime
+from pydantic import AfterValidator, BaseModel, ConfigDict
+from datetime import datetime, timezone
 from enum import Enum
+from typing import Annotated
+
+
+def as_utc(value: datetime) -> datetime:
+    """A function reading naive match times as UTC.
+
+    Args:
+        value (datetime): The parsed time.
+
+    Returns:
+        datetime: The timezone-aware time.
+    """
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+
+    return value
+
+
+MatchTime = Annotated[datetime, AfterValidator(as_utc)]
 
 
 class MatchStatus(str, Enum):
@@ -11,19 +30,42 @@ class MatchStatus(str, Enum):
     FINISHED = "finished"
 
 
+class MatchCreateFailure(str, Enum):
+    """Reasons for which a match could not be created."""
+    LEAGUE_NOT_FOUND = "league_not_found"
+    NOT_LEAGUE_OWNER = "not_league_owner"
+    HOME_TEAM_NOT_IN_LEAGUE = "home_team_not_in_league"
+    AWAY_TEAM_NOT_IN_LEAGUE = "away_team_not_in_league"
+
+
+class ScheduleFailure(str, Enum):
+    """Reasons for which a schedule could not be created."""
+    LEAGUE_NOT_ACTIVE = "league_not_active"
+    LEAGUE_HAS_MATCHES = "league_has_matches"
+
+
 class MatchIn(BaseModel):
     """An input match model."""
     league_id: int
     home_team_id: int
     away_team_id: int
-    date: str
+    date: MatchTime
 
 
 class MatchUpdateIn(BaseModel):
     """Model for updating match score and date."""
     home_score: int | None = None
     away_score: int | None = None
-    date: str | None = None
+    date: MatchTime | None = None
+
+
+class MatchFilter(BaseModel):
+    """A model of the optional match listing filters."""
+    date_from: MatchTime | None = None
+    date_to: MatchTime | None = None
+    league_id: int | None = None
+    team_id: int | None = None
+    ids: list[int] | None = None
 
 
 class MatchBroker(MatchIn):
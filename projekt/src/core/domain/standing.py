@@ -0,0 +1,19 @@
+"""A model containing standings-related models."""
+
+from pydantic import BaseModel, ConfigDict
+
+
+class Standing(BaseModel):
+    """The model of a team's row in the league table."""
+    team_id: int
+    team_name: str
+    played: int = 0
+    won: int = 0
+    drawn: int = 0
+    lost: int = 0
+    goals_for: int = 0
+    goals_against: int = 0
+    goal_difference: int = 0
+    points: int = 0
+
+    model_config = ConfigDict(from_attributes=True, extra="ignore")
@@ -0,0 +1,29 @@
+"""A repository for league imports."""
+
+from abc import ABC, abstractmethod
+
+from src.core.domain.imports import ImportReport, ImportRow
+
+
+class IImportRepository(ABC):
+    """An abstract repository class for league imports."""
+
+    @abstractmethod
+    async def import_rows(
+        self,
+        league_id: int,
+        captain_id: int,
+        rows: list[tuple[int, ImportRow]],
+    ) -> ImportReport | None:
+        """Add the teams and matches of validated import rows to a league.
+
+        Args:
+            league_id (int): The ID of the league.
+            captain_id (int): The ID of the user captaining the new teams.
+            rows (list[tuple[int, ImportRow]]): The rows with their
+                positions in the upload.
+
+        Returns:
+            ImportReport | None: The numbers of created teams and matches
+                with the rejected rows, None if the league is not active.
+        """
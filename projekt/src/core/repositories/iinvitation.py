@@ -0,0 +1,59 @@
+"""A repository for invitation entity."""
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Iterable
+
+from src.core.domain.invitation import Invitation
+from src.core.domain.team import Team
+
+
+class IInvitationRepository(ABC):
+    """An abstract repository class for invitation."""
+
+    @abstractmethod
+    async def create_invitations(
+        self,
+        league_id: int,
+        tokens: list[str],
+        expires_at: datetime,
+    ) -> Iterable[Invitation]:
+        """Create many invitations to a league at once.
+
+        Args:
+            league_id (int): The ID of the league.
+            tokens (list[str]): The tokens of the invitations.
+            expires_at (datetime): The UTC expiration time.
+
+        Returns:
+            Iterable[Invitation]: The created invitations.
+        """
+
+    @abstractmethod
+    async def redeem(
+        self,
+        token: str,
+        user_id: int,
+        team_name: str,
+    ) -> Team | None:
+        """Use an invitation to join its league with a new team.
+
+        Args:
+            token (str): The token of the invitation.
+            user_id (int): The ID of the user becoming the team captain.
+            team_name (str): The name of the new team.
+
+        Returns:
+            Team | None: The new team if the invitation was valid.
+        """
+
+    @abstractmethod
+    async def purge_expired(self, batch_size: int) -> int:
+        """Delete expired invitations.
+
+        Args:
+            batch_size (int): The maximum number of rows per statement.
+
+        Returns:
+            int: The number of deleted invitations.
+        """
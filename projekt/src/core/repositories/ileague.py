@@ -3,8 +3,15 @@
 from abc import ABC, abstractmethod
 from typing import Iterable, Any
 
-from src.core.domain.league import League, LeagueBroker, LeagueIn
+from src.core.domain.league import (
+    League,
+    LeagueBroker,
+    LeagueFilter,
+    LeagueIn,
+    SportType,
+)
 from src.infrastructure.dto.leaguedto import LeagueDTO
+from src.infrastructure.dto.pagedto import CountedPageDTO, PageDTO
 
 
 class ILeagueRepository(ABC):
@@ -22,11 +29,50 @@ class ILeagueRepository(ABC):
         """
 
     @abstractmethod
-    async def get_all_public(self) -> Iterable[LeagueDTO]:
-        """Get all public leagues.
+    async def get_by_ids(self, league_ids: list[int]) -> Iterable[LeagueDTO]:
+        """Get leagues by their IDs.
+
+        Args:
+            league_ids (list[int]): The IDs of the leagues.
 
         Returns:
-            Iterable[LeagueDTO]: The collection of all public leagues.
+            Iterable[LeagueDTO]: The existing leagues, in no particular order.
+        """
+
+    @abstractmethod
+    async def get_all_public(
+        self,
+        limit: int,
+        after: str | None = None,
+    ) -> PageDTO[LeagueDTO]:
+        """Get a page of public leagues.
+
+        Args:
+            limit (int): The maximum number of leagues on the page.
+            after (str | None): The cursor returned with the previous page.
+
+        Returns:
+            PageDTO[LeagueDTO]: The page of public leagues.
+        """
+
+    @abstractmethod
+    async def get_filtered(
+        self,
+        filters: LeagueFilter,
+        limit: int,
+        after: str | None = None,
+        with_total: bool = False,
+    ) -> CountedPageDTO[LeagueDTO]:
+        """Get a page of leagues matching the filters.
+
+        Args:
+            filters (LeagueFilter): The listing filters.
+            limit (int): The maximum number of leagues on the page.
+            after (str | None): The cursor returned with the previous page.
+            with_total (bool): Whether to count all matching leagues.
+
+        Returns:
+            CountedPageDTO[LeagueDTO]: The page of leagues ordered by ID.
         """
     
     @abstractmethod
@@ -90,11 +136,19 @@ class ILeagueRepository(ABC):
         """
 
     @abstractmethod
-    async def get_all_archived(self) -> Iterable[LeagueDTO]:
-        """Get all archived leagues.
+    async def get_all_archived(
+        self,
+        limit: int,
+        after: str | None = None,
+    ) -> PageDTO[LeagueDTO]:
+        """Get a page of archived leagues.
+
+        Args:
+            limit (int): The maximum number of leagues on the page.
+            after (str | None): The cursor returned with the previous page.
 
         Returns:
-            Iterable[LeagueDTO]: The collection of all archived leagues.
+            PageDTO[LeagueDTO]: The page of archived leagues.
         """
 
     @abstractmethod
@@ -106,4 +160,24 @@ class ILeagueRepository(ABC):
 
         Returns:
             Any: The collection of leagues in the city.
+        """
+
+    @abstractmethod
+    async def search(
+        self,
+        query: str,
+        sport_type: SportType | None,
+        limit: int,
+        after: str | None = None,
+    ) -> PageDTO[LeagueDTO]:
+        """Search active public leagues by name and city.
+
+        Args:
+            query (str): The searched phrase.
+            sport_type (SportType | None): The sport type to filter by.
+            limit (int): The maximum number of leagues on the page.
+            after (str | None): The cursor returned with the previous page.
+
+        Returns:
+            PageDTO[LeagueDTO]: The page of leagues ranked by similarity.
         """
\ No newline at end of file
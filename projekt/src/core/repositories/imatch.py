@@ -3,29 +3,78 @@
 from abc import ABC, abstractmethod
 from typing import Iterable, Any
 
-from src.core.domain.match import Match, MatchBroker, MatchUpdateIn
+from src.core.domain.match import (
+    Match,
+    MatchBroker,
+    MatchCreateFailure,
+    MatchFilter,
+    MatchUpdateIn,
+    ScheduleFailure,
+)
+from src.infrastructure.dto.matchdto import FixtureDTO
+from src.infrastructure.dto.pagedto import PageDTO
 
 
 class IMatchRepository(ABC):
     """An abstract repository class for match."""
 
     @abstractmethod
-    async def get_match_by_id(self, match_id: int) -> Match | None:
-        """Get match by ID.
+    async def get_league_id(self, match_id: int) -> int | None:
+        """Get the league of a match by the match ID.
 
         Args:
             match_id (int): The ID of the match.
 
+        Returns:
+            int | None: The ID of the league if the match exists.
+        """
+
+    @abstractmethod
+    async def get_match_by_id(
+        self,
+        match_id: int,
+        league_id: int,
+    ) -> Match | None:
+        """Get match by ID within its league.
+
+        Args:
+            match_id (int): The ID of the match.
+            league_id (int): The ID of the league of the match.
+
         Returns:
             Match | None: The match object if exists.
         """
 
     @abstractmethod
-    async def get_all_matches(self) -> Iterable[Match]:
-        """Get all matches.
+    async def get_matches_by_ids(
+        self,
+        league_id: int,
+        match_ids: list[int],
+    ) -> Iterable[Match]:
+        """Get matches of a league by their IDs.
+
+        Args:
+            league_id (int): The ID of the league of the matches.
+            match_ids (list[int]): The IDs of the matches.
 
         Returns:
-            Iterable[Match]: The collection of all matches.
+            Iterable[Match]: The existing matches, in no particular order.
+        """
+
+    @abstractmethod
+    async def get_all_matches(
+        self,
+        limit: int,
+        after: str | None = None,
+    ) -> PageDTO[Match]:
+        """Get a page of all matches.
+
+        Args:
+            limit (int): The maximum number of matches on the page.
+            after (str | None): The cursor returned with the previous page.
+
+        Returns:
+            PageDTO[Match]: The page of matches.
         """
 
     @abstractmethod
@@ -40,37 +89,116 @@ class IMatchRepository(ABC):
         """
 
     @abstractmethod
-    async def get_matches_by_team(self, team_id: int) -> Iterable[Match]:
-        """Get all matches for a team (home or away).
+    async def get_matches_by_team(
+        self,
+        team_id: int,
+        limit: int,
+        after: str | None = None,
+    ) -> PageDTO[Match]:
+        """Get a page of matches for a team (home or away).
+
+        Args:
+            team_id (int): The ID of the team.
+            limit (int): The maximum number of matches on the page.
+            after (str | None): The cursor returned with the previous page.
+
+        Returns:
+            PageDTO[Match]: The page of matches for the team.
+        """
+
+    @abstractmethod
+    async def get_fixtures_by_league(
+        self,
+        league_id: int,
+    ) -> Iterable[FixtureDTO]:
+        """Get the matches of a league with the names of their teams.
+
+        Args:
+            league_id (int): The ID of the league.
+
+        Returns:
+            Iterable[FixtureDTO]: The matches ordered by date.
+        """
+
+    @abstractmethod
+    async def get_fixtures_by_team(
+        self,
+        team_id: int,
+    ) -> Iterable[FixtureDTO]:
+        """Get the matches of a team with the names of their teams.
 
         Args:
             team_id (int): The ID of the team.
 
         Returns:
-            Iterable[Match]: The collection of matches for the team.
+            Iterable[FixtureDTO]: The matches ordered by date.
         """
 
     @abstractmethod
-    async def create_match(self, data: MatchBroker) -> Match | None:
+    async def get_filtered(
+        self,
+        filters: MatchFilter,
+        limit: int,
+        after: str | None = None,
+    ) -> PageDTO[Match]:
+        """Get a page of matches matching the filters, ordered by date.
+
+        Args:
+            filters (MatchFilter): The listing filters.
+            limit (int): The maximum number of matches on the page.
+            after (str | None): The cursor returned with the previous page.
+
+        Raises:
+            ValueError: If the cursor is malformed.
+
+        Returns:
+            PageDTO[Match]: The page of matches.
+        """
+
+    @abstractmethod
+    async def create_match(
+        self,
+        data: MatchBroker,
+    ) -> Match | MatchCreateFailure:
         """Create a new match.
 
         Args:
             data (MatchBroker): The match input data.
 
         Returns:
-            Match | None: The created match object.
+            Match | MatchCreateFailure: The created match object or
+                the reason why it could not be created.
+        """
+
+    @abstractmethod
+    async def create_schedule(
+        self,
+        league_id: int,
+        data: Iterable[MatchBroker],
+    ) -> Iterable[Match] | ScheduleFailure:
+        """Create the matches of a generated schedule of a league.
+
+        Args:
+            league_id (int): The ID of the league.
+            data (Iterable[MatchBroker]): The match input data.
+
+        Returns:
+            Iterable[Match] | ScheduleFailure: The created match objects or
+                the reason why they could not be created.
         """
 
     @abstractmethod
     async def update_match(
         self, 
         match_id: int, 
+        league_id: int,
         data: MatchUpdateIn
     ) -> Match | None:
         """Update match score and/or date.
 
         Args:
             match_id (int): The ID of the match.
+            league_id (int): The ID of the league of the match.
             data (MatchUpdateIn): The updated match data.
 
         Returns:
@@ -78,11 +206,12 @@ class IMatchRepository(ABC):
         """
 
     @abstractmethod
-    async def delete_match(self, match_id: int) -> bool:
+    async def delete_match(self, match_id: int, league_id: int) -> bool:
         """Delete a match.
 
         Args:
             match_id (int): The id of the match.
+            league_id (int): The ID of the league of the match.
 
         Returns:
             bool: Success of the operation.
@@ -0,0 +1,53 @@
+"""A repository for standings entity."""
+
+from abc import ABC, abstractmethod
+from typing import Iterable
+
+from src.core.domain.standing import Standing
+
+
+class IStandingsRepository(ABC):
+    """An abstract repository class for standings."""
+
+    @abstractmethod
+    async def get_by_league(self, league_id: int) -> Iterable[Standing] | None:
+        """Get the stored league table.
+
+        Args:
+            league_id (int): The ID of the league.
+
+        Returns:
+            Iterable[Standing] | None: The ordered standings, or None if
+                some team of the league has no stored row yet.
+        """
+
+    @abstractmethod
+    async def calculate_by_league(self, league_id: int) -> Iterable[Standing]:
+        """Calculate the league table from the finished matches.
+
+        Args:
+            league_id (int): The ID of the league.
+
+        Returns:
+            Iterable[Standing]: The ordered standings.
+        """
+
+    @abstractmethod
+    async def get_snapshot(self, league_id: int) -> Iterable[Standing] | None:
+        """Get the final league table frozen when the league was archived.
+
+        Args:
+            league_id (int): The ID of the league.
+
+        Returns:
+            Iterable[Standing] | None: The ordered standings, or None if
+                the league has no snapshot.
+        """
+
+    @abstractmethod
+    async def fill_standings(self, league_id: int) -> None:
+        """Store the calculated rows of the teams which have none yet.
+
+        Args:
+            league_id (int): The ID of the league.
+        """
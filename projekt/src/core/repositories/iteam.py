@@ -5,6 +5,7 @@ from abc import ABC, abstractmethod
 from typing import Iterable, Any
 
 from src.core.domain.team import Team, TeamBroker, TeamIn
+from src.infrastructure.dto.pagedto import PageDTO
 
 class ITeamRepository(ABC):
     """An abstract repository class for team."""
@@ -21,11 +22,30 @@ class ITeamRepository(ABC):
         """
 
     @abstractmethod
-    async def get_all_teams(self) -> Iterable[Team]:
-        """Get all teams.
+    async def get_teams_by_ids(self, team_ids: list[int]) -> Iterable[Team]:
+        """Get teams by their IDs.
+
+        Args:
+            team_ids (list[int]): The IDs of the teams.
+
+        Returns:
+            Iterable[Team]: The existing teams, in no particular order.
+        """
+
+    @abstractmethod
+    async def get_all_teams(
+        self,
+        limit: int,
+        after: str | None = None,
+    ) -> PageDTO[Team]:
+        """Get a page of all teams.
+
+        Args:
+            limit (int): The maximum number of teams on the page.
+            after (str | None): The cursor returned with the previous page.
 
         Returns:
-            Iterable[Team]: The collection of all teams.
+            PageDTO[Team]: The page of teams.
         """
 
     @abstractmethod
@@ -66,7 +86,8 @@ class ITeamRepository(ABC):
             data (TeamIn): The updated team details.
 
         Returns:
-            Team | None: The updated team object.
+            Team | None: The updated team object, or None if the team does
+                not exist in the league of the data.
         """
 
     @abstractmethod
@@ -1,13 +1,17 @@
 """A module providing database access."""
 
 import asyncio
+import re
+import time
+from typing import Any
 
+import asyncpg  # type: ignore
 import databases
 import sqlalchemy
+from databases.backends.postgres import PostgresBackend
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.exc import OperationalError, DatabaseError
-from sqlalchemy.ext.asyncio import create_async_engine
 from sqlalchemy.ext.mutable import MutableList
+from sqlalchemy.schema import CreateIndex, CreateTable
 from asyncpg.exceptions import (    # type: ignore
     CannotConnectNowError,
     ConnectionDoesNotExistError,
@@ -47,14 +51,25 @@ team_table = sqlalchemy.Table(
     ),
 )
 
+# Hot matches are hash-partitioned by league, since every write and every
+# season read is scoped to one league. The partition key has to be a part
+# of the primary key, so the IDs are only unique because they are always
+# generated by the database, which rejects explicit ones. `MATCH_PARTITIONS`
+# only applies when the table is created; changing it later requires
+# copying the rows into a new table.
 match_table = sqlalchemy.Table(
     "matches",
     metadata,
-    sqlalchemy.Column("id", sqlalchemy.Integer, primary_key=True),
+    sqlalchemy.Column(
+        "id",
+        sqlalchemy.Integer,
+        sqlalchemy.Identity(always=True),
+        primary_key=True,
+    ),
     sqlalchemy.Column(
         "league_id",
         sqlalchemy.ForeignKey("leagues.id"),
-        nullable=False,
+        primary_key=True,
     ),
     sqlalchemy.Column(
         "home_team_id",
@@ -68,7 +83,7 @@ match_table = sqlalchemy.Table(
     ),
     sqlalchemy.Column("home_score", sqlalchemy.Integer, nullable=True),
     sqlalchemy.Column("away_score", sqlalchemy.Integer, nullable=True),
-    sqlalchemy.Column("date", sqlalchemy.String),
+    sqlalchemy.Column("date", sqlalchemy.DateTime(timezone=True), nullable=False),
     sqlalchemy.Column("status", sqlalchemy.String, default="scheduled"),
     sqlalchemy.Column(
         "submitted_by",
@@ -76,6 +91,7 @@ match_table = sqlalchemy.Table(
         sqlalchemy.ForeignKey("users.id"),
         nullable=True,
     ),
+    postgresql_partition_by="HASH (league_id)",
 )
 
 invitation_table = sqlalchemy.Table(
@@ -97,6 +113,39 @@ invitation_table = sqlalchemy.Table(
     ),
 )
 
+# Matches of archived leagues, moved out of the hot table on archiving.
+# The columns mirror the matches table, so both share the row mappers.
+archived_match_table = sqlalchemy.Table(
+    "archived_matches",
+    metadata,
+    sqlalchemy.Column("id", sqlalchemy.Integer, primary_key=True),
+    sqlalchemy.Column(
+        "league_id",
+        sqlalchemy.ForeignKey("leagues.id"),
+        nullable=False,
+    ),
+    sqlalchemy.Column(
+        "home_team_id",
+        sqlalchemy.ForeignKey("teams.id"),
+        nullable=False,
+    ),
+    sqlalchemy.Column(
+        "away_team_id",
+        sqlalchemy.ForeignKey("teams.id"),
+        nullable=False,
+    ),
+    sqlalchemy.Column("home_score", sqlalchemy.Integer, nullable=True),
+    sqlalchemy.Column("away_score", sqlalchemy.Integer, nullable=True),
+    sqlalchemy.Column("date", sqlalchemy.DateTime(timezone=True), nullable=False),
+    sqlalchemy.Column("status", sqlalchemy.String),
+    sqlalchemy.Column(
+        "submitted_by",
+        sqlalchemy.Integer,
+        sqlalchemy.ForeignKey("users.id"),
+        nullable=True,
+    ),
+)
+
 user_table = sqlalchemy.Table(
     "users",
     metadata,
@@ -105,26 +154,671 @@ user_table = sqlalchemy.Table(
     sqlalchemy.Column("password", sqlalchemy.String),
 )
 
+standings_table = sqlalchemy.Table(
+    "standings",
+    metadata,
+    sqlalchemy.Column(
+        "team_id",
+        sqlalchemy.ForeignKey("teams.id", ondelete="CASCADE"),
+        primary_key=True,
+    ),
+    sqlalchemy.Column("played", sqlalchemy.Integer, nullable=False, server_default="0"),
+    sqlalchemy.Column("won", sqlalchemy.Integer, nullable=False, server_default="0"),
+    sqlalchemy.Column("drawn", sqlalchemy.Integer, nullable=False, server_default="0"),
+    sqlalchemy.Column("lost", sqlalchemy.Integer, nullable=False, server_default="0"),
+    sqlalchemy.Column("goals_for", sqlalchemy.Integer, nullable=False, server_default="0"),
+    sqlalchemy.Column("goals_against", sqlalchemy.Integer, nullable=False, server_default="0"),
+    sqlalchemy.Column("points", sqlalchemy.Integer, nullable=False, server_default="0"),
+)
+
+# Numbers of league matches per status, kept in step with every write of
+# the matches, so the end of a season is detected without counting them.
+# The expected number of matches is set when the schedule is generated.
+league_counter_table = sqlalchemy.Table(
+    "league_counters",
+    metadata,
+    sqlalchemy.Column(
+        "league_id",
+        sqlalchemy.ForeignKey("leagues.id", ondelete="CASCADE"),
+        primary_key=True,
+    ),
+    sqlalchemy.Column("scheduled", sqlalchemy.Integer, nullable=False, server_default="0"),
+    sqlalchemy.Column("pending", sqlalchemy.Integer, nullable=False, server_default="0"),
+    sqlalchemy.Column("finished", sqlalchemy.Integer, nullable=False, server_default="0"),
+    sqlalchemy.Column("expected", sqlalchemy.Integer),
+)
+
+# Final league tables frozen when leagues are archived.
+standings_snapshot_table = sqlalchemy.Table(
+    "standings_snapshots",
+    metadata,
+    sqlalchemy.Column(
+        "league_id",
+        sqlalchemy.ForeignKey("leagues.id", ondelete="CASCADE"),
+        primary_key=True,
+    ),
+    sqlalchemy.Column("position", sqlalchemy.Integer, primary_key=True),
+    sqlalchemy.Column("team_id", sqlalchemy.Integer, nullable=False),
+    sqlalchemy.Column("team_name", sqlalchemy.String, nullable=False),
+    sqlalchemy.Column("played", sqlalchemy.Integer, nullable=False),
+    sqlalchemy.Column("won", sqlalchemy.Integer, nullable=False),
+    sqlalchemy.Column("drawn", sqlalchemy.Integer, nullable=False),
+    sqlalchemy.Column("lost", sqlalchemy.Integer, nullable=False),
+    sqlalchemy.Column("goals_for", sqlalchemy.Integer, nullable=False),
+    sqlalchemy.Column("goals_against", sqlalchemy.Integer, nullable=False),
+    sqlalchemy.Column("goal_difference", sqlalchemy.Integer, nullable=False),
+    sqlalchemy.Column("points", sqlalchemy.Integer, nullable=False),
+)
+
+# Secondary indexes backing the repository access paths.
+sqlalchemy.Index(
+    "ix_leagues_owner_id_name",
+    league_table.c.owner_id,
+    league_table.c.name,
+)
+sqlalchemy.Index(
+    "ix_leagues_active_id",
+    league_table.c.id,
+    postgresql_where=league_table.c.status == "active",
+)
+sqlalchemy.Index(
+    "ix_leagues_archived_id",
+    league_table.c.id,
+    postgresql_where=league_table.c.status == "archived",
+)
+sqlalchemy.Index(
+    "ix_leagues_city_id",
+    sqlalchemy.func.lower(league_table.c.city),
+    league_table.c.id,
+)
+
+sqlalchemy.Index(
+    "ix_teams_league_id_name",
+    team_table.c.league_id,
+    team_table.c.name,
+)
+sqlalchemy.Index(
+    "ix_teams_league_id_captain_id",
+    team_table.c.league_id,
+    team_table.c.captain_id,
+)
+sqlalchemy.Index("ix_teams_name_id", team_table.c.name, team_table.c.id)
+
+sqlalchemy.Index(
+    "ix_matches_league_id_date",
+    match_table.c.league_id,
+    match_table.c.date,
+)
+sqlalchemy.Index(
+    "ix_matches_home_team_id_date_id",
+    match_table.c.home_team_id,
+    match_table.c.date,
+    match_table.c.id,
+)
+sqlalchemy.Index(
+    "ix_matches_away_team_id_date_id",
+    match_table.c.away_team_id,
+    match_table.c.date,
+    match_table.c.id,
+)
+sqlalchemy.Index("ix_matches_date_id", match_table.c.date, match_table.c.id)
+
+# Archived matches are read through the same paths as the hot ones.
+sqlalchemy.Index(
+    "ix_archived_matches_league_id_date",
+    archived_match_table.c.league_id,
+    archived_match_table.c.date,
+)
+sqlalchemy.Index(
+    "ix_archived_matches_home_team_id_date_id",
+    archived_match_table.c.home_team_id,
+    archived_match_table.c.date,
+    archived_match_table.c.id,
+)
+sqlalchemy.Index(
+    "ix_archived_matches_away_team_id_date_id",
+    archived_match_table.c.away_team_id,
+    archived_match_table.c.date,
+    archived_match_table.c.id,
+)
+sqlalchemy.Index(
+    "ix_archived_matches_date_id",
+    archived_match_table.c.date,
+    archived_match_table.c.id,
+)
+
+# Composite indexes backing the filtered listing of active public leagues.
+sqlalchemy.Index(
+    "ix_leagues_public_city_sport_type_id",
+    sqlalchemy.func.lower(league_table.c.city),
+    league_table.c.sport_type,
+    league_table.c.id,
+    postgresql_where=(
+        (league_table.c.status == "active") &
+        (league_table.c.is_private == sqlalchemy.false())
+    ),
+)
+sqlalchemy.Index(
+    "ix_leagues_public_sport_type_id",
+    league_table.c.sport_type,
+    league_table.c.id,
+    postgresql_where=(
+        (league_table.c.status == "active") &
+        (league_table.c.is_private == sqlalchemy.false())
+    ),
+)
+
+# Trigram indexes backing the search of active public leagues.
+sqlalchemy.Index(
+    "ix_leagues_name_trgm",
+    league_table.c.name,
+    postgresql_using="gin",
+    postgresql_ops={"name": "gin_trgm_ops"},
+    postgresql_where=(
+        (league_table.c.status == "active") &
+        (league_table.c.is_private == sqlalchemy.false())
+    ),
+)
+sqlalchemy.Index(
+    "ix_leagues_city_trgm",
+    league_table.c.city,
+    postgresql_using="gin",
+    postgresql_ops={"city": "gin_trgm_ops"},
+    postgresql_where=(
+        (league_table.c.status == "active") &
+        (league_table.c.is_private == sqlalchemy.false())
+    ),
+)
+
+sqlalchemy.Index("ix_invitations_league_id", invitation_table.c.league_id)
+sqlalchemy.Index("ix_invitations_expires_at", invitation_table.c.expires_at)
+
 db_uri = (
     f"postgresql+asyncpg://{config.DB_USER}:{config.DB_PASSWORD}"
     f"@{config.DB_HOST}/{config.DB_NAME}"
 )
 
-engine = create_async_engine(
-    db_uri,
-    echo=True,
-    future=True,
-    pool_pre_ping=True,
+
+class PingedConnection(asyncpg.Connection):
+    """A pooled connection remembering when it was last returned."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.released_at = time.monotonic()
+
+
+async def _reset(connection: PingedConnection) -> None:
+    """Function resetting a connection returned to the pool.
+
+    Args:
+        connection (PingedConnection): The released connection.
+    """
+    await connection.reset()
+    connection.released_at = time.monotonic()
+
+
+async def _ping(connection: PingedConnection) -> None:
+    """Function checking an idle connection before it is handed out.
+
+    Connections used within the last `DB_POOL_PING_IDLE` seconds are
+    handed out without the extra round trip.
+
+    Args:
+        connection (PingedConnection): The connection acquired from the
+            pool.
+    """
+    if time.monotonic() - connection.released_at > config.DB_POOL_PING_IDLE:
+        await connection.execute("SELECT 1")
+
+
+class InstrumentedPool:
+    """A proxy of the asyncpg pool measuring connection acquisition.
+
+    `databases` acquires connections with `await pool.acquire()` and
+    exposes no acquire timeout, so `InstrumentedBackend` wraps the pool
+    it creates.
+    """
+
+    def __init__(self, pool: asyncpg.Pool, acquire_timeout: float) -> None:
+        """The initializer of the pool proxy.
+
+        Args:
+            pool (Pool): The wrapped asyncpg pool.
+            acquire_timeout (float): Seconds to wait for a free connection.
+        """
+        self._pool = pool
+        self._acquire_timeout = acquire_timeout
+        self.waiting = 0
+        self.acquired = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._pool, name)
+
+    async def acquire(self) -> asyncpg.Connection:
+        """Acquire a connection from the pool, recording the wait time.
+
+        Raises:
+            TimeoutError: If no connection is freed in time.
+
+        Returns:
+            Connection: The acquired connection.
+        """
+        started = time.perf_counter()
+        self.waiting += 1
+        try:
+            connection = await self._pool.acquire(
+                timeout=self._acquire_timeout,
+            )
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            raise
+        finally:
+            self.waiting -= 1
+
+        elapsed = time.perf_counter() - started
+        self.acquired += 1
+        self.total_wait += elapsed
+        self.max_wait = max(self.max_wait, elapsed)
+
+        return connection
+
+    def stats(self) -> dict:
+        """Get the current state of the pool.
+
+        Returns:
+            dict: The pool size, usage and acquisition statistics.
+        """
+        size = self._pool.get_size()
+        idle = self._pool.get_idle_size()
+
+        return {
+            "min_size": self._pool.get_min_size(),
+            "max_size": self._pool.get_max_size(),
+            "size": size,
+            "in_use": size - idle,
+            "idle": idle,
+            "waiting": self.waiting,
+            "acquired": self.acquired,
+            "acquire_timeouts": self.timeouts,
+            "acquire_avg_ms": (
+                self.total_wait / self.acquired * 1000 if self.acquired else 0.0
+            ),
+            "acquire_max_ms": self.max_wait * 1000,
+        }
+
+
+class InstrumentedBackend(PostgresBackend):
+    """A PostgreSQL backend wrapping its pool in `InstrumentedPool`."""
+
+    async def connect(self) -> None:
+        """Connect to the DB and wrap the created pool."""
+        global _instrumented_pool
+
+        await super().connect()
+        self._pool = _instrumented_pool = InstrumentedPool(
+            self._pool,
+            acquire_timeout=config.DB_POOL_ACQUIRE_TIMEOUT,
+        )
+
+    async def disconnect(self) -> None:
+        """Close the pool of the backend."""
+        global _instrumented_pool
+
+        await super().disconnect()
+        _instrumented_pool = None
+
+
+class InstrumentedDatabase(databases.Database):
+    """A database selecting `InstrumentedBackend` for asyncpg URLs."""
+
+    SUPPORTED_BACKENDS = {
+        **databases.Database.SUPPORTED_BACKENDS,
+        "postgresql+asyncpg": f"{__name__}:InstrumentedBackend",
+    }
+
+
+_instrumented_pool: InstrumentedPool | None = None
+_pre_ping: dict[str, Any] = (
+    dict(connection_class=PingedConnection, reset=_reset, setup=_ping)
+    if config.DB_POOL_PRE_PING
+    else {}
 )
 
-database = databases.Database(
+database = InstrumentedDatabase(
     db_uri,
     force_rollback=False,
+    min_size=config.DB_POOL_MIN_SIZE,
+    max_size=config.DB_POOL_MAX_SIZE,
+    statement_cache_size=config.DB_STATEMENT_CACHE_SIZE,
+    **_pre_ping,
 )
 
 
+def pool_stats() -> dict | None:
+    """Function getting statistics of the connection pool.
+
+    Returns:
+        dict | None: The pool statistics if the DB is connected.
+    """
+    if _instrumented_pool is not None:
+        return _instrumented_pool.stats()
+
+    return None
+
+
+async def _create_schema() -> None:
+    """Function creating missing tables and indexes.
+
+    Indexes are created separately since tables which already exist are
+    skipped, even if indexes were declared after they were first created.
+    """
+    async with database.transaction():
+        await database.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        for table in (match_table, archived_match_table):
+            await _migrate_match_dates(table)
+
+        unpartitioned = await database.fetch_val(
+            "SELECT relkind = 'r' FROM pg_class "
+            "WHERE oid = to_regclass('matches')"
+        )
+        if unpartitioned:
+            await _detach_unpartitioned_matches()
+        else:
+            await _check_match_partitions()
+
+        for table in metadata.sorted_tables:
+            await database.execute(CreateTable(table, if_not_exists=True))
+            if table is match_table:
+                for remainder in range(config.MATCH_PARTITIONS):
+                    await database.execute(
+                        _match_partition_ddl(remainder, if_not_exists=True)
+                    )
+                await _migrate_match_ids()
+            if table is league_counter_table:
+                await database.execute(
+                    "ALTER TABLE league_counters "
+                    "ADD COLUMN IF NOT EXISTS expected integer"
+                )
+            for index in table.indexes:
+                await database.execute(CreateIndex(index, if_not_exists=True))
+
+        if unpartitioned:
+            await _copy_unpartitioned_matches()
+        await database.execute(_backfill_counters())
+
+
+async def _migrate_match_dates(table: sqlalchemy.Table) -> None:
+    """Function converting the text dates of a matches table to timestamps.
+
+    Dates without an offset are read as UTC. The column is made NOT NULL,
+    so matches always have a date to be ordered and paged by. Nothing is
+    changed when a date is missing or cannot be converted; the IDs of
+    such matches are reported to be fixed by hand first.
+
+    Args:
+        table (Table): The matches or archived matches table.
+
+    Raises:
+        RuntimeError: If a match has no date or an invalid one.
+    """
+    column = await database.fetch_one(
+        sqlalchemy.text(
+            "SELECT data_type, is_nullable = 'YES' AS nullable "
+            "FROM information_schema.columns "
+            "WHERE table_schema = current_schema() "
+            "AND table_name = :table AND column_name = 'date'"
+        ).bindparams(table=table.name)
+    )
+
+    if not column or not column["nullable"]:
+        return
+
+    await database.execute("SET LOCAL TimeZone = 'UTC'")
+
+    if column["data_type"] == "character varying":
+        await database.execute(
+            "CREATE OR REPLACE FUNCTION pg_temp.match_date(value text) "
+            "RETURNS timestamptz LANGUAGE plpgsql AS $$ BEGIN "
+            "RETURN value::timestamptz; "
+            "EXCEPTION WHEN others THEN RETURN NULL; "
+            "END $$"
+        )
+        invalid = "pg_temp.match_date(date) IS NULL"
+    else:
+        invalid = "date IS NULL"
+
+    rows = await database.fetch_all(
+        f"SELECT id FROM {table.name} WHERE {invalid} ORDER BY id"
+    )
+    if rows:
+        ids = ", ".join(str(row["id"]) for row in rows)
+        raise RuntimeError(
+            f"Cannot migrate {table.name}.date, the matches {ids} have "
+            "a missing or invalid date"
+        )
+
+    if column["data_type"] == "character varying":
+        await database.execute(
+            f"ALTER TABLE {table.name} "
+            "ALTER COLUMN date TYPE timestamptz USING date::timestamptz"
+        )
+    await database.execute(
+        f"ALTER TABLE {table.name} ALTER COLUMN date SET NOT NULL"
+    )
+
+
+def match_partition_name(remainder: int) -> str:
+    """Function getting the name of a partition of the matches table.
+
+    Args:
+        remainder (int): The hash remainder of the partition.
+
+    Returns:
+        str: The name of the partition table.
+    """
+    return f"{match_table.name}_p{remainder}"
+
+
+def _match_partition_ddl(remainder: int, if_not_exists: bool = False) -> str:
+    """Function building the statement creating a partition of matches.
+
+    Args:
+        remainder (int): The hash remainder of the partition.
+        if_not_exists (bool, optional): Whether to skip an existing
+            partition. Defaults to False.
+
+    Returns:
+        str: The DDL statement.
+    """
+    return (
+        f"CREATE TABLE {'IF NOT EXISTS ' if if_not_exists else ''}"
+        f"{match_partition_name(remainder)} PARTITION OF {match_table.name} "
+        f"{_match_partition_bound(remainder)}"
+    )
+
+
+def _match_partition_bound(remainder: int) -> str:
+    """Function getting the bound of a partition of the matches table.
+
+    Args:
+        remainder (int): The hash remainder of the partition.
+
+    Returns:
+        str: The partition bound specification.
+    """
+    return (
+        f"FOR VALUES WITH (MODULUS {config.MATCH_PARTITIONS}, "
+        f"REMAINDER {remainder})"
+    )
+
+
+async def match_partitions() -> list[dict]:
+    """Function getting the partitions of the matches table.
+
+    Returns:
+        list[dict]: The name, bound, estimated rows and size of every
+            partition.
+    """
+    rows = await database.fetch_all(
+        sqlalchemy.text(
+            "SELECT c.relname AS name, "
+            "pg_get_expr(c.relpartbound, c.oid) AS bound, "
+            "c.reltuples::bigint AS estimated_rows, "
+            "pg_total_relation_size(c.oid) AS total_bytes "
+            "FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+            "WHERE i.inhparent = to_regclass(:table) "
+            "ORDER BY c.relname"
+        ).bindparams(table=match_table.name)
+    )
+
+    return [dict(row._mapping) for row in rows]
+
+
+async def _check_match_partitions() -> None:
+    """Function checking the existing partitions against the configuration.
+
+    Hash partitions of another modulus would overlap the configured ones,
+    and changing the number of partitions requires moving every row, so
+    the schema is not initialized until `MATCH_PARTITIONS` is restored.
+
+    Raises:
+        RuntimeError: If the matches table is partitioned with another
+            modulus.
+    """
+    moduli = {
+        int(match.group(1))
+        for partition in await match_partitions()
+        if (match := re.search(r"modulus (\d+)", partition["bound"]))
+    }
+
+    if moduli - {config.MATCH_PARTITIONS}:
+        raise RuntimeError(
+            f"The {match_table.name} table is partitioned with modulus "
+            f"{', '.join(map(str, sorted(moduli)))}, but MATCH_PARTITIONS "
+            f"is {config.MATCH_PARTITIONS}"
+        )
+
+
+async def _migrate_match_ids() -> None:
+    """Function making the IDs of partitioned matches always generated.
+
+    The lookups of a match by its ID alone rely on the IDs being unique,
+    which the primary key including `league_id` does not enforce. Serial
+    IDs of an older schema accept explicit values, so they are replaced
+    with an identity continuing from the serial sequence.
+    """
+    generated = await database.fetch_val(
+        sqlalchemy.text(
+            "SELECT attidentity = 'a' FROM pg_attribute "
+            "WHERE attrelid = to_regclass(:table) AND attname = 'id'"
+        ).bindparams(table=match_table.name)
+    )
+    if generated:
+        return
+
+    sequence = await database.fetch_val(
+        f"SELECT pg_get_serial_sequence('{match_table.name}', 'id')"
+    )
+    start = await database.fetch_val(
+        f"SELECT last_value + is_called::int FROM {sequence}"
+    )
+
+    await database.execute(
+        f"ALTER TABLE {match_table.name} ALTER COLUMN id DROP DEFAULT"
+    )
+    await database.execute(f"DROP SEQUENCE {sequence}")
+    await database.execute(
+        f"ALTER TABLE {match_table.name} ALTER COLUMN id "
+        f"ADD GENERATED ALWAYS AS IDENTITY (START WITH {start})"
+    )
+
+
+async def _detach_unpartitioned_matches() -> None:
+    """Function moving a plain matches table out of the way.
+
+    Its primary key, indexes and sequence are renamed or dropped, so the
+    partitioned table can be created with the declared names.
+    """
+    legacy = f"{match_table.name}_unpartitioned"
+
+    await database.execute(f"ALTER TABLE {match_table.name} RENAME TO {legacy}")
+    await database.execute(
+        f"ALTER INDEX IF EXISTS {match_table.name}_pkey RENAME TO {legacy}_pkey"
+    )
+    await database.execute(
+        f"ALTER SEQUENCE IF EXISTS {match_table.name}_id_seq "
+        f"RENAME TO {legacy}_id_seq"
+    )
+    for index in match_table.indexes:
+        await database.execute(f"DROP INDEX IF EXISTS {index.name}")
+
+
+async def _copy_unpartitioned_matches() -> None:
+    """Function copying the plain matches table into the partitions.
+
+    The sequence continues from the old one, which also numbered the
+    matches moved to the archive.
+    """
+    legacy = f"{match_table.name}_unpartitioned"
+    columns = ", ".join(match_table.c.keys())
+
+    await database.execute(
+        f"INSERT INTO {match_table.name} ({columns}) "
+        f"OVERRIDING SYSTEM VALUE SELECT {columns} FROM {legacy}"
+    )
+    await database.execute(
+        f"SELECT setval(pg_get_serial_sequence('{match_table.name}', 'id'), "
+        f"last_value, is_called) FROM {legacy}_id_seq"
+    )
+    await database.execute(f"DROP TABLE {legacy}")
+
+
+def _backfill_counters() -> sqlalchemy.Insert:
+    """Function building the query counting matches of uncounted leagues.
+
+    Only leagues without a counters row are aggregated, so the query is
+    cheap once every league is counted.
+
+    Returns:
+        Insert: The query inserting the missing counters.
+    """
+    status = match_table.c.status
+    uncounted = (
+        sqlalchemy.select(league_table.c.id)
+        .where(
+            ~sqlalchemy.exists().where(
+                league_counter_table.c.league_id == league_table.c.id
+            )
+        )
+        .cte("uncounted")
+    )
+    counts = (
+        sqlalchemy.select(
+            uncounted.c.id,
+            sqlalchemy.func.count(match_table.c.id).filter(status == "scheduled"),
+            sqlalchemy.func.count(match_table.c.id).filter(status == "pending"),
+            sqlalchemy.func.count(match_table.c.id).filter(status == "finished"),
+        )
+        .select_from(
+            uncounted.outerjoin(
+                match_table,
+                match_table.c.league_id == uncounted.c.id,
+            )
+        )
+        .group_by(uncounted.c.id)
+    )
+
+    return league_counter_table.insert().from_select(
+        ["league_id", "scheduled", "pending", "finished"],
+        counts,
+    )
+
+
 async def init_db(retries: int = 5, delay: int = 5) -> None:
-    """Function initializing the DB.
+    """Function connecting to the DB and initializing its schema.
 
     Args:
         retries (int, optional): Number of retries of connect to DB.
@@ -133,16 +827,16 @@ async def init_db(retries: int = 5, delay: int = 5) -> None:
     """
     for attempt in range(retries):
         try:
-            async with engine.begin() as conn:
-                await conn.run_sync(metadata.create_all)
-            return
+            await database.connect()
+            break
         except (
-            OperationalError,
-            DatabaseError,
+            OSError,
             CannotConnectNowError,
             ConnectionDoesNotExistError,
         ) as e:
             print(f"Attempt {attempt + 1} failed: {e}")
             await asyncio.sleep(delay)
+    else:
+        raise ConnectionError("Could not connect to DB after several retries.")
 
-    raise ConnectionError("Could not connect to DB after several retries.")
+    await _create_schema()
@@ -3,6 +3,9 @@
 from typing import Any
 from pydantic import BaseModel, ConfigDict
 from src.core.domain.league import SportType, LeagueStatus
+from src.core.domain.match import Match
+from src.core.domain.standing import Standing
+from src.core.domain.team import Team
 from src.infrastructure.dto.userdto import UserDTO
 
 
@@ -45,3 +48,16 @@ class LeagueDTO(BaseModel):
                 email=record_dict.get("email"),  # type: ignore
             ),
         )
+
+
+class LeagueOverviewDTO(BaseModel):
+    """A model representing DTO for the league front page data."""
+    league: LeagueDTO
+    teams: list[Team]
+    matches: list[Match]
+    standings: list[Standing]
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        extra="ignore",
+    )
@@ -0,0 +1,9 @@
+"""A module containing match related DTOs."""
+
+from src.core.domain.match import Match
+
+
+class FixtureDTO(Match):
+    """A DTO model of a match with the names of its teams."""
+    home_team_name: str
+    away_team_name: str
@@ -0,0 +1,84 @@
+"""A module containing runtime metrics DTOs."""
+
+from pydantic import BaseModel, ConfigDict
+
+
+class PoolStatsDTO(BaseModel):
+    """A DTO model for connection pool statistics."""
+    min_size: int
+    max_size: int
+    size: int
+    in_use: int
+    idle: int
+    waiting: int
+    acquired: int
+    acquire_timeouts: int
+    acquire_avg_ms: float
+    acquire_max_ms: float
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        extra="ignore",
+    )
+
+
+class CacheStatsDTO(BaseModel):
+    """A DTO model for in-process cache statistics."""
+    size: int
+    max_size: int
+    hits: int
+    misses: int
+    evictions: int
+    hit_ratio: float
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        extra="ignore",
+    )
+
+
+class PasswordStatsDTO(BaseModel):
+    """A DTO model for password hashing pool statistics."""
+    workers: int
+    pending: int
+    max_pending: int
+    rejected: int
+    hash_count: int
+    hash_avg_ms: float
+    hash_max_ms: float
+    verify_count: int
+    verify_avg_ms: float
+    verify_max_ms: float
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        extra="ignore",
+    )
+
+
+class StatementStatsDTO(BaseModel):
+    """A DTO model for prepared statement statistics."""
+    name: str
+    calls: int
+    rows: int
+    total_ms: float
+    avg_ms: float
+    max_ms: float
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        extra="ignore",
+    )
+
+
+class PartitionStatsDTO(BaseModel):
+    """A DTO model for matches partition statistics."""
+    name: str
+    bound: str
+    estimated_rows: int
+    total_bytes: int
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        extra="ignore",
+    )
@@ -0,0 +1,19 @@
+"""A module containing the paginated response DTO."""
+
+from typing import Generic, TypeVar
+
+from pydantic import BaseModel
+
+T = TypeVar("T")
+
+
+class PageDTO(BaseModel, Generic[T]):
+    """A DTO model for a single page of a keyset-paginated collection."""
+    items: list[T]
+    next_cursor: str | None = None
+
+
+class CountedPageDTO(PageDTO[T], Generic[T]):
+    """A DTO model for a page including the size of the whole collection."""
+    total: int | None = None
+    total_is_estimate: bool = False
@@ -0,0 +1,353 @@
+"""A repository for league imports."""
+
+from collections import Counter
+
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    bindparam,
+    cast,
+    exists,
+    func,
+    select,
+)
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.schema import CreateTable
+from sqlalchemy.sql import ColumnElement
+
+from src.core.domain.imports import (
+    ImportKind,
+    ImportReport,
+    ImportRow,
+    ImportRowError,
+)
+from src.core.domain.match import MatchStatus
+from src.core.repositories.iimport import IImportRepository
+from src.db import (
+    database,
+    match_table,
+    standings_table,
+    team_table,
+)
+from src.infrastructure.repositories.leaguedb import LOCK_ACTIVE
+from src.infrastructure.repositories.matchdb import COUNT, COUNTED_STATUSES
+from src.infrastructure.utils.cache import LRUCache
+from src.infrastructure.utils.statements import constant, statements
+
+# Rows are copied into a temporary table of the connection, which is
+# created once per pooled connection and emptied when the import commits.
+import_staging_table = Table(
+    "import_staging",
+    MetaData(),
+    Column("line", Integer),
+    Column("kind", String),
+    Column("name", String),
+    Column("home_team", String),
+    Column("away_team", String),
+    Column("date", DateTime(timezone=True)),
+    prefixes=["TEMPORARY"],
+    postgresql_on_commit="DELETE ROWS",
+)
+STAGING_COLUMNS = tuple(import_staging_table.c.keys())
+CREATE_STAGING = CreateTable(import_staging_table, if_not_exists=True)
+
+_staging = import_staging_table.c
+_league_id = bindparam("league_id", type_=Integer)
+_captain_id = bindparam("captain_id", type_=Integer)
+
+
+def _staged(kind: ImportKind) -> ColumnElement:
+    """A function getting the filter of the staged rows of a kind.
+
+    Args:
+        kind (ImportKind): The kind of the rows.
+
+    Returns:
+        ColumnElement: The filter of the rows.
+    """
+    return _staging.kind == constant(kind.value, _staging.kind.type)
+
+
+# Team names identify the teams of the imported matches, so a team is only
+# added when its name is new to the league and first in the upload.
+_staged_teams = (
+    select(
+        _staging.line,
+        _staging.name,
+        func.row_number().over(
+            partition_by=_staging.name,
+            order_by=_staging.line,
+        ).label("seen"),
+        exists().where(
+            (team_table.c.league_id == _league_id) &
+            (team_table.c.name == _staging.name)
+        ).label("taken"),
+    )
+    .where(_staged(ImportKind.TEAM))
+    .cte("staged_teams")
+)
+_team_accepted = (_staged_teams.c.seen == 1) & ~_staged_teams.c.taken
+_inserted_teams = (
+    team_table.insert()
+    .from_select(
+        ["name", "league_id", "captain_id"],
+        select(
+            _staged_teams.c.name,
+            cast(_league_id, Integer),
+            cast(_captain_id, Integer),
+        )
+        .where(_team_accepted)
+        .order_by(_staged_teams.c.line),
+    )
+    .returning(team_table.c.id)
+    .cte("inserted_teams")
+)
+MERGE_TEAMS = statements.register(
+    "imports.merge_teams",
+    select(
+        select(func.count())
+        .select_from(_inserted_teams)
+        .scalar_subquery()
+        .label("created"),
+        func.array_agg(
+            aggregate_order_by(_staged_teams.c.line, _staged_teams.c.line)
+        ).filter(~_team_accepted).label("rejected"),
+    )
+    .select_from(_staged_teams)
+    .add_cte(
+        standings_table.insert()
+        .from_select(["team_id"], select(_inserted_teams.c.id))
+        .cte("team_standings")
+    ),
+)
+
+# Matches name their teams, which resolve when exactly one team of the
+# league has the name; the names imported by the upload are already added.
+_named = (
+    select(
+        team_table.c.name,
+        func.min(team_table.c.id).label("id"),
+        func.count().label("teams"),
+    )
+    .where(team_table.c.league_id == _league_id)
+    .group_by(team_table.c.name)
+    .cte("named")
+)
+_home = _named.alias("home")
+_away = _named.alias("away")
+_staged_matches = (
+    select(
+        _staging.line,
+        _staging.date,
+        _home.c.id.label("home_team_id"),
+        _away.c.id.label("away_team_id"),
+        func.coalesce(_home.c.teams, 0).label("home_teams"),
+        func.coalesce(_away.c.teams, 0).label("away_teams"),
+    )
+    .select_from(
+        import_staging_table
+        .outerjoin(_home, _home.c.name == _staging.home_team)
+        .outerjoin(_away, _away.c.name == _staging.away_team)
+    )
+    .where(_staged(ImportKind.MATCH))
+    .cte("staged_matches")
+)
+_match_accepted = (
+    (_staged_matches.c.home_teams == 1) &
+    (_staged_matches.c.away_teams == 1)
+)
+_inserted_matches = (
+    match_table.insert()
+    .from_select(
+        [
+            "league_id",
+            "home_team_id",
+            "away_team_id",
+            "date",
+            "status",
+            "submitted_by",
+        ],
+        select(
+            cast(_league_id, Integer),
+            _staged_matches.c.home_team_id,
+            _staged_matches.c.away_team_id,
+            _staged_matches.c.date,
+            constant(MatchStatus.SCHEDULED.value, match_table.c.status.type),
+            cast(_captain_id, Integer),
+        )
+        .where(_match_accepted)
+        .order_by(_staged_matches.c.line),
+    )
+    .returning(match_table.c.id)
+    .cte("inserted_matches")
+)
+
+
+def _rejected(column: ColumnElement) -> ColumnElement:
+    """A function aggregating a column of the rejected matches by line.
+
+    Args:
+        column (ColumnElement): The column of the staged matches.
+
+    Returns:
+        ColumnElement: The array of the values.
+    """
+    return func.array_agg(
+        aggregate_order_by(column, _staged_matches.c.line)
+    ).filter(~_match_accepted)
+
+
+MERGE_MATCHES = statements.register(
+    "imports.merge_matches",
+    select(
+        select(func.count())
+        .select_from(_inserted_matches)
+        .scalar_subquery()
+        .label("created"),
+        _rejected(_staged_matches.c.line).label("rejected"),
+        _rejected(_staged_matches.c.home_teams).label("home_teams"),
+        _rejected(_staged_matches.c.away_teams).label("away_teams"),
+    )
+    .select_from(_staged_matches),
+)
+
+
+class ImportRepository(IImportRepository):
+    """An implementation of repository class for league imports."""
+
+    def __init__(
+        self,
+        standings_cache: LRUCache,
+        calendar_cache: LRUCache,
+    ) -> None:
+        """The initializer of the `import repository`.
+
+        Args:
+            standings_cache (LRUCache): The cache of league standings
+                invalidated when teams are imported.
+            calendar_cache (LRUCache): The cache of calendar feeds
+                invalidated when matches are imported.
+        """
+        self._standings_cache = standings_cache
+        self._calendar_cache = calendar_cache
+
+    async def import_rows(
+        self,
+        league_id: int,
+        captain_id: int,
+        rows: list[tuple[int, ImportRow]],
+    ) -> ImportReport | None:
+        """The method merging import rows into the league in one transaction.
+
+        The rows are loaded with `COPY` into the staging table and merged
+        by two statements, one adding the teams with their standings and
+        one adding the matches, instead of checking and inserting every
+        row on its own. The league row is locked, so it cannot be
+        archived and concurrent imports cannot add the same team names.
+
+        Args:
+            league_id (int): The ID of the league.
+            captain_id (int): The ID of the user captaining the new teams.
+            rows (list[tuple[int, ImportRow]]): The rows with their
+                positions in the upload.
+
+        Returns:
+            ImportReport | None: The numbers of created teams and matches
+                with the rejected rows, None if the league is not active.
+        """
+        records = [
+            (
+                line,
+                row.kind.value,
+                row.name,
+                row.home_team,
+                row.away_team,
+                row.date,
+            )
+            for line, row in rows
+        ]
+
+        async with database.transaction():
+            if not await LOCK_ACTIVE.fetch_value(league_id=league_id):
+                return None
+
+            await database.execute(CREATE_STAGING)
+            async with database.connection() as connection:
+                await connection.raw_connection.copy_records_to_table(
+                    import_staging_table.name,
+                    records=records,
+                    columns=STAGING_COLUMNS,
+                )
+
+            teams = await MERGE_TEAMS.fetch_one(
+                league_id=league_id,
+                captain_id=captain_id,
+            )
+            matches = await MERGE_MATCHES.fetch_one(
+                league_id=league_id,
+                captain_id=captain_id,
+            )
+
+            # Scheduled matches only add to the counters, so the import
+            # never closes the season.
+            if matches["created"]:
+                changes = Counter(
+                    {MatchStatus.SCHEDULED.value: matches["created"]}
+                )
+                await COUNT.fetch_one(
+                    league_id=league_id,
+                    **{status: changes[status] for status in COUNTED_STATUSES},
+                )
+
+        if teams["created"] or matches["created"]:
+            self._standings_cache.invalidate(league_id)
+            self._calendar_cache.invalidate(league_id)
+
+        errors = [
+            ImportRowError(
+                row=line,
+                errors=["Team name already exists in the league or upload"],
+            )
+            for line in teams["rejected"] or []
+        ]
+        errors += [
+            ImportRowError(
+                row=line,
+                errors=[
+                    _team_problem(side, count)
+                    for side, count in (("home", home), ("away", away))
+                    if count != 1
+                ],
+            )
+            for line, home, away in zip(
+                matches["rejected"] or [],
+                matches["home_teams"] or [],
+                matches["away_teams"] or [],
+            )
+        ]
+
+        return ImportReport(
+            teams_created=teams["created"],
+            matches_created=matches["created"],
+            errors=errors,
+        )
+
+
+def _team_problem(side: str, count: int) -> str:
+    """A function describing why the team of a match was not resolved.
+
+    Args:
+        side (str): The side of the team, home or away.
+        count (int): The number of the league teams with its name.
+
+    Returns:
+        str: The description of the problem.
+    """
+    if not count:
+        return f"The {side} team is not in the league"
+
+    return f"The {side} team name matches {count} teams of the league"
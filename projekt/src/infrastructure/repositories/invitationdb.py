@@ -0,0 +1,194 @@
+"""A repository for invitation entity."""
+
+from datetime import datetime
+from typing import Iterable
+
+from sqlalchemy import (
+    DateTime,
+    Integer,
+    String,
+    bindparam,
+    cast,
+    exists,
+    func,
+    select,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
+
+from src.core.domain.invitation import Invitation
+from src.core.domain.league import LeagueStatus
+from src.core.domain.team import Team
+from src.core.repositories.iinvitation import IInvitationRepository
+from src.db import (
+    invitation_table,
+    league_table,
+    standings_table,
+    team_table,
+)
+from src.infrastructure.utils.cache import LRUCache
+from src.infrastructure.utils.mappers import map_invitation, map_team
+from src.infrastructure.utils.statements import constant, statements
+
+_now = func.timezone("utc", func.now())
+_user_id = bindparam("user_id", type_=Integer)
+
+CREATE = statements.register(
+    "invitations.create",
+    invitation_table.insert()
+    .from_select(
+        ["league_id", "token", "expires_at"],
+        select(
+            cast(bindparam("league_id"), Integer),
+            func.unnest(bindparam("tokens", type_=ARRAY(String))),
+            cast(bindparam("expires_at"), DateTime),
+        ),
+    )
+    .returning(*invitation_table.c),
+)
+
+_redeemed = (
+    invitation_table.update()
+    .where(invitation_table.c.token == bindparam("token", type_=String))
+    .where(invitation_table.c.used_by.is_(None))
+    .where(invitation_table.c.expires_at > _now)
+    .where(invitation_table.c.league_id == league_table.c.id)
+    .where(league_table.c.status == constant(
+        LeagueStatus.ACTIVE.value,
+        league_table.c.status.type,
+    ))
+    .where(
+        ~exists().where(
+            (team_table.c.league_id == invitation_table.c.league_id) &
+            (team_table.c.captain_id == _user_id)
+        )
+    )
+    .values(used_by=_user_id)
+    .returning(invitation_table.c.league_id)
+    .cte("redeemed")
+)
+_inserted = (
+    team_table.insert()
+    .from_select(
+        ["name", "league_id", "captain_id"],
+        select(
+            cast(bindparam("team_name"), String),
+            _redeemed.c.league_id,
+            cast(_user_id, Integer),
+        ),
+    )
+    .returning(*team_table.c)
+    .cte("inserted")
+)
+REDEEM = statements.register(
+    "invitations.redeem",
+    select(_inserted).add_cte(
+        standings_table.insert()
+        .from_select(["team_id"], select(_inserted.c.id))
+        .cte("standing")
+    ),
+)
+
+# Deletes a batch of the longest expired invitations, read from the index
+# on the expiration time.
+PURGE = statements.register(
+    "invitations.purge",
+    invitation_table.delete()
+    .where(
+        invitation_table.c.id.in_(
+            select(invitation_table.c.id)
+            .where(invitation_table.c.expires_at <= _now)
+            .order_by(invitation_table.c.expires_at.asc())
+            .limit(bindparam("limit"))
+        )
+    )
+    .returning(invitation_table.c.id),
+)
+
+
+class InvitationRepository(IInvitationRepository):
+    """An implementation of repository class for invitation."""
+
+    def __init__(self, standings_cache: LRUCache) -> None:
+        """The initializer of the `invitation repository`.
+
+        Args:
+            standings_cache (LRUCache): The cache of league standings
+                invalidated when a team joins a league.
+        """
+        self._standings_cache = standings_cache
+
+    async def create_invitations(
+        self,
+        league_id: int,
+        tokens: list[str],
+        expires_at: datetime,
+    ) -> Iterable[Invitation]:
+        """The method adding many invitations in one statement.
+
+        Args:
+            league_id (int): The ID of the league.
+            tokens (list[str]): The tokens of the invitations.
+            expires_at (datetime): The UTC expiration time.
+
+        Returns:
+            Iterable[Invitation]: The created invitations.
+        """
+        invitations = await CREATE.fetch_all(
+            league_id=league_id,
+            tokens=tokens,
+            expires_at=expires_at,
+        )
+
+        return [map_invitation(invitation) for invitation in invitations]
+
+    async def redeem(
+        self,
+        token: str,
+        user_id: int,
+        team_name: str,
+    ) -> Team | None:
+        """The method using an invitation to join its league.
+
+        The invitation is claimed and the team created in one statement,
+        so concurrent redemptions of a token cannot both succeed and no
+        row is read before it is written.
+
+        Args:
+            token (str): The token of the invitation.
+            user_id (int): The ID of the user becoming the team captain.
+            team_name (str): The name of the new team.
+
+        Returns:
+            Team | None: The new team if the invitation was valid.
+        """
+        team = await REDEEM.fetch_one(
+            token=token,
+            user_id=user_id,
+            team_name=team_name,
+        )
+
+        if not team:
+            return None
+
+        self._standings_cache.invalidate(team["league_id"])
+
+        return map_team(team)
+
+    async def purge_expired(self, batch_size: int) -> int:
+        """The method deleting expired invitations in batches.
+
+        Args:
+            batch_size (int): The maximum number of rows per statement.
+
+        Returns:
+            int: The number of deleted invitations.
+        """
+        deleted = 0
+
+        while rows := await PURGE.fetch_all(limit=batch_size):
+            deleted += len(rows)
+
+            if len(rows) < batch_size:
+                break
+
+        return deleted
@@ -1,18 +1,228 @@
 """A database implementation of league repository."""
 
-from typing import Any, List
+from typing import Any, Iterable, List
 
 from asyncpg import Record  # type: ignore
-from sqlalchemy import select, join
-
-from src.core.domain.league import LeagueBroker, LeagueStatus, League
+from sqlalchemy import (
+    CTE,
+    Float,
+    Integer,
+    Select,
+    String,
+    and_,
+    any_,
+    bindparam,
+    false,
+    func,
+    or_,
+    select,
+    join,
+    literal,
+    true,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
+
+from src.core.domain.league import (
+    LeagueBroker,
+    LeagueFilter,
+    LeagueStatus,
+    League,
+    SportType,
+)
 from src.core.repositories.ileague import ILeagueRepository
 from src.db import (
-    database, 
-    league_table, 
+    archived_match_table,
+    database,
+    league_table,
+    match_table,
+    standings_snapshot_table,
     user_table,
 )
 from src.infrastructure.dto.leaguedto import LeagueDTO
+from src.infrastructure.dto.pagedto import CountedPageDTO, PageDTO
+from src.infrastructure.repositories.standingsdb import standings_query
+from src.infrastructure.utils.consts import COUNT_ESTIMATE_THRESHOLD
+from src.infrastructure.utils.cursor import decode_cursor, encode_cursor
+from src.infrastructure.utils.mappers import map_league
+from src.infrastructure.utils.statements import (
+    Statement,
+    constant,
+    statements,
+)
+
+LEAGUES_JOIN_OWNERS = join(
+    league_table,
+    user_table,
+    league_table.c.owner_id == user_table.c.id,
+)
+LEAGUES_WITH_OWNER = select(league_table, user_table) \
+    .select_from(LEAGUES_JOIN_OWNERS)
+
+
+# Filters sent as parameters; status and privacy have only a few values and
+# are rendered as constants, so the partial indexes match their predicates.
+LISTING_PARAMS = {
+    "city": func.lower(league_table.c.city) ==
+        func.lower(bindparam("city", type_=String)),
+    "sport_type": league_table.c.sport_type ==
+        bindparam("sport_type", type_=String),
+    "owner_id": league_table.c.owner_id ==
+        bindparam("owner_id", type_=Integer),
+    "ids": league_table.c.id ==
+        any_(bindparam("ids", type_=ARRAY(Integer))),
+}
+
+_listings: dict[tuple, tuple[Statement, Statement, Statement, Statement]] = {}
+
+
+def _listing_statements(
+    filters: LeagueFilter,
+) -> tuple[Statement, Statement, Statement, Statement]:
+    """A function getting the statements listing leagues with given filters.
+
+    Only the predicates of the set filters are emitted. The statements are
+    compiled and registered once per combination of the filters.
+
+    Args:
+        filters (LeagueFilter): The listing filters.
+
+    Returns:
+        tuple[Statement, Statement, Statement, Statement]: The first page,
+            next page, matching rows and row count statements.
+    """
+    params = tuple(
+        name for name in LISTING_PARAMS if getattr(filters, name) is not None
+    )
+    key = (params, filters.status, filters.is_private)
+
+    if key in _listings:
+        return _listings[key]
+
+    conditions = [LISTING_PARAMS[name] for name in params]
+    labels = list(params)
+
+    if filters.status is not None:
+        conditions.append(league_table.c.status == constant(
+            filters.status.value,
+            league_table.c.status.type,
+        ))
+        labels.append(f"status={filters.status.value}")
+
+    if filters.is_private is not None:
+        conditions.append(
+            league_table.c.is_private == (
+                true() if filters.is_private else false()
+            )
+        )
+        labels.append(f"is_private={filters.is_private}")
+
+    name = f"leagues.list[{','.join(labels)}]"
+    query = (
+        LEAGUES_WITH_OWNER
+        .where(*conditions)
+        .order_by(league_table.c.id.asc())
+        .limit(bindparam("limit"))
+    )
+    matching = select(league_table.c.id).where(*conditions)
+
+    _listings[key] = (
+        statements.register(name, query),
+        statements.register(
+            f"{name}_after",
+            query.where(league_table.c.id > bindparam("after_id")),
+        ),
+        statements.register(f"{name}_matching", matching),
+        statements.register(
+            f"{name}_count",
+            select(func.count()).select_from(matching.subquery()),
+        ),
+    )
+
+    return _listings[key]
+
+
+BY_OWNER = statements.register(
+    "leagues.by_owner",
+    LEAGUES_WITH_OWNER
+    .where(league_table.c.owner_id == bindparam("owner_id"))
+    .order_by(league_table.c.name.asc()),
+)
+BY_ID = statements.register(
+    "leagues.by_id",
+    LEAGUES_WITH_OWNER.where(league_table.c.id == bindparam("league_id")),
+)
+BY_IDS = statements.register(
+    "leagues.by_ids",
+    LEAGUES_WITH_OWNER.where(
+        league_table.c.id == any_(bindparam("league_ids", type_=ARRAY(Integer)))
+    ),
+)
+# Locks an active league, serializing the writes which depend on its
+# matches or teams until the transaction ends.
+LOCK_ACTIVE = statements.register(
+    "leagues.lock_active",
+    select(league_table.c.id)
+    .where(league_table.c.id == bindparam("league_id", type_=Integer))
+    .where(league_table.c.status == constant(
+        LeagueStatus.ACTIVE.value,
+        league_table.c.status.type,
+    ))
+    .with_for_update(),
+)
+
+# Matches the predicate of the trigram indexes on name and city.
+IS_ACTIVE_PUBLIC = and_(
+    league_table.c.status == constant(
+        LeagueStatus.ACTIVE.value,
+        league_table.c.status.type,
+    ),
+    league_table.c.is_private == false(),
+)
+
+BY_CITY = statements.register(
+    "leagues.by_city",
+    LEAGUES_WITH_OWNER
+    .where(IS_ACTIVE_PUBLIC)
+    .where(league_table.c.city.ilike(bindparam("pattern", type_=String)))
+    .order_by(league_table.c.name.asc()),
+)
+
+_query = bindparam("query", type_=String)
+_pattern = bindparam("pattern", type_=String)
+_sport_type = bindparam("sport_type", type_=String)
+SEARCH_SCORE = func.greatest(
+    func.similarity(league_table.c.name, _query),
+    func.similarity(league_table.c.city, _query),
+).label("score")
+SEARCH = (
+    select(league_table, user_table, SEARCH_SCORE)
+    .select_from(LEAGUES_JOIN_OWNERS)
+    .where(IS_ACTIVE_PUBLIC)
+    .where(
+        or_(
+            league_table.c.name.op("%")(_query),
+            league_table.c.city.op("%")(_query),
+            league_table.c.name.ilike(_pattern),
+            league_table.c.city.ilike(_pattern),
+        )
+    )
+    .where(or_(_sport_type.is_(None), league_table.c.sport_type == _sport_type))
+    .order_by(SEARCH_SCORE.desc(), league_table.c.id.asc())
+    .limit(bindparam("limit"))
+)
+SEARCH_PAGE = statements.register("leagues.search", SEARCH)
+SEARCH_PAGE_AFTER = statements.register(
+    "leagues.search_after",
+    SEARCH.where(
+        or_(
+            SEARCH_SCORE.element < bindparam("after_score", type_=Float),
+            and_(
+                SEARCH_SCORE.element == bindparam("after_score", type_=Float),
+                league_table.c.id > bindparam("after_id"),
+            ),
+        )
+    ),
+)
 
 
 class LeagueRepository(ILeagueRepository):
@@ -29,29 +239,34 @@ class LeagueRepository(ILeagueRepository):
         """
         league_data = league.model_dump()
         league_data['status'] = LeagueStatus.ACTIVE.value
-        query = league_table.insert().values(**league_data)
-        new_league_id = await database.execute(query)
-        
-        return await self.get_by_id(new_league_id)
+        inserted = league_table \
+            .insert() \
+            .values(**league_data) \
+            .returning(*league_table.c) \
+            .cte("inserted")
+        new_league = await database.fetch_one(self._with_owner(inserted))
 
-    async def get_all_public(self) -> List[LeagueDTO]:
-        """The method getting all public leagues.
+        return map_league(new_league) if new_league else None
+
+    async def get_all_public(
+        self,
+        limit: int,
+        after: str | None = None,
+    ) -> PageDTO[LeagueDTO]:
+        """The method getting a page of public leagues.
+
+        Args:
+            limit (int): The maximum number of leagues on the page.
+            after (str | None): The cursor returned with the previous page.
 
         Returns:
-            List[LeagueDTO]: A list of public leagues with owner information.
+            PageDTO[LeagueDTO]: A page of public leagues with owner information.
         """
-        query = (
-            select(league_table, user_table)
-            .select_from(
-                join(league_table, user_table, 
-                     league_table.c.owner_id == user_table.c.id)
-            )
-            .where(league_table.c.status == LeagueStatus.ACTIVE)
-            .order_by(league_table.c.id.asc())
+        return await self.get_filtered(
+            LeagueFilter(status=LeagueStatus.ACTIVE, is_private=False),
+            limit,
+            after,
         )
-        leagues = await database.fetch_all(query)
-
-        return [LeagueDTO.from_record(league) for league in leagues]
 
     async def get_by_owner(self, owner_id: int) -> List[LeagueDTO]:
         """The method getting all leagues owned by a user.
@@ -62,35 +277,29 @@ class LeagueRepository(ILeagueRepository):
         Returns:
             List[LeagueDTO]: A list of leagues owned by the user with owner information.
         """
-        query = (
-            select(league_table, user_table)
-            .select_from(
-                join(league_table, user_table, 
-                     league_table.c.owner_id == user_table.c.id)
-            )
-            .where(league_table.c.owner_id == owner_id)
-            .order_by(league_table.c.name.asc())
-        )
-        leagues = await database.fetch_all(query)
+        leagues = await BY_OWNER.fetch_all(owner_id=owner_id)
 
-        return [LeagueDTO.from_record(league) for league in leagues]
+        return [map_league(league) for league in leagues]
+
+    async def get_all_archived(
+        self,
+        limit: int,
+        after: str | None = None,
+    ) -> PageDTO[LeagueDTO]:
+        """The method getting a page of archived leagues.
 
-    async def get_all_archived(self) -> List[LeagueDTO]:
-        """The method getting all archived leagues.
+        Args:
+            limit (int): The maximum number of leagues on the page.
+            after (str | None): The cursor returned with the previous page.
 
         Returns:
-            List[LeagueDTO]: A list of archived leagues with owner information.
+            PageDTO[LeagueDTO]: A page of archived leagues with owner information.
         """
-        query = (
-            select(league_table, user_table)
-            .select_from(
-                join(league_table, user_table, 
-                     league_table.c.owner_id == user_table.c.id)
-            )
-            .where(league_table.c.status == LeagueStatus.ARCHIVED)
+        return await self.get_filtered(
+            LeagueFilter(status=LeagueStatus.ARCHIVED),
+            limit,
+            after,
         )
-        leagues = await database.fetch_all(query)
-        return [LeagueDTO.from_record(league) for league in leagues]
 
     async def get_by_id(self, league_id: int) -> Any | None:
         """The method getting league by ID.
@@ -101,40 +310,54 @@ class LeagueRepository(ILeagueRepository):
         Returns:
             Any | None: The league object with owner information.
         """
-        query = (
-            select(league_table, user_table)
-            .select_from(
-                join(
-                    league_table, 
-                    user_table, 
-                    league_table.c.owner_id == user_table.c.id)
-            )
-            .where(league_table.c.id == league_id)
-            .order_by(league_table.c.name.asc())
-        )
-        league = await database.fetch_one(query)
+        league = await BY_ID.fetch_one(league_id=league_id)
+
+        return map_league(league) if league else None
 
-        return LeagueDTO.from_record(league) if league else None
+    async def get_by_ids(self, league_ids: list[int]) -> Iterable[LeagueDTO]:
+        """The method getting leagues by their IDs.
+
+        Args:
+            league_ids (list[int]): The IDs of the leagues.
+
+        Returns:
+            Iterable[LeagueDTO]: The existing leagues, in no particular order.
+        """
+        leagues = await BY_IDS.fetch_all(league_ids=league_ids)
+
+        return [map_league(league) for league in leagues]
 
     async def archive_league(self, league_id: int) -> LeagueDTO | None:
         """The method archiving a league.
 
+        The matches of the league are moved to the archive table and its
+        final table is frozen in the same transaction, so the hot tables
+        only keep active seasons. Archiving an archived league changes
+        nothing.
+
         Args:
             league_id (int): The ID of the league.
 
         Returns:
             LeagueDTO | None: The updated league object with owner information.
         """
-        if not await self._get_league_by_id(league_id):
-            return None
-            
-        query = league_table \
+        updated = league_table \
             .update() \
             .where(league_table.c.id == league_id) \
-            .values(status=LeagueStatus.ARCHIVED)
-        await database.execute(query)
+            .where(league_table.c.status == LeagueStatus.ACTIVE.value) \
+            .values(status=LeagueStatus.ARCHIVED) \
+            .returning(*league_table.c) \
+            .cte("updated")
+
+        async with database.transaction():
+            league = await database.fetch_one(self._with_owner(updated))
 
-        return await self.get_by_id(league_id)
+            if not league:
+                return await self.get_by_id(league_id)
+
+            await database.execute(archive_query(league_id))
+
+        return map_league(league)
 
     async def delete_league(self, league_id: int) -> bool:
         """The method deleting a league.
@@ -145,15 +368,12 @@ class LeagueRepository(ILeagueRepository):
         Returns:
             bool: True if deleted successfully.
         """
-        if await self._get_league_by_id(league_id):
-            query = league_table \
-                .delete() \
-                .where(league_table.c.id == league_id)
-            await database.execute(query)
-
-            return True
+        query = league_table \
+            .delete() \
+            .where(league_table.c.id == league_id) \
+            .returning(league_table.c.id)
 
-        return False
+        return await database.fetch_one(query) is not None
 
     async def update_league(
         self,
@@ -169,18 +389,16 @@ class LeagueRepository(ILeagueRepository):
         Returns:
             League | None: The updated league details.
         """
-
-        if not await self._get_league_by_id(league_id):
-            return None
-            
-        query = (
+        updated = (
             league_table.update()
             .where(league_table.c.id == league_id)
             .values(**data.model_dump())
+            .returning(*league_table.c)
+            .cte("updated")
         )
-        await database.execute(query)
+        league = await database.fetch_one(self._with_owner(updated))
 
-        return await self.get_by_id(league_id)
+        return map_league(league) if league else None
 
     async def get_by_city(self, city: str) -> List[LeagueDTO]:
         """Get leagues by city name.
@@ -191,37 +409,166 @@ class LeagueRepository(ILeagueRepository):
         Returns:
             List[LeagueDTO]: List of leagues in the city.
         """
-        query = (
-            select(league_table, user_table)
-            .select_from(
-                join(
-                    league_table, 
-                    user_table, 
-                    league_table.c.owner_id == user_table.c.id)
+        leagues = await BY_CITY.fetch_all(pattern=f"%{city}%")
+
+        return [map_league(league) for league in leagues]
+
+    async def search(
+        self,
+        query: str,
+        sport_type: SportType | None,
+        limit: int,
+        after: str | None = None,
+    ) -> PageDTO[LeagueDTO]:
+        """The method searching active public leagues by name and city.
+
+        Args:
+            query (str): The searched phrase.
+            sport_type (SportType | None): The sport type to filter by.
+            limit (int): The maximum number of leagues on the page.
+            after (str | None): The cursor returned with the previous page.
+
+        Raises:
+            ValueError: If the cursor is malformed.
+
+        Returns:
+            PageDTO[LeagueDTO]: The page of leagues ranked by similarity.
+        """
+        params = {
+            "query": query,
+            "pattern": f"%{query}%",
+            "sport_type": sport_type.value if sport_type else None,
+            "limit": limit + 1,
+        }
+
+        if after:
+            score, league_id = decode_cursor(after, float, int)
+            rows = await SEARCH_PAGE_AFTER.fetch_all(
+                after_score=score,
+                after_id=league_id,
+                **params,
             )
-            .where(
-                (league_table.c.city.ilike(f"%{city}%")) &
-                (league_table.c.status == LeagueStatus.ACTIVE)
+        else:
+            rows = await SEARCH_PAGE.fetch_all(**params)
+
+        leagues = [map_league(league) for league in rows[:limit]]
+
+        next_cursor = None
+        if len(rows) > limit:
+            next_cursor = encode_cursor(rows[limit - 1]["score"], leagues[-1].id)
+
+        return PageDTO[LeagueDTO](items=leagues, next_cursor=next_cursor)
+
+    async def get_filtered(
+        self,
+        filters: LeagueFilter,
+        limit: int,
+        after: str | None = None,
+        with_total: bool = False,
+    ) -> CountedPageDTO[LeagueDTO]:
+        """The method getting a page of leagues matching the filters.
+
+        Args:
+            filters (LeagueFilter): The listing filters.
+            limit (int): The maximum number of leagues on the page.
+            after (str | None): The cursor returned with the previous page.
+            with_total (bool): Whether to count all matching leagues.
+
+        Raises:
+            ValueError: If the cursor is malformed.
+
+        Returns:
+            CountedPageDTO[LeagueDTO]: The page of leagues ordered by ID.
+        """
+        first, following, matching, count = _listing_statements(filters)
+        params = {
+            "city": filters.city,
+            "sport_type": filters.sport_type.value if filters.sport_type else None,
+            "owner_id": filters.owner_id,
+            "ids": filters.ids,
+        }
+
+        if after:
+            league_id, = decode_cursor(after, int)
+            rows = await following.fetch_all(
+                limit=limit + 1,
+                after_id=league_id,
+                **params,
             )
-            .order_by(league_table.c.name.asc())
-        )
-        leagues = await database.fetch_all(query)
+        else:
+            rows = await first.fetch_all(limit=limit + 1, **params)
+        leagues = [map_league(league) for league in rows[:limit]]
+
+        next_cursor = None
+        if len(rows) > limit:
+            next_cursor = encode_cursor(leagues[-1].id)
+
+        page = CountedPageDTO[LeagueDTO](items=leagues, next_cursor=next_cursor)
+
+        if with_total:
+            page.total = await matching.estimate_rows(**params)
+            page.total_is_estimate = page.total > COUNT_ESTIMATE_THRESHOLD
+
+            if not page.total_is_estimate:
+                page.total = await count.fetch_value(**params)
+
+        return page
 
-        return [LeagueDTO.from_record(league) for league in leagues]
+    def _with_owner(self, leagues: CTE) -> Select:
+        """A private method joining leagues returned by a write with owners.
 
-    async def _get_league_by_id(self, league_id: int):
-        """A private method getting league from the DB based on its ID.
-        
         Args:
-            league_id (int): The ID of the league.
-            
+            leagues (CTE): The data-modifying CTE returning league rows.
+
         Returns:
-            Record | None: The raw database record.
+            Select: The query selecting league rows with owner information.
         """
-        query = (
-            league_table.select()
-            .where(league_table.c.id == league_id)
+        return (
+            select(leagues, user_table)
+            .select_from(
+                join(leagues, user_table,
+                     leagues.c.owner_id == user_table.c.id)
+            )
         )
-        return await database.fetch_one(query)
 
 
+def archive_query(league_id: int) -> Select:
+    """A function building the query moving a league to cold storage.
+
+    The matches are deleted from the hot table and inserted into the
+    archive table, and the final table is calculated from the moved rows,
+    so the snapshot always matches the archived results.
+
+    Args:
+        league_id (int): The ID of the league.
+
+    Returns:
+        Select: The query returning the number of frozen standings.
+    """
+    moved = match_table \
+        .delete() \
+        .where(match_table.c.league_id == league_id) \
+        .returning(*match_table.c) \
+        .cte("moved")
+    archived = archived_match_table \
+        .insert() \
+        .from_select(list(match_table.c.keys()), select(moved)) \
+        .cte("archived")
+    standings = standings_query(league_id, moved).subquery("standings")
+    snapshot = standings_snapshot_table \
+        .insert() \
+        .from_select(
+            list(standings_snapshot_table.c.keys()),
+            select(
+                literal(league_id, Integer),
+                *(
+                    standings.c[name]
+                    for name in standings_snapshot_table.c.keys()
+                    if name != "league_id"
+                ),
+            ),
+        ) \
+        .returning(standings_snapshot_table.c.team_id) \
+        .cte("snapshot")
+
+    return select(func.count()).select_from(snapshot).add_cte(archived)
@@ -1,164 +1,847 @@
 """A repository for match entity."""
 
+from collections import Counter
+from datetime import datetime
 from typing import Any, Iterable
 
 from asyncpg import Record  # type: ignore
-from sqlalchemy import select, join, or_
-
-from src.core.domain.match import MatchBroker, Match, MatchIn, MatchUpdateIn
+from sqlalchemy import (
+    Integer,
+    Select,
+    any_,
+    bindparam,
+    case,
+    cast,
+    exists,
+    func,
+    literal_column,
+    select,
+    join,
+    or_,
+    true,
+    tuple_,
+    union_all,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, insert
+
+from src.core.domain.match import (
+    MatchBroker,
+    Match,
+    MatchCreateFailure,
+    MatchFilter,
+    MatchIn,
+    MatchStatus,
+    MatchUpdateIn,
+    ScheduleFailure,
+)
 from src.core.repositories.imatch import IMatchRepository
 from src.db import (
-    database, 
-    team_table, 
+    archived_match_table,
+    database,
+    team_table,
+    league_counter_table,
     league_table,
     match_table,
+    standings_table,
 )
 from src.core.domain.league import LeagueStatus
+from src.infrastructure.dto.matchdto import FixtureDTO
+from src.infrastructure.dto.pagedto import PageDTO
+from src.infrastructure.repositories.leaguedb import LOCK_ACTIVE, archive_query
+from src.infrastructure.utils.cache import LRUCache
+from src.infrastructure.utils.cursor import decode_cursor, encode_cursor
+from src.infrastructure.utils.mappers import map_fixture, map_match
+from src.infrastructure.utils.statements import (
+    Statement,
+    constant,
+    statements,
+)
+
+
+# Reads cover the hot and the archived matches. The union is flattened by
+# the planner, so the filters reach the indexes of both tables and archived
+# rows cost one extra index probe.
+STORED_MATCHES = union_all(
+    match_table.select(),
+    archived_match_table.select(),
+).subquery("stored_matches")
+
+
+def _page_statements(
+    name: str,
+    query: Select,
+) -> tuple[Statement, Statement]:
+    """A function registering the statements paging matches by date and ID.
+
+    Args:
+        name (str): The name of the listing.
+        query (Select): The base query with filters applied.
+
+    Returns:
+        tuple[Statement, Statement]: The first page and next page statements.
+    """
+    query = query \
+        .order_by(STORED_MATCHES.c.date.asc(), STORED_MATCHES.c.id.asc()) \
+        .limit(bindparam("limit"))
+    after = tuple_(STORED_MATCHES.c.date, STORED_MATCHES.c.id) > tuple_(
+        bindparam("after_date", type_=match_table.c.date.type),
+        bindparam("after_id", type_=match_table.c.id.type),
+    )
+
+    return (
+        statements.register(f"matches.{name}", query),
+        statements.register(f"matches.{name}_after", query.where(after)),
+    )
+
+
+ALL_PAGE = _page_statements("all", select(STORED_MATCHES))
+BY_TEAM_PAGE = _page_statements(
+    "by_team",
+    select(STORED_MATCHES).where(
+        or_(
+            STORED_MATCHES.c.home_team_id == bindparam("team_id"),
+            STORED_MATCHES.c.away_team_id == bindparam("team_id"),
+        )
+    ),
+)
+# Filters of the match listing; the date range is served by the indexes
+# led by the league, the teams or the date and followed by the date.
+RANGE_PARAMS = {
+    "date_from": STORED_MATCHES.c.date >=
+        bindparam("date_from", type_=match_table.c.date.type),
+    "date_to": STORED_MATCHES.c.date <
+        bindparam("date_to", type_=match_table.c.date.type),
+    "league_id": STORED_MATCHES.c.league_id ==
+        bindparam("league_id", type_=Integer),
+    "team_id": or_(
+        STORED_MATCHES.c.home_team_id == bindparam("team_id", type_=Integer),
+        STORED_MATCHES.c.away_team_id == bindparam("team_id", type_=Integer),
+    ),
+    "ids": STORED_MATCHES.c.id ==
+        any_(bindparam("ids", type_=ARRAY(Integer))),
+}
+
+_ranges: dict[tuple[str, ...], tuple[Statement, Statement]] = {}
+
+
+def _range_statements(filters: MatchFilter) -> tuple[Statement, Statement]:
+    """A function getting the statements listing matches with given filters.
+
+    Only the predicates of the set filters are emitted, so every
+    combination is planned for the index matching it. The statements are
+    registered once per combination of the filters.
+
+    Args:
+        filters (MatchFilter): The listing filters.
+
+    Returns:
+        tuple[Statement, Statement]: The first page and next page statements.
+    """
+    params = tuple(
+        name for name in RANGE_PARAMS if getattr(filters, name) is not None
+    )
+
+    if params not in _ranges:
+        _ranges[params] = _page_statements(
+            f"list[{','.join(params)}]",
+            select(STORED_MATCHES).where(
+                *(RANGE_PARAMS[name] for name in params)
+            ),
+        )
+
+    return _ranges[params]
+
+
+BY_LEAGUE = statements.register(
+    "matches.by_league",
+    select(STORED_MATCHES)
+    .where(STORED_MATCHES.c.league_id == bindparam("league_id"))
+    .order_by(STORED_MATCHES.c.date.asc()),
+)
+_home = team_table.alias("home_team")
+_away = team_table.alias("away_team")
+FIXTURES = (
+    select(STORED_MATCHES, _home.c.name, _away.c.name)
+    .select_from(
+        STORED_MATCHES
+        .join(_home, _home.c.id == STORED_MATCHES.c.home_team_id)
+        .join(_away, _away.c.id == STORED_MATCHES.c.away_team_id)
+    )
+    .order_by(STORED_MATCHES.c.date.asc(), STORED_MATCHES.c.id.asc())
+)
+FIXTURES_BY_LEAGUE = statements.register(
+    "matches.fixtures_by_league",
+    FIXTURES.where(STORED_MATCHES.c.league_id == bindparam("league_id")),
+)
+FIXTURES_BY_TEAM = statements.register(
+    "matches.fixtures_by_team",
+    FIXTURES.where(
+        or_(
+            STORED_MATCHES.c.home_team_id == bindparam("team_id"),
+            STORED_MATCHES.c.away_team_id == bindparam("team_id"),
+        )
+    ),
+)
+# Lookups and writes of single matches name the league as well, so they
+# read and lock the partition of the league only.
+BY_ID = statements.register(
+    "matches.by_id",
+    select(STORED_MATCHES)
+    .where(STORED_MATCHES.c.league_id == bindparam("league_id", type_=Integer))
+    .where(STORED_MATCHES.c.id == bindparam("match_id", type_=Integer)),
+)
+BY_IDS = statements.register(
+    "matches.by_ids",
+    select(STORED_MATCHES)
+    .where(STORED_MATCHES.c.league_id == bindparam("league_id", type_=Integer))
+    .where(
+        STORED_MATCHES.c.id == any_(
+            bindparam("match_ids", type_=ARRAY(Integer))
+        )
+    ),
+)
+DELETE = statements.register(
+    "matches.delete",
+    match_table.delete()
+    .where(match_table.c.league_id == bindparam("league_id", type_=Integer))
+    .where(match_table.c.id == bindparam("match_id", type_=Integer))
+    .returning(*match_table.c),
+)
+# The league of a match known by its ID only. The primary key indexes of
+# every partition are probed, without reading or locking the rows.
+LEAGUE_OF = statements.register(
+    "matches.league_of",
+    select(STORED_MATCHES.c.league_id)
+    .where(STORED_MATCHES.c.id == bindparam("match_id", type_=Integer)),
+)
+
+
+COUNTED_STATUSES = [status.value for status in MatchStatus]
+
+# Applies the status changes of a write to the league counters and closes
+# the season when every match of the generated schedule is finished,
+# touching one row per league. Leagues without a generated schedule are
+# never closed by the counters.
+_counted = insert(league_counter_table).values(
+    league_id=bindparam("league_id", type_=Integer),
+    expected=bindparam("expected", type_=Integer),
+    **{
+        status: bindparam(status, type_=Integer)
+        for status in COUNTED_STATUSES
+    },
+)
+_counted = _counted.on_conflict_do_update(
+    index_elements=[league_counter_table.c.league_id],
+    set_={
+        "expected": func.coalesce(
+            _counted.excluded.expected,
+            league_counter_table.c.expected,
+        ),
+        **{
+            status: league_counter_table.c[status] + _counted.excluded[status]
+            for status in COUNTED_STATUSES
+        },
+    },
+).returning(*league_counter_table.c).cte("counted")
+_closed = (
+    league_table.update()
+    .where(league_table.c.id == _counted.c.league_id)
+    .where(_counted.c.scheduled == 0)
+    .where(_counted.c.pending == 0)
+    .where(_counted.c.finished >= _counted.c.expected)
+    .where(league_table.c.status == constant(
+        LeagueStatus.ACTIVE.value,
+        league_table.c.status.type,
+    ))
+    .values(status=constant(
+        LeagueStatus.ARCHIVED.value,
+        league_table.c.status.type,
+    ))
+    .returning(league_table.c.id)
+    .cte("closed")
+)
+COUNT = statements.register("matches.count", select(_closed))
+
+# Inserts the matches of a generated schedule, passed as arrays of their
+# columns, unless the league already has matches.
+_league_id = bindparam("league_id", type_=Integer)
+_fixtures = func.unnest(
+    bindparam("home_team_ids", type_=ARRAY(Integer)),
+    bindparam("away_team_ids", type_=ARRAY(Integer)),
+    bindparam("dates", type_=ARRAY(match_table.c.date.type)),
+    bindparam("submitted_by", type_=ARRAY(Integer)),
+).table_valued(
+    "home_team_id",
+    "away_team_id",
+    "date",
+    "submitted_by",
+).render_derived(name="fixtures")
+SCHEDULE = statements.register(
+    "matches.schedule",
+    match_table.insert()
+    .from_select(
+        [
+            "league_id",
+            "home_team_id",
+            "away_team_id",
+            "date",
+            "status",
+            "submitted_by",
+        ],
+        select(
+            _league_id,
+            _fixtures.c.home_team_id,
+            _fixtures.c.away_team_id,
+            _fixtures.c.date,
+            constant(MatchStatus.SCHEDULED.value, match_table.c.status.type),
+            _fixtures.c.submitted_by,
+        )
+        .where(
+            ~exists(
+                select(match_table.c.id)
+                .where(match_table.c.league_id == _league_id)
+            )
+        ),
+    )
+    .returning(*match_table.c),
+)
 
-class MatchRepository(IMatchRepository):
 
-    async def create_match(self, data: MatchBroker) -> Any | None:
-        """Create a new match."""
+class MatchRepository(IMatchRepository):
 
-        league_query = (
-            league_table.select()
+    def __init__(
+        self,
+        standings_cache: LRUCache,
+        calendar_cache: LRUCache,
+    ) -> None:
+        """The initializer of the `match repository`.
+
+        Args:
+            standings_cache (LRUCache): The cache of league standings
+                invalidated on match changes.
+            calendar_cache (LRUCache): The cache of calendar feeds
+                invalidated on match changes.
+        """
+        self._standings_cache = standings_cache
+        self._calendar_cache = calendar_cache
+
+    async def create_match(
+        self,
+        data: MatchBroker,
+    ) -> Match | MatchCreateFailure:
+        """Create a new match.
+
+        The league, ownership and team checks are evaluated in the same
+        statement as the insert, which only happens when all of them pass.
+        """
+
+        league = (
+            select(league_table.c.id, league_table.c.owner_id)
             .where(
                 (league_table.c.id == data.league_id) &
                 (league_table.c.status == LeagueStatus.ACTIVE)
             )
+            .cte("league")
         )
-        league = await database.fetch_one(league_query)
-
-        if not league:
-            return None
-
-        if league['owner_id'] != data.submitted_by:
-            return None
-
-        team_home_query = (
-            team_table.select()
+        home_team = (
+            select(team_table.c.id)
             .where(
                 (team_table.c.id == data.home_team_id) &
                 (team_table.c.league_id == data.league_id)
             )
+            .cte("home_team")
         )
-        team_home = await database.fetch_one(team_home_query)
-
-        if not team_home:
-            return None
-
-        team_away_query = (
-            team_table.select()
+        away_team = (
+            select(team_table.c.id)
             .where(
                 (team_table.c.id == data.away_team_id) &
                 (team_table.c.league_id == data.league_id)
             )
+            .cte("away_team")
         )
-        team_away = await database.fetch_one(team_away_query)
+        is_owner = league.c.owner_id == data.submitted_by
+
+        source = (
+            select(
+                league.c.id,
+                cast(data.home_team_id, match_table.c.home_team_id.type),
+                cast(data.away_team_id, match_table.c.away_team_id.type),
+                cast(data.date, match_table.c.date.type),
+                cast(MatchStatus.SCHEDULED.value, match_table.c.status.type),
+                cast(data.submitted_by, match_table.c.submitted_by.type),
+            )
+            .where(
+                is_owner &
+                exists(select(home_team.c.id)) &
+                exists(select(away_team.c.id))
+            )
+        )
+        inserted = (
+            match_table.insert()
+            .from_select(
+                [
+                    "league_id",
+                    "home_team_id",
+                    "away_team_id",
+                    "date",
+                    "status",
+                    "submitted_by",
+                ],
+                source,
+            )
+            .returning(*match_table.c)
+            .cte("inserted")
+        )
+        probe = select(literal_column("1").label("probe")).subquery("probe")
 
-        if not team_away:
-            return None
+        query = (
+            select(
+                inserted,
+                exists(select(league.c.id)).label("league_found"),
+                exists(select(league.c.id).where(is_owner)).label("is_owner"),
+                exists(select(home_team.c.id)).label("home_team_found"),
+                exists(select(away_team.c.id)).label("away_team_found"),
+            )
+            .select_from(probe.outerjoin(inserted, true()))
+        )
+        async with database.transaction():
+            result = await database.fetch_one(query)
 
-        insert_data = data.model_dump()
-        insert_data['status'] = 'scheduled'
-        
-        query = match_table.insert().values(**insert_data)
-        new_match_id = await database.execute(query)
-        new_match = await self._get_match_by_id(new_match_id)
+            if result["id"] is not None:
+                await self._count_statuses(
+                    data.league_id,
+                    Counter({MatchStatus.SCHEDULED.value: 1}),
+                )
 
-        return Match(**dict(new_match)) if new_match else None
+        if result["id"] is not None:
+            self._standings_cache.invalidate(data.league_id)
+            self._calendar_cache.invalidate(data.league_id)
+            return map_match(result)
 
-    async def get_match_by_id(self, match_id: int) -> Any | None:
-        """The method getting match by ID."""
+        if not result["league_found"]:
+            return MatchCreateFailure.LEAGUE_NOT_FOUND
 
-        match = await self._get_match_by_id(match_id)
+        if not result["is_owner"]:
+            return MatchCreateFailure.NOT_LEAGUE_OWNER
 
-        return Match(**dict(match)) if match else None
-        
-    async def get_all_matches(self) -> Iterable[Any]:
-        """The method getting all matches."""
+        if not result["home_team_found"]:
+            return MatchCreateFailure.HOME_TEAM_NOT_IN_LEAGUE
+
+        return MatchCreateFailure.AWAY_TEAM_NOT_IN_LEAGUE
+
+    async def create_schedule(
+        self,
+        league_id: int,
+        data: Iterable[MatchBroker],
+    ) -> Iterable[Match] | ScheduleFailure:
+        """Create the matches of a generated schedule in one statement.
+
+        The league row is locked first, so concurrent requests are handled
+        one after another, and the matches are only inserted when the
+        league has none yet. Their number is stored as the expected number
+        of matches of the season.
+        """
+
+        fixtures = list(data)
+
+        async with database.transaction():
+            if not await LOCK_ACTIVE.fetch_value(league_id=league_id):
+                return ScheduleFailure.LEAGUE_NOT_ACTIVE
+
+            created = await SCHEDULE.fetch_all(
+                league_id=league_id,
+                home_team_ids=[match.home_team_id for match in fixtures],
+                away_team_ids=[match.away_team_id for match in fixtures],
+                dates=[match.date for match in fixtures],
+                submitted_by=[match.submitted_by for match in fixtures],
+            )
+            if not created:
+                return ScheduleFailure.LEAGUE_HAS_MATCHES
+
+            await self._count_statuses(
+                league_id,
+                Counter({MatchStatus.SCHEDULED.value: len(created)}),
+                expected=len(created),
+            )
 
-        query = match_table.select().order_by(match_table.c.date.asc())
-        matches = await database.fetch_all(query)
+        self._standings_cache.invalidate(league_id)
+        self._calendar_cache.invalidate(league_id)
 
-        return [Match(**dict(match)) for match in matches]
+        return [map_match(match) for match in created]
+
+    async def get_league_id(self, match_id: int) -> int | None:
+        """The method getting the league of a match by the match ID."""
+
+        return await LEAGUE_OF.fetch_value(match_id=match_id)
+
+    async def get_match_by_id(
+        self,
+        match_id: int,
+        league_id: int,
+    ) -> Any | None:
+        """The method getting match by ID within its league."""
+
+        match = await self._get_match_by_id(match_id, league_id)
+
+        return map_match(match) if match else None
+
+    async def get_matches_by_ids(
+        self,
+        league_id: int,
+        match_ids: list[int],
+    ) -> Iterable[Match]:
+        """The method getting matches of a league by their IDs."""
+
+        matches = await BY_IDS.fetch_all(
+            league_id=league_id,
+            match_ids=match_ids,
+        )
+
+        return [map_match(match) for match in matches]
+        
+    async def get_all_matches(
+        self,
+        limit: int,
+        after: str | None = None,
+    ) -> PageDTO[Match]:
+        """The method getting a page of all matches."""
+
+        return await self._fetch_page(ALL_PAGE, limit, after)
 
     async def get_matches_by_league(self, league_id: int) -> Iterable[Any]:
         """The method getting all matches by league ID."""
 
-        query = match_table \
-            .select() \
-            .where(match_table.c.league_id == league_id) \
-            .order_by(match_table.c.date.asc())
-        matches = await database.fetch_all(query)
+        matches = await BY_LEAGUE.fetch_all(league_id=league_id)
 
-        return [Match(**dict(match)) for match in matches]
+        return [map_match(match) for match in matches]
 
-    async def get_matches_by_team(self, team_id: int) -> Iterable[Any]:
-        """The method getting all matches by team ID (home or away)."""
+    async def get_matches_by_team(
+        self,
+        team_id: int,
+        limit: int,
+        after: str | None = None,
+    ) -> PageDTO[Match]:
+        """The method getting a page of matches by team ID (home or away)."""
 
-        query = match_table \
-            .select() \
-            .where(
-                or_(
-                    match_table.c.home_team_id == team_id,
-                    match_table.c.away_team_id == team_id
-                )
-            ) \
-            .order_by(match_table.c.date.asc())
-        matches = await database.fetch_all(query)
+        return await self._fetch_page(
+            BY_TEAM_PAGE,
+            limit,
+            after,
+            team_id=team_id,
+        )
+
+    async def get_fixtures_by_league(
+        self,
+        league_id: int,
+    ) -> Iterable[FixtureDTO]:
+        """The method getting the matches of a league with team names."""
 
-        return [Match(**dict(match)) for match in matches]
+        fixtures = await FIXTURES_BY_LEAGUE.fetch_all(league_id=league_id)
+
+        return [map_fixture(fixture) for fixture in fixtures]
+
+    async def get_fixtures_by_team(
+        self,
+        team_id: int,
+    ) -> Iterable[FixtureDTO]:
+        """The method getting the matches of a team with team names."""
+
+        fixtures = await FIXTURES_BY_TEAM.fetch_all(team_id=team_id)
+
+        return [map_fixture(fixture) for fixture in fixtures]
+
+    async def get_filtered(
+        self,
+        filters: MatchFilter,
+        limit: int,
+        after: str | None = None,
+    ) -> PageDTO[Match]:
+        """The method getting a page of matches matching the filters."""
+
+        return await self._fetch_page(
+            _range_statements(filters),
+            limit,
+            after,
+            **filters.model_dump(),
+        )
 
     async def update_match(
         self, 
         match_id: int, 
+        league_id: int,
         data: MatchUpdateIn
     ) -> Match | None:
         """Update match score and/or date."""
 
-        if not await self._get_match_by_id(match_id):
-            return None
-        
         update_data = data.model_dump(exclude_none=True)
         
         if not update_data:
-            return await self.get_match_by_id(match_id)
+            return await self.get_match_by_id(match_id, league_id)
 
         # Jeśli podano wynik, ustaw status na finished
         if 'home_score' in update_data and 'away_score' in update_data:
             update_data['status'] = 'finished'
 
+        previous = (
+            select(
+                match_table.c.id,
+                match_table.c.status,
+                match_table.c.home_score,
+                match_table.c.away_score,
+            )
+            .where(match_table.c.league_id == league_id)
+            .where(match_table.c.id == match_id)
+            .with_for_update()
+            .subquery("previous")
+        )
         query = (
             match_table.update()
-            .where(match_table.c.id == match_id)
+            .where(match_table.c.league_id == league_id)
+            .where(match_table.c.id == previous.c.id)
             .values(**update_data)
+            .returning(
+                *match_table.c,
+                previous.c.status.label("previous_status"),
+                previous.c.home_score.label("previous_home_score"),
+                previous.c.away_score.label("previous_away_score"),
+            )
         )
-        await database.execute(query)
 
-        updated_match = await self._get_match_by_id(match_id)
-        return Match(**dict(updated_match)) if updated_match else None
+        async with database.transaction():
+            updated_match = await database.fetch_one(query)
 
-    async def delete_match(self, match_id: int) -> bool:
+            if not updated_match:
+                return None
+
+            changes = []
+            if updated_match["previous_status"] == MatchStatus.FINISHED:
+                changes += _standings_change(
+                    updated_match["home_team_id"],
+                    updated_match["away_team_id"],
+                    updated_match["previous_home_score"],
+                    updated_match["previous_away_score"],
+                    sign=-1,
+                )
+            if updated_match["status"] == MatchStatus.FINISHED:
+                changes += _standings_change(
+                    updated_match["home_team_id"],
+                    updated_match["away_team_id"],
+                    updated_match["home_score"],
+                    updated_match["away_score"],
+                )
+            await self._update_standings(changes)
+
+            if updated_match["previous_status"] != updated_match["status"]:
+                await self._count_statuses(
+                    updated_match["league_id"],
+                    Counter({
+                        updated_match["previous_status"]: -1,
+                        updated_match["status"]: 1,
+                    }),
+                )
+
+        self._standings_cache.invalidate(updated_match["league_id"])
+        self._calendar_cache.invalidate(updated_match["league_id"])
+
+        return map_match(updated_match)
+
+    async def delete_match(self, match_id: int, league_id: int) -> bool:
         """The method deleting a match from the data storage."""
 
-        if await self._get_match_by_id(match_id):
-            query = match_table \
-                .delete() \
-                .where(match_table.c.id == match_id)
-            await database.execute(query)
+        async with database.transaction():
+            deleted_match = await DELETE.fetch_one(
+                league_id=league_id,
+                match_id=match_id,
+            )
 
-            return True
+            if not deleted_match:
+                return False
+
+            if deleted_match["status"] == MatchStatus.FINISHED:
+                await self._update_standings(_standings_change(
+                    deleted_match["home_team_id"],
+                    deleted_match["away_team_id"],
+                    deleted_match["home_score"],
+                    deleted_match["away_score"],
+                    sign=-1,
+                ))
+
+            await self._count_statuses(
+                deleted_match["league_id"],
+                Counter({deleted_match["status"]: -1}),
+            )
 
-        return False
+        self._standings_cache.invalidate(deleted_match["league_id"])
+        self._calendar_cache.invalidate(deleted_match["league_id"])
 
-    async def _get_match_by_id(self, match_id: int) -> Record | None:
-        """A private method getting match from the DB based on its ID."""
+        return True
+
+    async def _update_standings(self, changes: list[dict]) -> None:
+        """A private method applying result changes to the stored standings.
+
+        Teams without a stored row are skipped, their row is recalculated
+        in full when the league table is read.
+
+        Args:
+            changes (list[dict]): The per-team changes of the statistics.
+        """
+
+        totals: dict[int, dict] = {}
+        for change in changes:
+            team_totals = totals.setdefault(
+                change["team_id"],
+                dict.fromkeys(STANDINGS_COLUMNS, 0),
+            )
+            for name in STANDINGS_COLUMNS:
+                team_totals[name] += change[name]
+
+        if not totals:
+            return
 
         query = (
-            match_table.select()
-            .where(match_table.c.id == match_id)
+            standings_table.update()
+            .where(standings_table.c.team_id.in_(list(totals)))
+            .values({
+                name: standings_table.c[name] + case(
+                    {team_id: stats[name] for team_id, stats in totals.items()},
+                    value=standings_table.c.team_id,
+                    else_=0,
+                )
+                for name in STANDINGS_COLUMNS
+            })
         )
+        await database.execute(query)
+
+    async def _count_statuses(
+        self,
+        league_id: int,
+        changes: Counter[str],
+        expected: int | None = None,
+    ) -> None:
+        """A private method applying match status changes to the counters.
+
+        It has to run in the transaction of the write changing the
+        statuses. When the last match of the generated schedule of an
+        active league is finished, the league is archived in the same
+        transaction.
+
+        Args:
+            league_id (int): The ID of the league.
+            changes (Counter[str]): The changes of the numbers of matches
+                per status.
+            expected (int | None, optional): The number of matches of the
+                generated schedule. Defaults to None, keeping the stored
+                number.
+        """
+
+        closed = await COUNT.fetch_one(
+            league_id=league_id,
+            expected=expected,
+            **{status: changes[status] for status in COUNTED_STATUSES},
+        )
+
+        if closed:
+            await database.execute(archive_query(league_id))
+
+    async def _get_match_by_id(
+        self,
+        match_id: int,
+        league_id: int,
+    ) -> Record | None:
+        """A private method getting match from the DB based on its ID."""
+
+        return await BY_ID.fetch_one(match_id=match_id, league_id=league_id)
+
+    async def _fetch_page(
+        self,
+        page: tuple[Statement, Statement],
+        limit: int,
+        after: str | None,
+        **params: Any,
+    ) -> PageDTO[Match]:
+        """A private method fetching a page of matches ordered by date and ID.
+
+        Args:
+            page (tuple[Statement, Statement]): The first page and next page
+                statements of the listing.
+            limit (int): The maximum number of matches on the page.
+            after (str | None): The cursor returned with the previous page.
+            **params (Any): The values of the listing filters.
+
+        Raises:
+            ValueError: If the cursor is malformed.
+
+        Returns:
+            PageDTO[Match]: The page of matches with the next cursor.
+        """
+        first, following = page
+
+        if after:
+            date, match_id = decode_cursor(after, str, int)
+            rows = await following.fetch_all(
+                limit=limit + 1,
+                after_date=datetime.fromisoformat(date),
+                after_id=match_id,
+                **params,
+            )
+        else:
+            rows = await first.fetch_all(limit=limit + 1, **params)
+
+        matches = [map_match(match) for match in rows[:limit]]
+
+        next_cursor = None
+        if len(rows) > limit:
+            next_cursor = encode_cursor(
+                matches[-1].date.isoformat(),
+                matches[-1].id,
+            )
 
-        return await database.fetch_one(query)
+        return PageDTO[Match](items=matches, next_cursor=next_cursor)
+
+
+STANDINGS_COLUMNS = [c.name for c in standings_table.c if not c.primary_key]
+
+
+def _standings_change(
+    home_team_id: int,
+    away_team_id: int,
+    home_score: int | None,
+    away_score: int | None,
+    sign: int = 1,
+) -> list[dict]:
+    """A function computing how a finished match changes the standings.
+
+    Args:
+        home_team_id (int): The ID of the home team.
+        away_team_id (int): The ID of the away team.
+        home_score (int | None): The goals of the home team.
+        away_score (int | None): The goals of the away team.
+        sign (int, optional): 1 to add the result, -1 to remove it.
+            Defaults to 1.
+
+    Returns:
+        list[dict]: The changes of the home and away team statistics.
+    """
+    home_score = home_score or 0
+    away_score = away_score or 0
+
+    def change(team_id: int, scored: int, conceded: int) -> dict:
+        won = int(scored > conceded)
+        drawn = int(scored == conceded)
+
+        return {
+            "team_id": team_id,
+            "played": sign,
+            "won": sign * won,
+            "drawn": sign * drawn,
+            "lost": sign * int(scored < conceded),
+            "goals_for": sign * scored,
+            "goals_against": sign * conceded,
+            "points": sign * (3 * won + drawn),
+        }
+
+    return [
+        change(home_team_id, home_score, away_score),
+        change(away_team_id, away_score, home_score),
+    ]
 
@@ -0,0 +1,240 @@
+"""A repository for standings entity."""
+
+from typing import Any, Iterable
+
+from sqlalchemy import (
+    FromClause,
+    Integer,
+    Select,
+    bindparam,
+    func,
+    select,
+    union_all,
+)
+from sqlalchemy.dialects.postgresql import insert
+
+from src.core.domain.match import MatchStatus
+from src.core.domain.standing import Standing
+from src.core.repositories.istandings import IStandingsRepository
+from src.db import (
+    database,
+    match_table,
+    standings_snapshot_table,
+    standings_table,
+    team_table,
+)
+from src.infrastructure.utils.statements import statements
+
+SNAPSHOT = statements.register(
+    "standings.snapshot",
+    standings_snapshot_table.select()
+    .where(standings_snapshot_table.c.league_id == bindparam("league_id"))
+    .order_by(standings_snapshot_table.c.position.asc()),
+)
+
+
+def standings_query(
+    league_id: Any,
+    matches: FromClause = match_table,
+) -> Select:
+    """A function building the query calculating a league table.
+
+    Every finished match is taken twice, once from the perspective of
+    each team, and aggregated per team, so only one row per team is
+    returned.
+
+    Args:
+        league_id (Any): The ID of the league or its placeholder.
+        matches (FromClause, optional): The relation with the matches of
+            the league, e.g. the rows returned by a data-modifying CTE.
+            Defaults to the matches table.
+
+    Returns:
+        Select: The query of the standings ordered by their position.
+    """
+    finished = (
+        (matches.c.league_id == league_id) &
+        (matches.c.status == MatchStatus.FINISHED)
+    )
+    home_score = func.coalesce(matches.c.home_score, 0)
+    away_score = func.coalesce(matches.c.away_score, 0)
+    sides = union_all(
+        select(
+            matches.c.home_team_id.label("team_id"),
+            home_score.label("scored"),
+            away_score.label("conceded"),
+        ).where(finished),
+        select(
+            matches.c.away_team_id.label("team_id"),
+            away_score.label("scored"),
+            home_score.label("conceded"),
+        ).where(finished),
+    ).subquery("sides")
+
+    won = func.count().filter(sides.c.scored > sides.c.conceded)
+    drawn = func.count().filter(sides.c.scored == sides.c.conceded)
+    goals_for = func.coalesce(func.sum(sides.c.scored), 0)
+    goals_against = func.coalesce(func.sum(sides.c.conceded), 0)
+    points = 3 * won + drawn
+    position = func.row_number().over(
+        order_by=[
+            points.desc(),
+            (goals_for - goals_against).desc(),
+            goals_for.desc(),
+            team_table.c.name.asc(),
+            team_table.c.id.asc(),
+        ],
+    )
+
+    return (
+        select(
+            team_table.c.id.label("team_id"),
+            team_table.c.name.label("team_name"),
+            func.count(sides.c.team_id).label("played"),
+            won.label("won"),
+            drawn.label("drawn"),
+            func.count().filter(
+                sides.c.scored < sides.c.conceded
+            ).label("lost"),
+            goals_for.label("goals_for"),
+            goals_against.label("goals_against"),
+            (goals_for - goals_against).label("goal_difference"),
+            points.label("points"),
+            position.label("position"),
+        )
+        .select_from(
+            team_table.outerjoin(sides, sides.c.team_id == team_table.c.id)
+        )
+        .where(team_table.c.league_id == league_id)
+        .group_by(team_table.c.id, team_table.c.name)
+        .order_by(position)
+    )
+
+
+CALCULATE = statements.register(
+    "standings.calculate",
+    standings_query(bindparam("league_id", type_=Integer)),
+)
+
+# Stores the calculated rows of the teams of a league which have none yet.
+# Existing rows already carry the changes applied by the writes, so they
+# are never overwritten.
+_calculated = standings_query(
+    bindparam("league_id", type_=Integer),
+).subquery("calculated")
+FILL = statements.register(
+    "standings.fill",
+    insert(standings_table)
+    .from_select(
+        [column.name for column in standings_table.c],
+        select(*(_calculated.c[column.name] for column in standings_table.c)),
+    )
+    .on_conflict_do_nothing(index_elements=[standings_table.c.team_id])
+    .returning(standings_table.c.team_id),
+)
+
+# The stored league table. Teams without a stored row are returned with
+# a NULL `standing_team_id`.
+_goal_difference = (
+    standings_table.c.goals_for - standings_table.c.goals_against
+)
+STORED = statements.register(
+    "standings.stored",
+    select(
+        team_table.c.id.label("team_id"),
+        team_table.c.name.label("team_name"),
+        standings_table.c.team_id.label("standing_team_id"),
+        standings_table.c.played,
+        standings_table.c.won,
+        standings_table.c.drawn,
+        standings_table.c.lost,
+        standings_table.c.goals_for,
+        standings_table.c.goals_against,
+        _goal_difference.label("goal_difference"),
+        standings_table.c.points,
+    )
+    .select_from(
+        team_table.outerjoin(
+            standings_table,
+            standings_table.c.team_id == team_table.c.id,
+        )
+    )
+    .where(team_table.c.league_id == bindparam("league_id", type_=Integer))
+    .order_by(
+        standings_table.c.points.desc(),
+        _goal_difference.desc(),
+        standings_table.c.goals_for.desc(),
+        team_table.c.name.asc(),
+        team_table.c.id.asc(),
+    ),
+)
+
+
+class StandingsRepository(IStandingsRepository):
+    """An implementation of repository class for standings.
+
+    The rows are kept up to date by the team and match repositories,
+    which apply the changes in the same transaction as the writes.
+    """
+
+    async def get_by_league(self, league_id: int) -> Iterable[Standing] | None:
+        """The method getting the stored league table.
+
+        Args:
+            league_id (int): The ID of the league.
+
+        Returns:
+            Iterable[Standing] | None: The ordered standings, or None if
+                some team of the league has no stored row yet.
+        """
+
+        rows = await STORED.fetch_all(league_id=league_id)
+
+        if any(row["standing_team_id"] is None for row in rows):
+            return None
+
+        return [Standing(**dict(row)) for row in rows]
+
+    async def calculate_by_league(self, league_id: int) -> Iterable[Standing]:
+        """The method calculating the league table in the database.
+
+        Args:
+            league_id (int): The ID of the league.
+
+        Returns:
+            Iterable[Standing]: The ordered standings.
+        """
+
+        rows = await CALCULATE.fetch_all(league_id=league_id)
+
+        return [Standing(**dict(row)) for row in rows]
+
+    async def get_snapshot(self, league_id: int) -> Iterable[Standing] | None:
+        """The method getting the final table frozen when archiving a league.
+
+        Args:
+            league_id (int): The ID of the league.
+
+        Returns:
+            Iterable[Standing] | None: The ordered standings, or None if
+                the league has no snapshot.
+        """
+        rows = await SNAPSHOT.fetch_all(league_id=league_id)
+
+        if not rows:
+            return None
+
+        return [Standing.model_construct(**dict(row)) for row in rows]
+
+    async def fill_standings(self, league_id: int) -> None:
+        """The method storing calculated rows of teams which have none.
+
+        The rows are calculated and inserted by one statement. Rows which
+        already exist are kept, as they may already include changes that
+        were applied since the calculation read the matches.
+
+        Args:
+            league_id (int): The ID of the league.
+        """
+
+        await FILL.fetch_all(league_id=league_id)
@@ -3,7 +3,17 @@
 from typing import Any, Iterable
 
 from asyncpg import Record  # type: ignore
-from sqlalchemy import select, join
+from sqlalchemy import (
+    Integer,
+    any_,
+    bindparam,
+    cast,
+    exists,
+    select,
+    join,
+    tuple_,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
 
 from src.core.domain.team import TeamBroker, Team, TeamIn
 from src.core.repositories.iteam import ITeamRepository
@@ -11,56 +21,125 @@ from src.db import (
     database, 
     team_table, 
     league_table,
+    standings_table,
 )
 from src.core.domain.league import LeagueStatus
+from src.infrastructure.dto.pagedto import PageDTO
+from src.infrastructure.utils.cache import LRUCache
+from src.infrastructure.utils.cursor import decode_cursor, encode_cursor
+from src.infrastructure.utils.ics import team_league_key
+from src.infrastructure.utils.mappers import map_team
+from src.infrastructure.utils.statements import statements
+
+ALL_TEAMS = team_table \
+    .select() \
+    .order_by(team_table.c.name.asc(), team_table.c.id.asc()) \
+    .limit(bindparam("limit"))
+
+ALL_PAGE = statements.register("teams.all", ALL_TEAMS)
+ALL_PAGE_AFTER = statements.register(
+    "teams.all_after",
+    ALL_TEAMS.where(
+        tuple_(team_table.c.name, team_table.c.id) >
+        tuple_(
+            bindparam("after_name", type_=team_table.c.name.type),
+            bindparam("after_id", type_=team_table.c.id.type),
+        )
+    ),
+)
+BY_LEAGUE = statements.register(
+    "teams.by_league",
+    team_table
+    .select()
+    .where(team_table.c.league_id == bindparam("league_id"))
+    .order_by(team_table.c.name.asc()),
+)
+BY_ID = statements.register(
+    "teams.by_id",
+    team_table.select().where(team_table.c.id == bindparam("team_id")),
+)
+BY_IDS = statements.register(
+    "teams.by_ids",
+    team_table.select().where(
+        team_table.c.id == any_(bindparam("team_ids", type_=ARRAY(Integer)))
+    ),
+)
+
 
 class TeamRepository(ITeamRepository):
 
+    def __init__(
+        self,
+        standings_cache: LRUCache,
+        calendar_cache: LRUCache,
+    ) -> None:
+        """The initializer of the `team repository`.
+
+        Args:
+            standings_cache (LRUCache): The cache of league standings
+                invalidated on team changes.
+            calendar_cache (LRUCache): The cache of calendar feeds, which
+                show team names, invalidated on team changes.
+        """
+        self._standings_cache = standings_cache
+        self._calendar_cache = calendar_cache
 
     async def create_team(self, data: TeamBroker) -> Any | None:
         """The method adding new team to the data storage.
 
+        The league eligibility and captain checks are evaluated in the same
+        statement as the insert, which only happens when both of them pass.
+
         Args:
             data (TeamBroker): The details of the new team.
 
-        Returns:
-            Team: Full details of the newly added team.
-
         Returns:
             Any | None: The newly added team.
         """
 
-        league_query = (
-            league_table.select()
+        league = (
+            select(league_table.c.id, league_table.c.owner_id)
             .where(
                 (league_table.c.id == data.league_id) &
                 (league_table.c.status == LeagueStatus.ACTIVE) &
                 (league_table.c.is_private == False)
             )
+            .cte("league")
         )
-        league = await database.fetch_one(league_query)
-        
-        if not league:
-            return None
-        
-        if league['owner_id'] != data.captain_id:
-            existing_team_query = (
-                team_table.select()
-                .where(
-                    (team_table.c.league_id == data.league_id) &
-                    (team_table.c.captain_id == data.captain_id)
-                )
+        has_team = exists(
+            select(team_table.c.id)
+            .where(
+                (team_table.c.league_id == data.league_id) &
+                (team_table.c.captain_id == data.captain_id)
             )
-            existing_team = await database.fetch_one(existing_team_query)
-            
-            if existing_team:
-                return None
+        )
 
-        query = team_table.insert().values(**data.model_dump())
-        new_team_id = await database.execute(query)
-        new_team = await self._get_team_by_id(new_team_id)
+        source = (
+            select(
+                cast(data.name, team_table.c.name.type),
+                league.c.id,
+                cast(data.captain_id, team_table.c.captain_id.type),
+            )
+            .where((league.c.owner_id == data.captain_id) | ~has_team)
+        )
+        inserted = team_table \
+            .insert() \
+            .from_select(["name", "league_id", "captain_id"], source) \
+            .returning(*team_table.c) \
+            .cte("inserted")
+        standing = standings_table \
+            .insert() \
+            .from_select(["team_id"], select(inserted.c.id)) \
+            .cte("standing")
+        query = select(inserted).add_cte(standing)
+        new_team = await database.fetch_one(query)
+
+        if not new_team:
+            return None
 
-        return Team(**dict(new_team)) if new_team else None
+        self._standings_cache.invalidate(new_team["league_id"])
+
+        return map_team(new_team)
 
     async def get_team_by_id(self, team_id: int) -> Any | None:
         """The method getting team by ID.
@@ -73,14 +152,55 @@ class TeamRepository(ITeamRepository):
         """
         team = await self._get_team_by_id(team_id)
 
-        return Team(**dict(team)) if team else None
+        return map_team(team) if team else None
+
+    async def get_teams_by_ids(self, team_ids: list[int]) -> Iterable[Team]:
+        """The method getting teams by their IDs.
+
+        Args:
+            team_ids (list[int]): The IDs of the teams.
+
+        Returns:
+            Iterable[Team]: The existing teams, in no particular order.
+        """
+        teams = await BY_IDS.fetch_all(team_ids=team_ids)
+
+        return [map_team(team) for team in teams]
 
-    async def get_all_teams(self) -> Iterable[Any]:
+    async def get_all_teams(
+        self,
+        limit: int,
+        after: str | None = None,
+    ) -> PageDTO[Team]:
+        """The method getting a page of all teams ordered by name.
 
-        query = team_table.select().order_by(team_table.c.name.asc())
-        teams = await database.fetch_all(query)
+        Args:
+            limit (int): The maximum number of teams on the page.
+            after (str | None): The cursor returned with the previous page.
 
-        return [Team(**dict(team)) for team in teams]
+        Raises:
+            ValueError: If the cursor is malformed.
+
+        Returns:
+            PageDTO[Team]: The page of teams with the next cursor.
+        """
+
+        if after:
+            name, team_id = decode_cursor(after, str, int)
+            rows = await ALL_PAGE_AFTER.fetch_all(
+                limit=limit + 1,
+                after_name=name,
+                after_id=team_id,
+            )
+        else:
+            rows = await ALL_PAGE.fetch_all(limit=limit + 1)
+        teams = [map_team(team) for team in rows[:limit]]
+
+        next_cursor = None
+        if len(rows) > limit:
+            next_cursor = encode_cursor(teams[-1].name, teams[-1].id)
+
+        return PageDTO[Team](items=teams, next_cursor=next_cursor)
 
     async def get_teams_by_league(
         self,
@@ -92,16 +212,12 @@ class TeamRepository(ITeamRepository):
             league_id (int): The ID of the league.
 
         Returns:
-            Iterable[Any]: The collection of the countries.
+            Iterable[Any]: The collection of the teams.
         """
 
-        query = team_table \
-            .select() \
-            .where(team_table.c.league_id == league_id) \
-            .order_by(team_table.c.name.asc())
-        teams = await database.fetch_all(query)
+        teams = await BY_LEAGUE.fetch_all(league_id=league_id)
 
-        return [Team(**dict(team)) for team in teams]
+        return [map_team(team) for team in teams]
 
     async def update_team(
         self,
@@ -110,27 +226,37 @@ class TeamRepository(ITeamRepository):
     ) -> Any | None:
         """The method updating team data in the data storage.
 
+        A team cannot move to another league, as its standings row and
+        matches belong to its league, so the team is only updated when it
+        is in the league of the data.
+
         Args:
             team_id (int): The ID of the team.
             data (TeamIn): The attributes of the team.
 
         Returns:
-            Any | None: The updated country.
+            Any | None: The updated team.
         """
 
-        if await self._get_team_by_id(team_id):
-            query = (
-                team_table.update()
-                .where(team_table.c.id == team_id)
-                .values(**data.model_dump())
-            )
-            await database.execute(query)
+        query = (
+            team_table.update()
+            .where(team_table.c.id == team_id)
+            .where(team_table.c.league_id == data.league_id)
+            .values(**data.model_dump())
+            .returning(*team_table.c)
+        )
+        team = await database.fetch_one(query)
 
-            team = await self._get_team_by_id(team_id)
+        if not team:
+            return None
 
-            return Team(**dict(team)) if team else None
+        self._standings_cache.invalidate(team["league_id"])
+        self._calendar_cache.invalidate(
+            team["league_id"],
+            team_league_key(team_id),
+        )
 
-        return None
+        return map_team(team)
 
     async def delete_team(self, team_id: int) -> bool:
         """The method deleting a team from the data storage.
@@ -141,15 +267,22 @@ class TeamRepository(ITeamRepository):
         Returns:
             bool: True if deleted successfully.
         """
-        if await self._get_team_by_id(team_id):
-            query = team_table \
-                .delete() \
-                .where(team_table.c.id == team_id)
-            await database.execute(query)
-
-            return True
+        query = team_table \
+            .delete() \
+            .where(team_table.c.id == team_id) \
+            .returning(team_table.c.league_id)
+        team = await database.fetch_one(query)
+
+        if not team:
+            return False
+
+        self._standings_cache.invalidate(team["league_id"])
+        self._calendar_cache.invalidate(
+            team["league_id"],
+            team_league_key(team_id),
+        )
 
-        return False
+        return True
 
     async def _get_team_by_id(self, team_id: int) -> Record | None:
         """A private method getting team from the DB based on its ID.
@@ -158,13 +291,7 @@ class TeamRepository(ITeamRepository):
             team_id (int): The ID of the team.
 
         Returns:
-            Any | None: Airport record if exists.
+            Any | None: Team record if exists.
         """
 
-        query = (
-            team_table.select()
-            .where(team_table.c.id == team_id)
-            .order_by(team_table.c.name.asc())
-        )
-
-        return await database.fetch_one(query)
\ No newline at end of file
+        return await BY_ID.fetch_one(team_id=team_id)
\ No newline at end of file
@@ -4,8 +4,9 @@
 from typing import Any
 
 from pydantic import UUID5
+from sqlalchemy.dialects.postgresql import insert
 
-from src.infrastructure.utils.password import hash_password
+from src.infrastructure.utils.password import PasswordHasher
 from src.core.domain.user import UserIn
 from src.core.repositories.iuser import IUserRepository
 from src.db import database, user_table
@@ -14,25 +15,35 @@ from src.db import database, user_table
 class UserRepository(IUserRepository):
     """An implementation of repository class for user."""
 
+    def __init__(self, password_hasher: PasswordHasher) -> None:
+        """The initializer of the `user repository`.
+
+        Args:
+            password_hasher (PasswordHasher): The password hashing pool.
+        """
+        self._password_hasher = password_hasher
+
     async def register_user(self, user: UserIn) -> Any | None:
         """A method registering new user.
 
         Args:
             user (UserIn): The user input data.
 
+        Raises:
+            PasswordQueueFullError: If too many hashes are pending.
+
         Returns:
             Any | None: The new user object.
         """
 
-        if await self.get_by_email(user.email):
-            return None
-
-        user.password = hash_password(user.password)
+        user.password = await self._password_hasher.hash(user.password)
 
-        query = user_table.insert().values(**user.model_dump())
-        new_user_uuid = await database.execute(query)
+        query = insert(user_table) \
+            .values(**user.model_dump()) \
+            .on_conflict_do_nothing(index_elements=[user_table.c.email]) \
+            .returning(*user_table.c)
 
-        return await self.get_by_uuid(new_user_uuid)
+        return await database.fetch_one(query)
 
     async def get_by_uuid(self, uuid: UUID5) -> Any | None:
         """A method getting user by UUID.
@@ -0,0 +1,192 @@
+"""A service for calendar feeds."""
+
+import asyncio
+from datetime import datetime, timezone
+from typing import Hashable, Iterable
+
+from src.core.repositories.ileague import ILeagueRepository
+from src.core.repositories.imatch import IMatchRepository
+from src.core.repositories.iteam import ITeamRepository
+from src.infrastructure.dto.matchdto import FixtureDTO
+from src.infrastructure.services.icalendar import ICalendarService
+from src.infrastructure.utils.cache import LRUCache
+from src.infrastructure.utils.ics import (
+    CalendarFeed,
+    render_calendar,
+    team_league_key,
+)
+
+
+class CalendarService(ICalendarService):
+    """An implementation of service class for calendar feeds.
+
+    Every feed is a separate cache entry tagged with the scope token of
+    its league, which is cached under the ID of the league. A change
+    invalidating the league drops the token, so all feeds of the league
+    go stale at once, while every feed still counts against the size of
+    the cache. The league of each cached team feed is cached as well,
+    which lets cached feeds be served without a query.
+    """
+
+    def __init__(
+        self,
+        match_repository: IMatchRepository,
+        league_repository: ILeagueRepository,
+        team_repository: ITeamRepository,
+        calendar_cache: LRUCache,
+    ) -> None:
+        """The initializer of the `calendar service`.
+
+        Args:
+            match_repository (IMatchRepository): The reference to the match
+                repository.
+            league_repository (ILeagueRepository): The reference to the
+                league repository.
+            team_repository (ITeamRepository): The reference to the team
+                repository.
+            calendar_cache (LRUCache): The cache of rendered feeds.
+        """
+        self._match_repository = match_repository
+        self._league_repository = league_repository
+        self._team_repository = team_repository
+        self._calendar_cache = calendar_cache
+
+    async def get_league_calendar(self, league_id: int) -> CalendarFeed | None:
+        """A method getting the calendar feed of a league.
+
+        Args:
+            league_id (int): The ID of the league.
+
+        Returns:
+            CalendarFeed | None: The feed if the league exists.
+        """
+        if feed := self._cached(league_id, None):
+            return feed
+
+        generation = self._calendar_cache.generation
+        league, fixtures = await asyncio.gather(
+            self._league_repository.get_by_id(league_id),
+            self._match_repository.get_fixtures_by_league(league_id),
+        )
+
+        if not league:
+            return None
+
+        feed = _render(league.name, fixtures)
+        self._store(league_id, None, feed, generation)
+
+        return feed
+
+    async def get_team_calendar(self, team_id: int) -> CalendarFeed | None:
+        """A method getting the calendar feed of a team.
+
+        Args:
+            team_id (int): The ID of the team.
+
+        Returns:
+            CalendarFeed | None: The feed if the team exists.
+        """
+        league_id = self._calendar_cache.get(team_league_key(team_id))
+        if league_id is not None and (feed := self._cached(league_id, team_id)):
+            return feed
+
+        generation = self._calendar_cache.generation
+        team, fixtures = await asyncio.gather(
+            self._team_repository.get_team_by_id(team_id),
+            self._match_repository.get_fixtures_by_team(team_id),
+        )
+
+        if not team:
+            return None
+
+        feed = _render(team.name, fixtures)
+        self._calendar_cache.set(
+            team_league_key(team_id),
+            team.league_id,
+            generation,
+        )
+        self._store(team.league_id, team_id, feed, generation)
+
+        return feed
+
+    def _cached(self, league_id: int, key: Hashable) -> CalendarFeed | None:
+        """A private method getting a cached feed of a league scope.
+
+        Args:
+            league_id (int): The ID of the league.
+            key (Hashable): The ID of the team, or None for the league.
+
+        Returns:
+            CalendarFeed | None: The feed if cached and still current.
+        """
+        scope = self._calendar_cache.get(league_id)
+        if scope is None:
+            return None
+
+        entry = self._calendar_cache.get(_feed_key(league_id, key))
+        if entry is None or entry[0] is not scope:
+            return None
+
+        return entry[1]
+
+    def _store(
+        self,
+        league_id: int,
+        key: Hashable,
+        feed: CalendarFeed,
+        generation: int,
+    ) -> None:
+        """A private method caching a feed of a league scope.
+
+        The feed is dropped if anything was invalidated while it was read.
+
+        Args:
+            league_id (int): The ID of the league.
+            key (Hashable): The ID of the team, or None for the league.
+            feed (CalendarFeed): The rendered feed.
+            generation (int): The cache generation read before the feed.
+        """
+        if generation != self._calendar_cache.generation:
+            return
+
+        scope = self._calendar_cache.get(league_id)
+        if scope is None:
+            scope = object()
+            self._calendar_cache.set(league_id, scope, generation)
+
+        self._calendar_cache.set(
+            _feed_key(league_id, key),
+            (scope, feed),
+            generation,
+        )
+
+
+def _feed_key(league_id: int, key: Hashable) -> tuple[str, int, Hashable]:
+    """A function getting the cache key of a feed of a league scope.
+
+    Args:
+        league_id (int): The ID of the league.
+        key (Hashable): The ID of the team, or None for the league.
+
+    Returns:
+        tuple[str, int, Hashable]: The cache key.
+    """
+    return ("feed", league_id, key)
+
+
+def _render(name: str, fixtures: Iterable[FixtureDTO]) -> CalendarFeed:
+    """A function rendering a feed stamped with the current time.
+
+    Args:
+        name (str): The name of the calendar.
+        fixtures (Iterable[FixtureDTO]): The matches with team names.
+
+    Returns:
+        CalendarFeed: The rendered feed.
+    """
+    generated = datetime.now(timezone.utc).replace(microsecond=0)
+
+    return CalendarFeed(
+        list(render_calendar(name, fixtures, generated)),
+        generated,
+    )
@@ -0,0 +1,31 @@
+"""Module containing calendar service abstractions."""
+
+from abc import ABC, abstractmethod
+
+from src.infrastructure.utils.ics import CalendarFeed
+
+
+class ICalendarService(ABC):
+    """An abstract class representing protocol of calendar service."""
+
+    @abstractmethod
+    async def get_league_calendar(self, league_id: int) -> CalendarFeed | None:
+        """The abstract getting the calendar feed of a league.
+
+        Args:
+            league_id (int): The ID of the league.
+
+        Returns:
+            CalendarFeed | None: The feed if the league exists.
+        """
+
+    @abstractmethod
+    async def get_team_calendar(self, team_id: int) -> CalendarFeed | None:
+        """The abstract getting the calendar feed of a team.
+
+        Args:
+            team_id (int): The ID of the team.
+
+        Returns:
+            CalendarFeed | None: The feed if the team exists.
+        """
@@ -0,0 +1,31 @@
+"""Module containing league import service abstractions."""
+
+from abc import ABC, abstractmethod
+from typing import AsyncIterator
+
+from src.core.domain.imports import ImportReport
+
+
+class IImportService(ABC):
+    """An abstract class representing protocol of league import service."""
+
+    @abstractmethod
+    async def import_league(
+        self,
+        league_id: int,
+        user_id: int,
+        media_type: str,
+        chunks: AsyncIterator[bytes],
+    ) -> ImportReport:
+        """The abstract importing teams and matches into a league.
+
+        Args:
+            league_id (int): The ID of the league.
+            user_id (int): The ID of the user importing the rows.
+            media_type (str): The media type of the upload.
+            chunks (AsyncIterator[bytes]): The chunks of the upload.
+
+        Returns:
+            ImportReport: The numbers of created teams and matches with the
+                rejected rows.
+        """
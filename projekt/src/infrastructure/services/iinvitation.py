@@ -0,0 +1,59 @@
+"""Module containing invitation service abstractions."""
+
+from abc import ABC, abstractmethod
+from typing import Iterable
+
+from src.core.domain.invitation import (
+    Invitation,
+    InvitationAcceptIn,
+    InvitationsIn,
+)
+from src.core.domain.team import Team
+
+
+class IInvitationService(ABC):
+    """An abstract class representing protocol of invitation service."""
+
+    @abstractmethod
+    async def create_invitations(
+        self,
+        league_id: int,
+        user_id: int,
+        data: InvitationsIn,
+    ) -> Iterable[Invitation]:
+        """The abstract generating invitations to a private league.
+
+        Args:
+            league_id (int): The ID of the league.
+            user_id (int): The ID of the user requesting the invitations.
+            data (InvitationsIn): The number and validity of invitations.
+
+        Returns:
+            Iterable[Invitation]: The created invitations.
+        """
+
+    @abstractmethod
+    async def accept_invitation(
+        self,
+        token: str,
+        user_id: int,
+        data: InvitationAcceptIn,
+    ) -> Team | None:
+        """The abstract joining a league with an invitation.
+
+        Args:
+            token (str): The token of the invitation.
+            user_id (int): The ID of the user joining the league.
+            data (InvitationAcceptIn): The details of the new team.
+
+        Returns:
+            Team | None: The new team if the invitation was valid.
+        """
+
+    @abstractmethod
+    async def purge_expired(self) -> int:
+        """The abstract deleting expired invitations.
+
+        Returns:
+            int: The number of deleted invitations.
+        """
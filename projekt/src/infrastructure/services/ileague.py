@@ -3,19 +3,37 @@
 from abc import ABC, abstractmethod
 from typing import Iterable, Any
 
-from src.core.domain.league import League, LeagueIn, LeagueBroker
-from src.infrastructure.dto.leaguedto import LeagueDTO
+from src.core.domain.league import (
+    League,
+    LeagueFilter,
+    LeagueIn,
+    LeagueBroker,
+    ScheduleIn,
+    SportType,
+)
+from src.core.domain.match import Match
+from src.core.domain.standing import Standing
+from src.infrastructure.dto.leaguedto import LeagueDTO, LeagueOverviewDTO
+from src.infrastructure.dto.pagedto import CountedPageDTO, PageDTO
 
 
 class ILeagueService(ABC):
     """An abstract class representing protocol of league service."""
 
     @abstractmethod
-    async def get_public_leagues(self) -> Iterable[LeagueDTO]:
-        """The abstract getting public leagues from the repository.
+    async def get_public_leagues(
+        self,
+        limit: int,
+        after: str | None = None,
+    ) -> PageDTO[LeagueDTO]:
+        """The abstract getting a page of public leagues from the repository.
+
+        Args:
+            limit (int): The maximum number of leagues on the page.
+            after (str | None): The cursor returned with the previous page.
 
         Returns:
-            Iterable[LeagueDTO]: The collection of the all public leagues.
+            PageDTO[LeagueDTO]: The page of public leagues.
         """
 
     @abstractmethod
@@ -29,6 +47,17 @@ class ILeagueService(ABC):
             LeagueDTO | None: The league data if exists.
         """
 
+    @abstractmethod
+    async def get_by_ids(self, league_ids: list[int]) -> Iterable[LeagueDTO]:
+        """The abstract getting many leagues from the repository.
+
+        Args:
+            league_ids (list[int]): The ids of the leagues.
+
+        Returns:
+            Iterable[LeagueDTO]: The existing leagues in the order of the ids.
+        """
+
     @abstractmethod
     async def add_league(self, data: LeagueBroker) -> LeagueDTO | None:
         """The abstract adding new league to the repository.
@@ -74,21 +103,58 @@ class ILeagueService(ABC):
         """Get leagues owned by user."""
 
     @abstractmethod
-    async def archive_league(self, league_id: int) -> LeagueDTO | None:
-        """Archive a league."""
+    async def archive_league(
+        self,
+        league_id: int,
+        user_id: int,
+    ) -> LeagueDTO | None:
+        """Archive a league owned by the user."""
+
+    @abstractmethod
+    async def list_leagues(
+        self,
+        filters: LeagueFilter,
+        limit: int,
+        after: str | None = None,
+        with_total: bool = False,
+    ) -> CountedPageDTO[LeagueDTO]:
+        """Get a page of leagues matching the filters."""
 
     @abstractmethod
     async def get_leagues_by_city(self, city: str) -> Iterable[LeagueDTO]:
         """Get leagues by city."""
 
     @abstractmethod
-    async def get_archived_leagues(self) -> Iterable[LeagueDTO]:
-        """Get all archived leagues."""
+    async def search_leagues(
+        self,
+        query: str,
+        sport_type: SportType | None,
+        limit: int,
+        after: str | None = None,
+    ) -> PageDTO[LeagueDTO]:
+        """Search active public leagues by name and city."""
+
+    @abstractmethod
+    async def get_archived_leagues(
+        self,
+        limit: int,
+        after: str | None = None,
+    ) -> PageDTO[LeagueDTO]:
+        """Get a page of archived leagues."""
         
     @abstractmethod
-    async def get_standings(self, league_id: int) -> Iterable[Any]:
+    async def get_standings(self, league_id: int) -> Iterable[Standing]:
         """Get league standings"""
 
     @abstractmethod
-    async def generate_scheudle(self, league_id: int, user_id: int) -> Iterable[Any]:
-        """Generate league scheudle"""
\ No newline at end of file
+    async def get_overview(self, league_id: int) -> LeagueOverviewDTO | None:
+        """Get the league with its teams, matches and standings."""
+
+    @abstractmethod
+    async def generate_schedule(
+        self,
+        league_id: int,
+        user_id: int,
+        data: ScheduleIn,
+    ) -> Iterable[Match]:
+        """Generate a round-robin schedule for the league."""
\ No newline at end of file
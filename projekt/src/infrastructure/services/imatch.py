@@ -3,36 +3,85 @@
 from abc import ABC, abstractmethod
 from typing import Iterable
 
-from src.core.domain.match import Match, MatchBroker, MatchUpdateIn
+from src.core.domain.match import (
+    Match,
+    MatchBroker,
+    MatchCreateFailure,
+    MatchFilter,
+    MatchUpdateIn,
+)
+from src.infrastructure.dto.pagedto import PageDTO
 
 class IMatchService(ABC):
     """An abstract repository class for match."""
 
     @abstractmethod
-    async def get_match_by_id(self, match_id: int) -> Match | None:
-        """Get match by ID."""
+    async def get_match_by_id(
+        self,
+        match_id: int,
+        league_id: int | None = None,
+    ) -> Match | None:
+        """Get match by ID, within its league if known."""
 
     @abstractmethod
-    async def get_all_matches(self) -> Iterable[Match]:
-        """Get all matches."""
+    async def get_matches_by_ids(
+        self,
+        league_id: int,
+        match_ids: list[int],
+    ) -> Iterable[Match]:
+        """Get matches of a league by IDs, in the order of the IDs."""
+
+    @abstractmethod
+    async def get_all_matches(
+        self,
+        limit: int,
+        after: str | None = None,
+    ) -> PageDTO[Match]:
+        """Get a page of all matches."""
 
     @abstractmethod
     async def get_matches_by_league(self, league_id: int) -> Iterable[Match]:
         """Get all matches in a league."""
 
     @abstractmethod
-    async def get_matches_by_team(self, team_id: int) -> Iterable[Match]:
-        """Get all matches for a team (home or away)."""
+    async def get_matches_by_team(
+        self,
+        team_id: int,
+        limit: int,
+        after: str | None = None,
+    ) -> PageDTO[Match]:
+        """Get a page of matches for a team (home or away)."""
+
+    @abstractmethod
+    async def get_filtered(
+        self,
+        filters: MatchFilter,
+        limit: int,
+        after: str | None = None,
+    ) -> PageDTO[Match]:
+        """Get a page of matches matching the filters, ordered by date."""
 
     @abstractmethod
-    async def create_match(self, data: MatchBroker) -> Match | None:
-        """Create a new match."""
+    async def create_match(
+        self,
+        data: MatchBroker,
+    ) -> Match | MatchCreateFailure:
+        """Create a new match or return the reason of the failure."""
 
     @abstractmethod
-    async def update_match(self, match_id: int, data: MatchUpdateIn) -> Match | None:
+    async def update_match(
+        self,
+        match_id: int,
+        data: MatchUpdateIn,
+        league_id: int | None = None,
+    ) -> Match | None:
         """Update match score and/or date."""
 
     @abstractmethod
-    async def delete_match(self, match_id: int) -> bool:
+    async def delete_match(
+        self,
+        match_id: int,
+        league_id: int | None = None,
+    ) -> bool:
         """Delete a match."""
 
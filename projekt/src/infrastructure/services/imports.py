@@ -0,0 +1,181 @@
+"""A service for league imports."""
+
+from typing import Any, AsyncIterator
+
+from fastapi import HTTPException, status
+from pydantic import TypeAdapter, ValidationError
+
+from src.core.domain.imports import ImportReport, ImportRow, ImportRowError
+from src.core.domain.league import LeagueStatus
+from src.core.repositories.iimport import IImportRepository
+from src.core.repositories.ileague import ILeagueRepository
+from src.infrastructure.services.iimport import IImportService
+from src.infrastructure.utils.consts import IMPORT_BATCH_SIZE, IMPORT_MAX_ROWS
+from src.infrastructure.utils.imports import MEDIA_TYPES, MalformedRow, read_rows
+
+_ROWS = TypeAdapter(list[ImportRow])
+
+
+class ImportService(IImportService):
+    """An implementation of service class for league imports."""
+
+    def __init__(
+        self,
+        repository: IImportRepository,
+        league_repository: ILeagueRepository,
+    ) -> None:
+        """The initializer of the `import service`.
+
+        Args:
+            repository (IImportRepository): The reference to the repository.
+            league_repository (ILeagueRepository): The reference to the
+                league repository.
+        """
+        self._repository = repository
+        self._league_repository = league_repository
+
+    async def import_league(
+        self,
+        league_id: int,
+        user_id: int,
+        media_type: str,
+        chunks: AsyncIterator[bytes],
+    ) -> ImportReport:
+        """A method importing teams and matches into a league.
+
+        The upload is read and validated in batches while it streams in.
+        The valid rows are merged at once after the whole upload was read,
+        so no transaction is held open while waiting for the client. Rows
+        rejected by the validation or the merge are reported with their
+        1-based positions in the upload, not counting the CSV header.
+
+        Args:
+            league_id (int): The ID of the league.
+            user_id (int): The ID of the user importing the rows.
+            media_type (str): The media type of the upload.
+            chunks (AsyncIterator[bytes]): The chunks of the upload.
+
+        Raises:
+            HTTPException: If the league does not exist, is not active, the
+                user is not its owner, the media type is not supported, the
+                upload cannot be parsed or has too many rows.
+
+        Returns:
+            ImportReport: The numbers of created teams and matches with the
+                rejected rows.
+        """
+        league = await self._league_repository.get_by_id(league_id)
+        if not league:
+            raise HTTPException(status_code=404, detail="League not found")
+
+        if league.owner.id != user_id:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Only the league owner can import into the league",
+            )
+
+        if league.status != LeagueStatus.ACTIVE:
+            raise HTTPException(status_code=400, detail="League is archived")
+
+        if media_type not in MEDIA_TYPES:
+            raise HTTPException(
+                status_code=415,
+                detail=f"Supported media types: {', '.join(MEDIA_TYPES)}",
+            )
+
+        valid: list[tuple[int, ImportRow]] = []
+        errors: list[ImportRowError] = []
+        batch: list[tuple[int, Any]] = []
+        line = 0
+
+        try:
+            async for row in read_rows(chunks, media_type):
+                line += 1
+                if line > IMPORT_MAX_ROWS:
+                    raise HTTPException(
+                        status_code=413,
+                        detail=f"Imports are limited to {IMPORT_MAX_ROWS} rows",
+                    )
+
+                batch.append((line, row))
+                if len(batch) == IMPORT_BATCH_SIZE:
+                    self._validate(batch, valid, errors)
+                    batch = []
+        except ValueError as error:
+            raise HTTPException(status_code=400, detail=str(error))
+
+        self._validate(batch, valid, errors)
+
+        report = ImportReport()
+        if valid:
+            report = await self._repository.import_rows(
+                league_id,
+                user_id,
+                valid,
+            )
+
+        if report is None:
+            raise HTTPException(status_code=400, detail="League is archived")
+
+        report.errors = sorted(
+            errors + report.errors,
+            key=lambda error: error.row,
+        )
+
+        return report
+
+    def _validate(
+        self,
+        batch: list[tuple[int, Any]],
+        valid: list[tuple[int, ImportRow]],
+        errors: list[ImportRowError],
+    ) -> None:
+        """A private method validating a batch of parsed rows.
+
+        The batch is validated with one call; only when it fails are the
+        valid rows told apart from the rejected ones.
+
+        Args:
+            batch (list[tuple[int, Any]]): The parsed rows with their
+                positions in the upload.
+            valid (list[tuple[int, ImportRow]]): The valid rows, extended
+                with the rows of the batch.
+            errors (list[ImportRowError]): The rejected rows, extended with
+                the rows of the batch.
+        """
+        problems: dict[int, list[str]] = {}
+        for index, (_, row) in enumerate(batch):
+            if isinstance(row, MalformedRow):
+                problems[index] = [row.reason]
+
+        parsed = [
+            row for index, (_, row) in enumerate(batch)
+            if index not in problems
+        ]
+        try:
+            rows = _ROWS.validate_python(parsed)
+        except ValidationError as error:
+            positions = [
+                index for index in range(len(batch)) if index not in problems
+            ]
+            for detail in error.errors():
+                index = positions[detail["loc"][0]]
+                field = ".".join(str(part) for part in detail["loc"][1:])
+                problems.setdefault(index, []).append(
+                    f"{field}: {detail['msg']}" if field else detail["msg"]
+                )
+
+            rows = _ROWS.validate_python([
+                row for index, (_, row) in enumerate(batch)
+                if index not in problems
+            ])
+
+        accepted = [
+            line for index, (line, _) in enumerate(batch)
+            if index not in problems
+        ]
+        valid.extend(zip(accepted, rows))
+        errors.extend(
+            ImportRowError(row=batch[index][0], errors=messages)
+            for index, messages in problems.items()
+        )
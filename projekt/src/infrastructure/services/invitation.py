@@ -0,0 +1,111 @@
+"""A service for invitation entity."""
+
+import secrets
+from datetime import datetime, timedelta, timezone
+from typing import Iterable
+
+from fastapi import HTTPException, status
+
+from src.core.domain.invitation import (
+    Invitation,
+    InvitationAcceptIn,
+    InvitationsIn,
+)
+from src.core.domain.league import LeagueStatus
+from src.core.domain.team import Team
+from src.core.repositories.iinvitation import IInvitationRepository
+from src.core.repositories.ileague import ILeagueRepository
+from src.infrastructure.services.iinvitation import IInvitationService
+from src.infrastructure.utils.consts import INVITATION_PURGE_BATCH_SIZE
+
+
+class InvitationService(IInvitationService):
+    """An implementation of service class for invitation."""
+
+    def __init__(
+        self,
+        repository: IInvitationRepository,
+        league_repository: ILeagueRepository,
+    ) -> None:
+        """The initializer of the `invitation service`.
+
+        Args:
+            repository (IInvitationRepository): The reference to the
+                repository.
+            league_repository (ILeagueRepository): The reference to the
+                league repository.
+        """
+        self._repository = repository
+        self._league_repository = league_repository
+
+    async def create_invitations(
+        self,
+        league_id: int,
+        user_id: int,
+        data: InvitationsIn,
+    ) -> Iterable[Invitation]:
+        """A method generating single-use invitations to a private league.
+
+        Args:
+            league_id (int): The ID of the league.
+            user_id (int): The ID of the user requesting the invitations.
+            data (InvitationsIn): The number and validity of invitations.
+
+        Raises:
+            HTTPException: If the league does not exist, is not an active
+                private league or the user is not its owner.
+
+        Returns:
+            Iterable[Invitation]: The created invitations.
+        """
+        league = await self._league_repository.get_by_id(league_id)
+        if not league:
+            raise HTTPException(status_code=404, detail="League not found")
+
+        if league.owner.id != user_id:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Only the league owner can invite teams"
+            )
+
+        if not league.is_private or league.status != LeagueStatus.ACTIVE:
+            raise HTTPException(
+                status_code=400,
+                detail="Invitations are only available for active private leagues",
+            )
+
+        expires_at = datetime.now(timezone.utc).replace(tzinfo=None) \
+            + timedelta(hours=data.valid_hours)
+        tokens = [secrets.token_urlsafe(24) for _ in range(data.count)]
+
+        return await self._repository.create_invitations(
+            league_id,
+            tokens,
+            expires_at,
+        )
+
+    async def accept_invitation(
+        self,
+        token: str,
+        user_id: int,
+        data: InvitationAcceptIn,
+    ) -> Team | None:
+        """A method joining a league with an invitation.
+
+        Args:
+            token (str): The token of the invitation.
+            user_id (int): The ID of the user joining the league.
+            data (InvitationAcceptIn): The details of the new team.
+
+        Returns:
+            Team | None: The new team if the invitation was valid.
+        """
+        return await self._repository.redeem(token, user_id, data.team_name)
+
+    async def purge_expired(self) -> int:
+        """A method deleting expired invitations.
+
+        Returns:
+            int: The number of deleted invitations.
+        """
+        return await self._repository.purge_expired(INVITATION_PURGE_BATCH_SIZE)
@@ -5,6 +5,7 @@ from abc import ABC, abstractmethod
 from typing import Iterable
 
 from src.core.domain.team import Team, TeamBroker, TeamIn
+from src.infrastructure.dto.pagedto import PageDTO
 
 
 class ITeamService(ABC):
@@ -22,11 +23,30 @@ class ITeamService(ABC):
         """
 
     @abstractmethod
-    async def get_all_teams(self) -> Iterable[Team]:
-        """The abstract getting all teams from the repository.
+    async def get_teams_by_ids(self, team_ids: list[int]) -> Iterable[Team]:
+        """The abstract getting many teams from the repository.
+
+        Args:
+            team_ids (list[int]): The ids of the teams.
+
+        Returns:
+            Iterable[Team]: The existing teams in the order of the ids.
+        """
+
+    @abstractmethod
+    async def get_all_teams(
+        self,
+        limit: int,
+        after: str | None = None,
+    ) -> PageDTO[Team]:
+        """The abstract getting a page of teams from the repository.
+
+        Args:
+            limit (int): The maximum number of teams on the page.
+            after (str | None): The cursor returned with the previous page.
 
         Returns:
-            Iterable[Team]: The collection of the all teams.
+            PageDTO[Team]: The page of teams.
         """
 
     @abstractmethod
@@ -1,15 +1,35 @@
 """A service for league entity."""
 
+import asyncio
+from datetime import datetime, time, timedelta, timezone
 from typing import Any, Iterable
 from fastapi import HTTPException, status
 
-from src.infrastructure.dto.leaguedto import LeagueDTO
-from src.core.domain.league import League, LeagueBroker
+from src.infrastructure.dto.leaguedto import LeagueDTO, LeagueOverviewDTO
+from src.infrastructure.dto.pagedto import CountedPageDTO, PageDTO
+from src.core.domain.league import (
+    League,
+    LeagueBroker,
+    LeagueFilter,
+    LeagueStatus,
+    ScheduleIn,
+    SportType,
+)
 from src.core.repositories.ileague import ILeagueRepository
 from src.core.repositories.imatch import IMatchRepository
+from src.core.repositories.istandings import IStandingsRepository
 from src.core.repositories.iteam import ITeamRepository
 from src.infrastructure.services.ileague import ILeagueService
-from src.core.domain.match import MatchIn
+from src.infrastructure.utils.cache import LRUCache
+from src.infrastructure.utils.loader import DataLoader
+from src.core.domain.match import (
+    Match,
+    MatchBroker,
+    MatchStatus,
+    ScheduleFailure,
+)
+from src.core.domain.standing import Standing
+from src.core.domain.team import Team
 
 
 class LeagueService(ILeagueService):
@@ -19,7 +39,10 @@ class LeagueService(ILeagueService):
         self, 
         repository: ILeagueRepository, 
         match_repository: IMatchRepository, 
-        team_repository: ITeamRepository
+        team_repository: ITeamRepository,
+        standings_repository: IStandingsRepository,
+        standings_cache: LRUCache,
+        calendar_cache: LRUCache,
     ) -> None:
         """The initializer of the `league service`.
 
@@ -29,6 +52,13 @@ class LeagueService(ILeagueService):
         self._repository = repository
         self._match_repository = match_repository
         self._team_repository = team_repository
+        self._standings_repository = standings_repository
+        self._standings_cache = standings_cache
+        self._calendar_cache = calendar_cache
+        self._loader = DataLoader(
+            repository.get_by_ids,
+            key=lambda league: league.id,
+        )
 
     async def add_league(self, data: LeagueBroker) -> LeagueDTO | None:
         """A method creating a new league.
@@ -41,13 +71,49 @@ class LeagueService(ILeagueService):
         """
         return await self._repository.add_league(data)
 
-    async def get_public_leagues(self) -> Iterable[LeagueDTO]:
-        """A method getting all public leagues.
+    async def get_public_leagues(
+        self,
+        limit: int,
+        after: str | None = None,
+    ) -> PageDTO[LeagueDTO]:
+        """A method getting a page of public leagues.
+
+        Args:
+            limit (int): The maximum number of leagues on the page.
+            after (str | None): The cursor returned with the previous page.
+
+        Returns:
+            PageDTO[LeagueDTO]: A page of public leagues.
+        """
+        return await self._repository.get_all_public(limit, after)
+
+    async def list_leagues(
+        self,
+        filters: LeagueFilter,
+        limit: int,
+        after: str | None = None,
+        with_total: bool = False,
+    ) -> CountedPageDTO[LeagueDTO]:
+        """A method getting a page of leagues matching the filters.
+
+        Args:
+            filters (LeagueFilter): The listing filters.
+            limit (int): The maximum number of leagues on the page.
+            after (str | None): The cursor returned with the previous page.
+            with_total (bool): Whether to count all matching leagues.
+
+        Raises:
+            ValueError: If the cursor is malformed.
 
         Returns:
-            Iterable[LeagueDTO]: A list of public leagues.
+            CountedPageDTO[LeagueDTO]: The page of leagues ordered by ID.
         """
-        return await self._repository.get_all_public()
+        return await self._repository.get_filtered(
+            filters,
+            limit,
+            after,
+            with_total,
+        )
 
     async def get_leagues_by_city(self, city: str) -> Iterable[LeagueDTO]:
         """A method getting all leagues by city name.
@@ -60,6 +126,29 @@ class LeagueService(ILeagueService):
         """
         return await self._repository.get_by_city(city)
 
+    async def search_leagues(
+        self,
+        query: str,
+        sport_type: SportType | None,
+        limit: int,
+        after: str | None = None,
+    ) -> PageDTO[LeagueDTO]:
+        """A method searching active public leagues by name and city.
+
+        Args:
+            query (str): The searched phrase.
+            sport_type (SportType | None): The sport type to filter by.
+            limit (int): The maximum number of leagues on the page.
+            after (str | None): The cursor returned with the previous page.
+
+        Raises:
+            ValueError: If the cursor is malformed.
+
+        Returns:
+            PageDTO[LeagueDTO]: The page of leagues ranked by similarity.
+        """
+        return await self._repository.search(query, sport_type, limit, after)
+
     async def get_my_leagues(self, user_id: int) -> Iterable[LeagueDTO]:
         """A method getting all leagues owned by the user.
     
@@ -80,18 +169,53 @@ class LeagueService(ILeagueService):
         Returns:
             Any | None: The league object.
         """
-        return await self._repository.get_by_id(league_id)
+        return await self._loader.load(league_id)
+
+    async def get_by_ids(self, league_ids: list[int]) -> Iterable[LeagueDTO]:
+        """A method getting many leagues in one query.
+
+        Args:
+            league_ids (list[int]): The IDs of the leagues.
+
+        Returns:
+            Iterable[LeagueDTO]: The existing leagues in the order of the IDs.
+        """
+        leagues = await self._loader.load_many(dict.fromkeys(league_ids))
+
+        return [league for league in leagues if league]
     
-    async def archive_league(self, league_id: int) -> LeagueDTO | None:
+    async def archive_league(
+        self,
+        league_id: int,
+        user_id: int,
+    ) -> LeagueDTO | None:
         """A method archiving a league.
 
         Args:
             league_id (int): The ID of the league.
+            user_id (int): The ID of the user requesting archiving.
 
         Returns:
             LeagueDTO | None: The updated league object.
+
+        Raises:
+            HTTPException: If user is not the league owner.
         """
-        return await self._repository.archive_league(league_id)
+        league = await self.get_by_id(league_id)
+        if not league:
+            raise HTTPException(status_code=404, detail="League not found")
+
+        if league.owner.id != user_id:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Only the league owner can archive the league"
+            )
+
+        self._loader.clear(league_id)
+        league = await self._repository.archive_league(league_id)
+        self._standings_cache.invalidate(league_id)
+
+        return league
 
     async def delete_league(self, league_id: int, user_id: int) -> bool:
         """A method deleting a league.
@@ -106,7 +230,7 @@ class LeagueService(ILeagueService):
         Raises:
             HTTPException: If user is not the league owner.
         """
-        league = await self._repository.get_by_id(league_id)
+        league = await self.get_by_id(league_id)
         if not league:
             raise HTTPException(status_code=404, detail="League not found")
         
@@ -116,7 +240,11 @@ class LeagueService(ILeagueService):
                 detail="Only the league owner can delete the league"
             )
         
-        return await self._repository.delete_league(league_id)
+        self._loader.clear(league_id)
+        deleted = await self._repository.delete_league(league_id)
+        self._calendar_cache.invalidate(league_id)
+
+        return deleted
 
     async def update_league(
             self, 
@@ -135,9 +263,10 @@ class LeagueService(ILeagueService):
             Updated league object.
 
         Raises:
-            HTTPException: If user is not the league owner.
+            HTTPException: If user is not the league owner or the league
+                is archived.
         """
-        league = await self._repository.get_by_id(league_id)
+        league = await self.get_by_id(league_id)
         if not league:
             raise HTTPException(status_code=404, detail="League not found")
 
@@ -147,118 +276,306 @@ class LeagueService(ILeagueService):
                 detail="Only the league owner can update the league"
             )
 
-        return await self._repository.update_league(league_id, league_update)
+        if league.status == LeagueStatus.ARCHIVED:
+            raise HTTPException(status_code=400, detail="League is archived")
+
+        self._loader.clear(league_id)
+        league = await self._repository.update_league(league_id, league_update)
+        self._calendar_cache.invalidate(league_id)
 
-    async def get_archived_leagues(self) -> Iterable[LeagueDTO]:
-        """Get all archived leagues.
+        return league
+
+    async def get_archived_leagues(
+        self,
+        limit: int,
+        after: str | None = None,
+    ) -> PageDTO[LeagueDTO]:
+        """Get a page of archived leagues.
+
+        Args:
+            limit (int): The maximum number of leagues on the page.
+            after (str | None): The cursor returned with the previous page.
 
         Returns:
-            Iterable[LeagueDTO]: A list of archived leagues.
+            PageDTO[LeagueDTO]: A page of archived leagues.
         """
-        return await self._repository.get_all_archived()
+        return await self._repository.get_all_archived(limit, after)
 
-    async def get_standings(self, league_id: int) -> Iterable[Any]:
+    async def get_standings(self, league_id: int) -> Iterable[Standing]:
+        """A method getting the league table.
 
-        teams = await self._team_repository.get_teams_by_league(league_id)
+        The stored table is maintained on every result change and cached
+        until the next change in the league. Teams without stored rows yet
+        are calculated once in the database and stored, without touching
+        the existing rows. Archived leagues are served from the table
+        frozen on archiving.
 
-        all_matches = await self._match_repository.get_matches_by_league(league_id)
-
-        matches = [match for match in all_matches if match.status == 'finished']
-
-        standings = {}
-        for team in teams:
-            standings[str(team.id)] = {
-                "team_id": str(team.id),
-                "team_name": team.name,
-                "played": 0,
-                "won": 0,
-                "drawn": 0,
-                "lost": 0,
-                "goals_for": 0,
-                "goals_against": 0,
-                "goal_difference": 0,
-                "points": 0,
-            }
-
-        for match in matches:
-            home_id = str(match.home_team_id)
-            away_id = str(match.away_team_id)
-            
-            if home_id not in standings or away_id not in standings:
-                continue
+        Args:
+            league_id (int): The ID of the league.
+
+        Returns:
+            Iterable[Standing]: The ordered standings.
+        """
+        if (standings := self._standings_cache.get(league_id)) is not None:
+            return standings
 
-            home_score = match.home_score or 0
-            away_score = match.away_score or 0
+        generation = self._standings_cache.generation
+        league = await self.get_by_id(league_id)
 
-            standings[home_id]["played"] += 1
-            standings[away_id]["played"] += 1
-            
-            standings[home_id]["goals_for"] += home_score
-            standings[home_id]["goals_against"] += away_score
-            standings[away_id]["goals_for"] += away_score
-            standings[away_id]["goals_against"] += home_score
-            
-            if home_score > away_score:
-                standings[home_id]["won"] += 1
-                standings[home_id]["points"] += 3
-                standings[away_id]["lost"] += 1
-            elif home_score < away_score:
-                standings[away_id]["won"] += 1
-                standings[away_id]["points"] += 3
-                standings[home_id]["lost"] += 1
-            else:
-                standings[home_id]["drawn"] += 1
-                standings[away_id]["drawn"] += 1
-                standings[home_id]["points"] += 1
-                standings[away_id]["points"] += 1
-                
-        for team_id in standings:
-            standings[team_id]["goal_difference"] = (
-                standings[team_id]["goals_for"] - standings[team_id]["goals_against"]
+        if league and league.status == LeagueStatus.ARCHIVED:
+            standings = await self._standings_repository.get_snapshot(
+                league_id,
             )
-            
-        sorted_standings = sorted(
-            standings.values(),
-            key=lambda x: (x["points"], x["goal_difference"], x["goals_for"]),
-            reverse=True,
+        else:
+            standings = await self._stored_standings(league_id)
+
+        if standings is None:
+            standings = await self._standings_repository.calculate_by_league(
+                league_id,
+            )
+
+        self._standings_cache.set(league_id, standings, generation)
+
+        return standings
+
+    async def _stored_standings(
+        self,
+        league_id: int,
+    ) -> Iterable[Standing] | None:
+        """A private method getting the stored table, filling missing rows.
+
+        Args:
+            league_id (int): The ID of the league.
+
+        Returns:
+            Iterable[Standing] | None: The ordered standings, or None if a
+                team was added while the missing rows were filled.
+        """
+        standings = await self._standings_repository.get_by_league(league_id)
+
+        if standings is None:
+            await self._standings_repository.fill_standings(league_id)
+            standings = await self._standings_repository.get_by_league(
+                league_id,
+            )
+
+        return standings
+
+    async def get_overview(self, league_id: int) -> LeagueOverviewDTO | None:
+        """A method getting the league with its teams, matches and standings.
+
+        The reads are independent, so they run concurrently on separate
+        pooled connections. The standings are calculated from the fetched
+        teams and matches instead of being queried again, except for
+        archived leagues, whose frozen table is served.
+
+        Args:
+            league_id (int): The ID of the league.
+
+        Returns:
+            LeagueOverviewDTO | None: The overview if the league exists.
+        """
+        generation = self._standings_cache.generation
+        league, teams, matches = await asyncio.gather(
+            self.get_by_id(league_id),
+            self._team_repository.get_teams_by_league(league_id),
+            self._match_repository.get_matches_by_league(league_id),
+        )
+
+        if not league:
+            return None
+
+        if league.status == LeagueStatus.ARCHIVED:
+            standings = list(await self.get_standings(league_id))
+        else:
+            standings = calculate_standings(teams, matches)
+            self._standings_cache.set(league_id, standings, generation)
+
+        return LeagueOverviewDTO.model_construct(
+            league=league,
+            teams=list(teams),
+            matches=list(matches),
+            standings=standings,
         )
-        
-        return sorted_standings
 
-    async def generate_scheudle(self, league_id: int, user_id: int) -> Iterable[Any]:
+    async def generate_schedule(
+        self,
+        league_id: int,
+        user_id: int,
+        data: ScheduleIn,
+    ) -> Iterable[Match]:
+        """A method generating a round-robin schedule for the league.
 
-        league = await self._repository.get_by_id(league_id)
+        Args:
+            league_id (int): The ID of the league.
+            user_id (int): The ID of the user requesting the schedule.
+            data (ScheduleIn): The schedule parameters.
+
+        Returns:
+            Iterable[Match]: The created matches.
+
+        Raises:
+            HTTPException: If the league does not exist, is not active,
+                has less than two teams, already has matches or the user
+                is not its owner.
+        """
+        league = await self.get_by_id(league_id)
         if not league:
             raise HTTPException(status_code=404, detail="League not found")
-        
+
         if league.owner.id != user_id:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Only the league owner can generate the schedule"
             )
 
+        if league.status != LeagueStatus.ACTIVE:
+            raise HTTPException(status_code=400, detail="League is not active")
+
         teams = await self._team_repository.get_teams_by_league(league_id)
+        team_ids = [team.id for team in teams]
 
-        if len(teams) < 2:
+        if len(team_ids) < 2:
             raise HTTPException(status_code=400, detail="Not enough teams to generate schedule")
 
-        teams_list = list(teams)
-        n = len(teams_list)
-        matches = []
-    
-        for round in range(n - 1):
-            for i in range(n // 2):
-                home_idx = i
-                away_idx = n - 1 - i
-                
-                home_team = teams_list[home_idx]
-                away_team = teams_list[away_idx]
-                
-                match_in = MatchIn(
-                    league_id=league_id,
-                    home_team=home_team.id,
-                    away_team=away_team.id,
-                )
-                created_match = await self. _match_repository.create_match(match_in)
-                
-        
\ No newline at end of file
+        rounds = round_robin(team_ids)
+        if data.double_round_robin:
+            rounds += [
+                [(away, home) for home, away in fixtures]
+                for fixtures in rounds
+            ]
+
+        interval = timedelta(days=data.days_between_rounds)
+        matches = [
+            MatchBroker(
+                league_id=league_id,
+                home_team_id=home,
+                away_team_id=away,
+                date=datetime.combine(
+                    data.start_date + interval * round_no,
+                    time(),
+                    tzinfo=timezone.utc,
+                ),
+                submitted_by=user_id,
+            )
+            for round_no, fixtures in enumerate(rounds)
+            for home, away in fixtures
+        ]
+
+        created = await self._match_repository.create_schedule(
+            league_id,
+            matches,
+        )
+
+        if created == ScheduleFailure.LEAGUE_NOT_ACTIVE:
+            raise HTTPException(status_code=400, detail="League is archived")
+
+        if created == ScheduleFailure.LEAGUE_HAS_MATCHES:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="League already has matches",
+            )
+
+        return created
+
+
+def round_robin(team_ids: list[int]) -> list[list[tuple[int, int]]]:
+    """A function pairing teams into rounds using the circle method.
+
+    The first team stays in place while the others rotate around it.
+    With an odd number of teams a bye slot is added, so one team rests
+    each round. The fixed team alternates venues between rounds, which
+    keeps every team's home and away counts within one of each other.
+
+    Args:
+        team_ids (list[int]): The IDs of the teams.
+
+    Returns:
+        list[list[tuple[int, int]]]: The (home, away) pairs of each round.
+    """
+    slots: list[int | None] = list(team_ids)
+    if len(slots) % 2:
+        slots.append(None)
+
+    size = len(slots)
+    rounds = []
+    for round_no in range(size - 1):
+        fixtures = []
+        for i in range(size // 2):
+            home, away = slots[i], slots[size - 1 - i]
+            if home is None or away is None:
+                continue
+
+            if i == 0 and round_no % 2:
+                home, away = away, home
+
+            fixtures.append((home, away))
+
+        rounds.append(fixtures)
+        slots = [slots[0], slots[-1], *slots[1:-1]]
+
+    return rounds
+
+
+def calculate_standings(
+    teams: Iterable[Team],
+    matches: Iterable[Match],
+) -> list[Standing]:
+    """A function calculating the league table from finished matches.
+
+    Args:
+        teams (Iterable[Team]): The teams of the league ordered by name.
+        matches (Iterable[Match]): The matches of the league.
+
+    Returns:
+        list[Standing]: The standings ordered by points, goal difference
+            and goals scored.
+    """
+    standings = {
+        team.id: Standing(team_id=team.id, team_name=team.name)
+        for team in teams
+    }
+
+    for match in matches:
+        if match.status != MatchStatus.FINISHED:
+            continue
+
+        home = standings.get(match.home_team_id)
+        away = standings.get(match.away_team_id)
+
+        if not home or not away:
+            continue
+
+        home_score = match.home_score or 0
+        away_score = match.away_score or 0
+
+        home.played += 1
+        away.played += 1
+
+        home.goals_for += home_score
+        home.goals_against += away_score
+        away.goals_for += away_score
+        away.goals_against += home_score
+
+        if home_score > away_score:
+            home.won += 1
+            home.points += 3
+            away.lost += 1
+        elif home_score < away_score:
+            away.won += 1
+            away.points += 3
+            home.lost += 1
+        else:
+            home.drawn += 1
+            away.drawn += 1
+            home.points += 1
+            away.points += 1
+
+    for standing in standings.values():
+        standing.goal_difference = standing.goals_for - standing.goals_against
+
+    return sorted(
+        standings.values(),
+        key=lambda x: (x.points, x.goal_difference, x.goals_for),
+        reverse=True,
+    )
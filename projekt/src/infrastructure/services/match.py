@@ -1,10 +1,19 @@
 """A service for match entity."""
 
+import asyncio
 from typing import Any, Iterable
 
-from src.core.domain.match import Match, MatchBroker, MatchUpdateIn
+from src.core.domain.match import (
+    Match,
+    MatchBroker,
+    MatchCreateFailure,
+    MatchFilter,
+    MatchUpdateIn,
+)
 from src.core.repositories.imatch import IMatchRepository
+from src.infrastructure.dto.pagedto import PageDTO
 from src.infrastructure.services.imatch import IMatchService
+from src.infrastructure.utils.loader import DataLoader
 
 
 class MatchService(IMatchService):
@@ -17,38 +26,135 @@ class MatchService(IMatchService):
             repository (IMatchRepository): The reference to the repository.
         """
         self.repository = repository
+        self._loader = DataLoader(
+            self._load_matches,
+            key=lambda match: (match.league_id, match.id),
+        )
 
-    async def get_match_by_id(self, match_id: int) -> Any | None:
-        """The method getting match by ID."""
+    async def get_match_by_id(
+        self,
+        match_id: int,
+        league_id: int | None = None,
+    ) -> Any | None:
+        """The method getting match by ID, within its league if known."""
 
-        return await self.repository.get_match_by_id(match_id)
+        if league_id is None:
+            league_id = await self.repository.get_league_id(match_id)
 
-    async def get_all_matches(self) -> Iterable[Any]:
-        """The method getting all matches."""
+        if league_id is None:
+            return None
 
-        return await self.repository.get_all_matches()
+        return await self._loader.load((league_id, match_id))
+
+    async def get_matches_by_ids(
+        self,
+        league_id: int,
+        match_ids: list[int],
+    ) -> Iterable[Match]:
+        """The method getting many matches of a league in one query."""
+
+        matches = await self._loader.load_many(
+            (league_id, match_id) for match_id in dict.fromkeys(match_ids)
+        )
+
+        return [match for match in matches if match]
+
+    async def get_all_matches(
+        self,
+        limit: int,
+        after: str | None = None,
+    ) -> PageDTO[Match]:
+        """The method getting a page of all matches."""
+
+        return await self.repository.get_all_matches(limit, after)
 
     async def get_matches_by_league(self, league_id: int) -> Iterable[Any]:
         """The method getting all matches by league ID."""
 
         return await self.repository.get_matches_by_league(league_id)
 
-    async def get_matches_by_team(self, team_id: int) -> Iterable[Any]:
-        """The method getting all matches by team ID (home or away)."""
+    async def get_matches_by_team(
+        self,
+        team_id: int,
+        limit: int,
+        after: str | None = None,
+    ) -> PageDTO[Match]:
+        """The method getting a page of matches by team ID (home or away)."""
 
-        return await self.repository.get_matches_by_team(team_id)
+        return await self.repository.get_matches_by_team(team_id, limit, after)
 
-    async def create_match(self, data: MatchBroker) -> Any | None:
-        """Create a new match."""
+    async def get_filtered(
+        self,
+        filters: MatchFilter,
+        limit: int,
+        after: str | None = None,
+    ) -> PageDTO[Match]:
+        """The method getting a page of matches matching the filters."""
+
+        return await self.repository.get_filtered(filters, limit, after)
+
+    async def create_match(
+        self,
+        data: MatchBroker,
+    ) -> Match | MatchCreateFailure:
+        """Create a new match or return the reason of the failure."""
 
         return await self.repository.create_match(data)
 
-    async def update_match(self, match_id: int, data: MatchUpdateIn) -> Match | None:
+    async def update_match(
+        self,
+        match_id: int,
+        data: MatchUpdateIn,
+        league_id: int | None = None,
+    ) -> Match | None:
         """Update match score and/or date."""
 
-        return await self.repository.update_match(match_id, data)
+        if league_id is None:
+            league_id = await self.repository.get_league_id(match_id)
+
+        if league_id is None:
+            return None
+
+        self._loader.clear((league_id, match_id))
+
+        return await self.repository.update_match(match_id, league_id, data)
 
-    async def delete_match(self, match_id: int) -> bool:
+    async def delete_match(
+        self,
+        match_id: int,
+        league_id: int | None = None,
+    ) -> bool:
         """The method deleting a match from the data storage."""
 
-        return await self.repository.delete_match(match_id)
+        if league_id is None:
+            league_id = await self.repository.get_league_id(match_id)
+
+        if league_id is None:
+            return False
+
+        self._loader.clear((league_id, match_id))
+
+        return await self.repository.delete_match(match_id, league_id)
+
+    async def _load_matches(
+        self,
+        keys: list[tuple[int, int]],
+    ) -> Iterable[Match]:
+        """A private method loading matches with one query per league.
+
+        Args:
+            keys (list[tuple[int, int]]): The league and match IDs.
+
+        Returns:
+            Iterable[Match]: The existing matches, in no particular order.
+        """
+        leagues: dict[int, list[int]] = {}
+        for league_id, match_id in keys:
+            leagues.setdefault(league_id, []).append(match_id)
+
+        loaded = await asyncio.gather(*(
+            self.repository.get_matches_by_ids(league_id, match_ids)
+            for league_id, match_ids in leagues.items()
+        ))
+
+        return [match for matches in loaded for match in matches]
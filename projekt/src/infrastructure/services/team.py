@@ -4,7 +4,9 @@ from typing import Iterable
 
 from src.core.domain.team import Team, TeamBroker
 from src.core.repositories.iteam import ITeamRepository
+from src.infrastructure.dto.pagedto import PageDTO
 from src.infrastructure.services.iteam import ITeamService
+from src.infrastructure.utils.loader import DataLoader
 
 
 class TeamService(ITeamService):
@@ -20,14 +22,28 @@ class TeamService(ITeamService):
         """
 
         self._repository = repository
+        self._loader = DataLoader(
+            repository.get_teams_by_ids,
+            key=lambda team: team.id,
+        )
 
     async def get_team_by_id(self, team_id: int) -> Team | None:
 
-        return await self._repository.get_team_by_id(team_id)
+        return await self._loader.load(team_id)
+
+    async def get_teams_by_ids(self, team_ids: list[int]) -> Iterable[Team]:
 
-    async def get_all_teams(self) -> Iterable[Team]:
+        teams = await self._loader.load_many(dict.fromkeys(team_ids))
 
-        return await self._repository.get_all_teams()
+        return [team for team in teams if team]
+
+    async def get_all_teams(
+        self,
+        limit: int,
+        after: str | None = None,
+    ) -> PageDTO[Team]:
+
+        return await self._repository.get_all_teams(limit, after)
 
     async def get_teams_by_league(
         self,
@@ -46,6 +62,8 @@ class TeamService(ITeamService):
         data: TeamBroker
     ) -> Team | None:
 
+        self._loader.clear(team_id)
+
         return await self._repository.update_team(
             team_id=team_id,
             data=data,
@@ -54,4 +72,6 @@ class TeamService(ITeamService):
     async def delete_team(self, team_id:int) -> bool:
 
 
+        self._loader.clear(team_id)
+
         return await self._repository.delete_team(team_id)
\ No newline at end of file
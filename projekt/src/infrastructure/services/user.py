@@ -7,7 +7,7 @@ from src.core.repositories.iuser import IUserRepository
 from src.infrastructure.dto.userdto import UserDTO
 from src.infrastructure.dto.tokendto import TokenDTO
 from src.infrastructure.services.iuser import IUserService
-from src.infrastructure.utils.password import verify_password
+from src.infrastructure.utils.password import PasswordHasher
 from src.infrastructure.utils.token import generate_user_token
 
 
@@ -15,9 +15,15 @@ class UserService(IUserService):
     """An abstract class for user service."""
 
     _repository: IUserRepository
+    _password_hasher: PasswordHasher
 
-    def __init__(self, repository: IUserRepository) -> None:
+    def __init__(
+        self,
+        repository: IUserRepository,
+        password_hasher: PasswordHasher,
+    ) -> None:
         self._repository = repository
+        self._password_hasher = password_hasher
 
     async def register_user(self, user: UserIn) -> UserDTO | None:
         """A method registering a new user.
@@ -37,12 +43,18 @@ class UserService(IUserService):
         Args:
             user (UserIn): The user data.
 
+        Raises:
+            PasswordQueueFullError: If too many verifications are pending.
+
         Returns:
             TokenDTO | None: The token details.
         """
 
         if user_data := await self._repository.get_by_email(user.email):
-            if verify_password(user.password, user_data.password):
+            if await self._password_hasher.verify(
+                user.password,
+                user_data.password,
+            ):
                 token_details = generate_user_token(user_data.id)
                 # trunk-ignore(bandit/B106)
                 return TokenDTO(token_type="Bearer", **token_details)
@@ -0,0 +1,104 @@
+"""A module containing an in-process LRU cache."""
+
+from collections import OrderedDict
+from typing import Any, Hashable
+
+
+class LRUCache:
+    """A bounded in-process cache evicting the least recently used entries.
+
+    The cache is local to the worker process, so it has to be invalidated
+    by every code path which changes the cached data.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        """The initializer of the cache.
+
+        Args:
+            max_size (int): The maximum number of entries.
+        """
+        self._max_size = max_size
+        self._entries: OrderedDict[Hashable, Any] = OrderedDict()
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def generation(self) -> int:
+        """The counter of invalidations, used to detect stale values.
+
+        Returns:
+            int: The current generation.
+        """
+        return self._generation
+
+    def get(self, key: Hashable) -> Any | None:
+        """Get a cached value and mark it as recently used.
+
+        Args:
+            key (Hashable): The key of the entry.
+
+        Returns:
+            Any | None: The cached value if exists.
+        """
+        if key not in self._entries:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._entries.move_to_end(key)
+
+        return self._entries[key]
+
+    def set(
+        self,
+        key: Hashable,
+        value: Any,
+        generation: int | None = None,
+    ) -> None:
+        """Store a value, evicting the least recently used entry if full.
+
+        Args:
+            key (Hashable): The key of the entry.
+            value (Any): The value to store.
+            generation (int | None, optional): The generation read before
+                the value was loaded. The value is dropped if anything was
+                invalidated in the meantime. Defaults to None.
+        """
+        if generation is not None and generation != self._generation:
+            return
+
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, *keys: Hashable) -> None:
+        """Remove entries from the cache.
+
+        Args:
+            *keys (Hashable): The keys of the entries.
+        """
+        self._generation += 1
+        for key in keys:
+            self._entries.pop(key, None)
+
+    def stats(self) -> dict:
+        """Get the usage statistics of the cache.
+
+        Returns:
+            dict: The size, limits and hit/miss counters.
+        """
+        lookups = self.hits + self.misses
+
+        return {
+            "size": len(self._entries),
+            "max_size": self._max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+        }
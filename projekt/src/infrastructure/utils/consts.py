@@ -2,4 +2,32 @@
 
 EXPIRATION_MINUTES = 60
 SECRET_KEY = "s3cr3t"  # TODO: -> random generation - it's safe 
-ALGORITHM = "HS256"
\ No newline at end of file
+ALGORITHM = "HS256"
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+# Trigram indexes only help for patterns of at least three characters.
+SEARCH_MIN_LENGTH = 3
+
+# Listings larger than this report the planner estimate instead of COUNT(*).
+COUNT_ESTIMATE_THRESHOLD = 10000
+
+
+# Expired invitations deleted per statement by the background purge.
+INVITATION_PURGE_BATCH_SIZE = 1000
+
+# Archived leagues no longer change, so clients and proxies may keep their
+# reads; the listing of archived leagues still grows and is kept shorter.
+ARCHIVED_CACHE_CONTROL = "public, max-age=86400"
+ARCHIVED_LIST_CACHE_CONTROL = "public, max-age=300"
+
+# Calendar feeds: events last two hours and feeds may be reused by clients
+# for a few minutes before being revalidated with their ETag.
+CALENDAR_MATCH_DURATION = "PT2H"
+CALENDAR_UID_DOMAIN = "projekt-psi"
+CALENDAR_CACHE_CONTROL = "public, max-age=300"
+
+# League imports: rows validated per batch and the largest accepted upload.
+IMPORT_BATCH_SIZE = 1000
+IMPORT_MAX_ROWS = 50000
@@ -0,0 +1,48 @@
+"""A module containing helper functions for keyset pagination cursors."""
+
+import base64
+import binascii
+import json
+from typing import Any
+
+
+def encode_cursor(*values: Any) -> str:
+    """A function encoding the sort key of the last row into a cursor.
+
+    Args:
+        *values (Any): The values of the ordering columns of the last row.
+
+    Returns:
+        str: The opaque cursor.
+    """
+    raw = json.dumps(list(values), separators=(",", ":")).encode()
+
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, *types: type) -> list[Any]:
+    """A function decoding an opaque cursor into the sort key values.
+
+    Args:
+        cursor (str): The opaque cursor.
+        *types (type): The expected types of the sort key values.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+
+    Returns:
+        list[Any]: The values of the ordering columns.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded))
+    except (binascii.Error, UnicodeDecodeError, json.JSONDecodeError) as e:
+        raise ValueError("Invalid cursor") from e
+
+    if not isinstance(values, list) or len(values) != len(types):
+        raise ValueError("Invalid cursor")
+
+    if not all(isinstance(v, t) for v, t in zip(values, types)):
+        raise ValueError("Invalid cursor")
+
+    return values
@@ -0,0 +1,153 @@
+"""A module rendering iCalendar feeds of matches."""
+
+import hashlib
+from datetime import datetime, timezone
+from typing import Iterable, Iterator
+
+from src.core.domain.match import MatchStatus
+from src.infrastructure.dto.matchdto import FixtureDTO
+from src.infrastructure.utils.consts import (
+    CALENDAR_MATCH_DURATION,
+    CALENDAR_UID_DOMAIN,
+)
+
+# Lines longer than this many octets are folded (RFC 5545, 3.1).
+LINE_LIMIT = 75
+
+
+class CalendarFeed:
+    """A rendered feed with the validators of conditional requests."""
+
+    def __init__(self, chunks: list[bytes], generated: datetime) -> None:
+        """The initializer of the feed.
+
+        Args:
+            chunks (list[bytes]): The encoded parts of the feed.
+            generated (datetime): The time the feed was rendered at.
+        """
+        digest = hashlib.sha256()
+        for chunk in chunks:
+            digest.update(chunk)
+
+        self.chunks = chunks
+        self.etag = f'"{digest.hexdigest()[:32]}"'
+        self.last_modified = generated
+
+
+def team_league_key(team_id: int) -> tuple[str, int]:
+    """A function getting the cache key of the league of a team feed.
+
+    Args:
+        team_id (int): The ID of the team.
+
+    Returns:
+        tuple[str, int]: The cache key.
+    """
+    return ("team", team_id)
+
+
+def render_calendar(
+    name: str,
+    fixtures: Iterable[FixtureDTO],
+    generated: datetime,
+) -> Iterator[bytes]:
+    """A function rendering matches as an iCalendar feed.
+
+    The feed is produced one event at a time. Every event is stamped with
+    the time the feed was rendered at, as the matches do not record when
+    they were last changed.
+
+    Args:
+        name (str): The name of the calendar.
+        fixtures (Iterable[FixtureDTO]): The matches with team names.
+        generated (datetime): The time the feed is rendered at.
+
+    Yields:
+        bytes: The encoded lines of the calendar header, every event and
+            the footer.
+    """
+    yield _lines(
+        "BEGIN:VCALENDAR",
+        "VERSION:2.0",
+        "PRODID:-//Projekt PSI//Leagues//EN",
+        "CALSCALE:GREGORIAN",
+        f"X-WR-CALNAME:{_escape(name)}",
+    )
+
+    stamp = _timestamp(generated)
+    for fixture in fixtures:
+        start = _timestamp(fixture.date)
+        summary = f"{fixture.home_team_name} vs {fixture.away_team_name}"
+        if fixture.status == MatchStatus.FINISHED:
+            summary = (
+                f"{fixture.home_team_name} {fixture.home_score}:"
+                f"{fixture.away_score} {fixture.away_team_name}"
+            )
+
+        yield _lines(
+            "BEGIN:VEVENT",
+            f"UID:match-{fixture.id}@{CALENDAR_UID_DOMAIN}",
+            f"DTSTAMP:{stamp}",
+            f"DTSTART:{start}",
+            f"DURATION:{CALENDAR_MATCH_DURATION}",
+            f"SUMMARY:{_escape(summary)}",
+            "END:VEVENT",
+        )
+
+    yield _lines("END:VCALENDAR")
+
+
+def _lines(*lines: str) -> bytes:
+    """A function encoding content lines with CRLF endings and folding.
+
+    Args:
+        *lines (str): The unfolded content lines.
+
+    Returns:
+        bytes: The encoded lines.
+    """
+    encoded = bytearray()
+
+    for line in lines:
+        raw = line.encode()
+        limit = LINE_LIMIT
+        while len(raw) > limit:
+            cut = limit
+            while raw[cut] & 0xC0 == 0x80:  # do not split UTF-8 sequences
+                cut -= 1
+            encoded += raw[:cut] + b"\r\n "
+            raw = raw[cut:]
+            # Continuation lines start with the folding space.
+            limit = LINE_LIMIT - 1
+        encoded += raw + b"\r\n"
+
+    return bytes(encoded)
+
+
+def _escape(text: str) -> str:
+    """A function escaping a TEXT value.
+
+    Args:
+        text (str): The value.
+
+    Returns:
+        str: The escaped value.
+    """
+    return (
+        text.replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\n", "\\n")
+    )
+
+
+def _timestamp(value: datetime) -> str:
+    """A function formatting a time as a UTC DATE-TIME value.
+
+    Args:
+        value (datetime): The time.
+
+    Returns:
+        str: The formatted time.
+    """
+    return value.astimezone(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
@@ -0,0 +1,238 @@
+"""A module reading the rows of uploaded league imports.
+
+The uploads are read from the request stream as they arrive. CSV files
+need a header row naming the columns; JSON uploads are either one array of
+row objects or newline-delimited objects, one per line.
+"""
+
+import codecs
+import csv
+import io
+import json
+from typing import Any, AsyncIterator, Iterator
+
+CSV = "text/csv"
+JSON = "application/json"
+NDJSON = "application/x-ndjson"
+MEDIA_TYPES = (CSV, JSON, NDJSON)
+
+
+class MalformedRow:
+    """A row which could not be parsed from the upload."""
+
+    def __init__(self, reason: str) -> None:
+        """The initializer of the row.
+
+        Args:
+            reason (str): The description of the problem.
+        """
+        self.reason = reason
+
+
+async def read_rows(
+    chunks: AsyncIterator[bytes],
+    media_type: str,
+) -> AsyncIterator[Any]:
+    """A function reading the rows of an upload.
+
+    Args:
+        chunks (AsyncIterator[bytes]): The chunks of the request body.
+        media_type (str): The media type of the body, one of `MEDIA_TYPES`.
+
+    Raises:
+        ValueError: If the body cannot be decoded or parsed at all.
+
+    Yields:
+        Any: The parsed row objects, or `MalformedRow` for rows that
+            could not be parsed.
+    """
+    if media_type == CSV:
+        reader = _read_csv(chunks)
+    elif media_type == NDJSON:
+        reader = _read_ndjson(chunks)
+    elif media_type == JSON:
+        reader = _read_json(chunks)
+    else:
+        raise ValueError(f"Unsupported media type {media_type}")
+
+    async for row in reader:
+        yield row
+
+
+async def _read_text(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """A function decoding the chunks of an UTF-8 body.
+
+    Args:
+        chunks (AsyncIterator[bytes]): The chunks of the request body.
+
+    Raises:
+        ValueError: If the body is not valid UTF-8.
+
+    Yields:
+        str: The decoded text, which may end in the middle of a line.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+
+    async for chunk in chunks:
+        if text := decoder.decode(chunk):
+            yield text
+
+    if text := decoder.decode(b"", final=True):
+        yield text
+
+
+async def _read_csv(chunks: AsyncIterator[bytes]) -> AsyncIterator[Any]:
+    """A function reading the records of a CSV body.
+
+    Text is parsed up to the last line break outside of a quoted field,
+    so records spanning chunks are parsed once complete.
+
+    Args:
+        chunks (AsyncIterator[bytes]): The chunks of the request body.
+
+    Raises:
+        ValueError: If the body is not valid CSV.
+
+    Yields:
+        Any: The records as dicts of the non-empty fields.
+    """
+    header: list[str] | None = None
+    buffer = ""
+
+    async for text in _read_text(chunks):
+        buffer += text
+        end = _records_end(buffer)
+        if not end:
+            continue
+
+        for record in _parse_csv(buffer[:end]):
+            if header is None:
+                header = [name.strip() for name in record]
+            else:
+                yield _csv_row(header, record)
+        buffer = buffer[end:]
+
+    for record in _parse_csv(buffer):
+        if header is None:
+            header = [name.strip() for name in record]
+        else:
+            yield _csv_row(header, record)
+
+
+def _records_end(text: str) -> int:
+    """A function finding the end of the complete records of CSV text.
+
+    Quotes inside fields are doubled, so a line break follows a complete
+    record when the text before it holds an even number of quotes.
+
+    Args:
+        text (str): The buffered text.
+
+    Returns:
+        int: The length of the complete records, 0 if there are none.
+    """
+    end = text.rfind("\n") + 1
+    while end and text.count('"', 0, end) % 2:
+        end = text.rfind("\n", 0, end - 1) + 1
+
+    return end
+
+
+def _parse_csv(text: str) -> Iterator[list[str]]:
+    """A function parsing complete CSV records, skipping blank lines.
+
+    Args:
+        text (str): The complete records.
+
+    Raises:
+        ValueError: If the text is not valid CSV.
+
+    Yields:
+        list[str]: The fields of the records.
+    """
+    try:
+        for record in csv.reader(io.StringIO(text)):
+            if record:
+                yield record
+    except csv.Error as error:
+        raise ValueError(f"Invalid CSV: {error}") from error
+
+
+def _csv_row(header: list[str], record: list[str]) -> Any:
+    """A function mapping a CSV record to the fields named by the header.
+
+    Args:
+        header (list[str]): The names of the columns.
+        record (list[str]): The fields of the record.
+
+    Returns:
+        Any: The dict of the non-empty fields, or `MalformedRow`.
+    """
+    if len(record) != len(header):
+        return MalformedRow(
+            f"Expected {len(header)} columns, got {len(record)}"
+        )
+
+    return {
+        name: value.strip()
+        for name, value in zip(header, record)
+        if value.strip()
+    }
+
+
+async def _read_ndjson(chunks: AsyncIterator[bytes]) -> AsyncIterator[Any]:
+    """A function reading the objects of a newline-delimited JSON body.
+
+    Args:
+        chunks (AsyncIterator[bytes]): The chunks of the request body.
+
+    Yields:
+        Any: The objects of the non-blank lines, or `MalformedRow`.
+    """
+    buffer = ""
+
+    async for text in _read_text(chunks):
+        *lines, buffer = (buffer + text).split("\n")
+        for line in lines:
+            if line.strip():
+                yield _json_line(line)
+
+    if buffer.strip():
+        yield _json_line(buffer)
+
+
+def _json_line(line: str) -> Any:
+    """A function parsing one line of a newline-delimited JSON body.
+
+    Args:
+        line (str): The line.
+
+    Returns:
+        Any: The parsed object, or `MalformedRow`.
+    """
+    try:
+        return json.loads(line)
+    except ValueError as error:
+        return MalformedRow(f"Invalid JSON: {error}")
+
+
+async def _read_json(chunks: AsyncIterator[bytes]) -> AsyncIterator[Any]:
+    """A function reading the objects of a JSON array body.
+
+    Args:
+        chunks (AsyncIterator[bytes]): The chunks of the request body.
+
+    Raises:
+        ValueError: If the body is not a JSON array.
+
+    Yields:
+        Any: The items of the array.
+    """
+    body = "".join([text async for text in _read_text(chunks)])
+    rows = json.loads(body)
+
+    if not isinstance(rows, list):
+        raise ValueError("Expected a JSON array of rows")
+
+    for row in rows:
+        yield row
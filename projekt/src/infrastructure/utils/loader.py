@@ -0,0 +1,106 @@
+"""A module containing a batching loader for lookups by ID."""
+
+import asyncio
+from typing import Awaitable, Callable, Generic, Hashable, Iterable, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class DataLoader(Generic[K, V]):
+    """A loader merging concurrent lookups by key into one batch query.
+
+    Lookups made in the same event loop iteration, e.g. from
+    `asyncio.gather`, are sent as a single batch, and every key is loaded
+    at most once. The results are kept for the lifetime of the loader, so
+    it has to be scoped to a single request and cleared on writes.
+    """
+
+    def __init__(
+        self,
+        batch_load: Callable[[list[K]], Awaitable[Iterable[V]]],
+        key: Callable[[V], K],
+    ) -> None:
+        """The initializer of the loader.
+
+        Args:
+            batch_load (Callable[[list[K]], Awaitable[Iterable[V]]]): The
+                function loading the values of many keys at once.
+            key (Callable[[V], K]): The function getting the key of a value.
+        """
+        self._batch_load = batch_load
+        self._key = key
+        self._futures: dict[K, asyncio.Future] = {}
+        self._pending: dict[K, asyncio.Future] = {}
+        # The loop only keeps weak references to tasks, so the running
+        # batches are referenced until they are done.
+        self._batches: set[asyncio.Task] = set()
+
+    async def load(self, key: K) -> V | None:
+        """Load the value of a key, batched with concurrent lookups.
+
+        Args:
+            key (K): The key of the value.
+
+        Returns:
+            V | None: The value if exists.
+        """
+        if key not in self._futures:
+            loop = asyncio.get_running_loop()
+            self._futures[key] = self._pending[key] = loop.create_future()
+
+            if len(self._pending) == 1:
+                loop.call_soon(self._start_batch, loop)
+
+        return await asyncio.shield(self._futures[key])
+
+    async def load_many(self, keys: Iterable[K]) -> list[V | None]:
+        """Load the values of many keys in one batch.
+
+        Args:
+            keys (Iterable[K]): The keys of the values.
+
+        Returns:
+            list[V | None]: The values in the order of the keys.
+        """
+        return await asyncio.gather(*(self.load(key) for key in keys))
+
+    def clear(self, *keys: K) -> None:
+        """Forget the loaded values, e.g. after they were changed.
+
+        Keys waiting for their batch are kept, the batch has not read them
+        yet.
+
+        Args:
+            *keys (K): The keys of the values.
+        """
+        for key in keys:
+            if key not in self._pending:
+                self._futures.pop(key, None)
+
+    def _start_batch(self, loop: asyncio.AbstractEventLoop) -> None:
+        """A private method starting the batch of the pending keys.
+
+        Args:
+            loop (asyncio.AbstractEventLoop): The running event loop.
+        """
+        batch = loop.create_task(self._dispatch())
+        self._batches.add(batch)
+        batch.add_done_callback(self._batches.discard)
+
+    async def _dispatch(self) -> None:
+        """A private method loading the pending keys in one batch."""
+        futures, self._pending = self._pending, {}
+
+        try:
+            loaded = await self._batch_load(list(futures))
+            values = {self._key(value): value for value in loaded}
+        except Exception as exception:
+            for key, future in futures.items():
+                if self._futures.get(key) is future:
+                    del self._futures[key]
+                future.set_exception(exception)
+            return
+
+        for key, future in futures.items():
+            future.set_result(values.get(key))
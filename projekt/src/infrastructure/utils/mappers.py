@@ -0,0 +1,226 @@
+"""A module containing mappers building models from trusted DB rows.
+
+The rows read by the repositories come from columns typed by the schema,
+so the mappers skip the pydantic validation and take the values by their
+position in the row. Both `databases` records and the asyncpg rows returned
+by prepared statements are accepted. Rows have to start with the columns
+of the mapped table in the table order; extra columns at the end are
+ignored. Setting `VALIDATE_RECORDS` validates every mapped row instead,
+which is useful to catch a query whose column layout does not match its
+mapper.
+"""
+
+from typing import Any, TypeVar
+
+from pydantic import BaseModel
+
+from src.config import config
+from src.core.domain.invitation import Invitation
+from src.core.domain.league import LeagueStatus, SportType
+from src.core.domain.match import Match
+from src.core.domain.team import Team
+from src.db import (
+    invitation_table,
+    league_table,
+    match_table,
+    team_table,
+    user_table,
+)
+from src.infrastructure.dto.leaguedto import LeagueDTO
+from src.infrastructure.dto.matchdto import FixtureDTO
+from src.infrastructure.dto.userdto import UserDTO
+
+MATCH_COLUMNS = tuple(match_table.c.keys())
+TEAM_COLUMNS = tuple(team_table.c.keys())
+LEAGUE_COLUMNS = tuple(league_table.c.keys())
+INVITATION_COLUMNS = tuple(invitation_table.c.keys())
+
+_LEAGUE_ID = LEAGUE_COLUMNS.index("id")
+_LEAGUE_NAME = LEAGUE_COLUMNS.index("name")
+_LEAGUE_CITY = LEAGUE_COLUMNS.index("city")
+_LEAGUE_SPORT_TYPE = LEAGUE_COLUMNS.index("sport_type")
+_LEAGUE_IS_PRIVATE = LEAGUE_COLUMNS.index("is_private")
+_LEAGUE_STATUS = LEAGUE_COLUMNS.index("status")
+
+# Owner columns follow the league columns in rows joined with users.
+_OWNER_ID = len(LEAGUE_COLUMNS) + tuple(user_table.c.keys()).index("id")
+_OWNER_EMAIL = len(LEAGUE_COLUMNS) + tuple(user_table.c.keys()).index("email")
+
+# Enum members by their values, looked up faster than calling the enums.
+_SPORT_TYPES = {sport_type.value: sport_type for sport_type in SportType}
+_LEAGUE_STATUSES = {status.value: status for status in LeagueStatus}
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+_new = object.__new__
+_set = object.__setattr__
+
+
+def _positions(
+    model: type[BaseModel],
+    columns: tuple[str, ...],
+) -> tuple[tuple[str, int], ...]:
+    """A function pairing the model fields with their row positions.
+
+    The fields are kept in the model order, so the mapped models are
+    serialized with the same key order as validated ones.
+
+    Args:
+        model (type[BaseModel]): The model class.
+        columns (tuple[str, ...]): The columns of the rows.
+
+    Returns:
+        tuple[tuple[str, int], ...]: The fields read from the rows with
+            the positions of their columns.
+    """
+    return tuple(
+        (field, columns.index(field))
+        for field in model.model_fields
+        if field in columns
+    )
+
+
+_MATCH_FIELDS = _positions(Match, MATCH_COLUMNS)
+_TEAM_FIELDS = _positions(Team, TEAM_COLUMNS)
+_INVITATION_FIELDS = _positions(Invitation, INVITATION_COLUMNS)
+# The names of the home and away teams follow the match columns.
+_FIXTURE_FIELDS = _positions(
+    FixtureDTO,
+    MATCH_COLUMNS + ("home_team_name", "away_team_name"),
+)
+
+
+def _row(record: Any) -> Any:
+    """A function getting the asyncpg row of a record.
+
+    Args:
+        record (Any): The `databases` record or the asyncpg row itself.
+
+    Returns:
+        Any: The asyncpg row.
+    """
+    return getattr(record, "_mapping", record)
+
+
+def _construct(model: type[ModelT], values: dict[str, Any]) -> ModelT:
+    """A function building a model from values without validating them.
+
+    It sets the same state as `model_construct`, which is slower than
+    validating the row since it also resolves defaults and aliases of
+    every field. The values have to cover every field of the model.
+
+    Args:
+        model (type[ModelT]): The model class.
+        values (dict[str, Any]): The values of the model fields.
+
+    Returns:
+        ModelT: The model instance.
+    """
+    instance = _new(model)
+    _set(instance, "__dict__", values)
+    _set(instance, "__pydantic_fields_set__", set(values))
+    _set(instance, "__pydantic_extra__", None)
+    _set(instance, "__pydantic_private__", None)
+
+    return instance
+
+
+def map_match(record: Any) -> Match:
+    """A function building a match from a row of the matches table.
+
+    Args:
+        record (Any): The DB record.
+
+    Returns:
+        Match: The match model.
+    """
+    row = _row(record)
+    values = {field: row[index] for field, index in _MATCH_FIELDS}
+
+    if config.VALIDATE_RECORDS:
+        return Match(**values)
+
+    return _construct(Match, values)
+
+
+def map_team(record: Any) -> Team:
+    """A function building a team from a row of the teams table.
+
+    Args:
+        record (Any): The DB record.
+
+    Returns:
+        Team: The team model.
+    """
+    row = _row(record)
+    values = {field: row[index] for field, index in _TEAM_FIELDS}
+
+    if config.VALIDATE_RECORDS:
+        return Team(**values)
+
+    return _construct(Team, values)
+
+
+def map_league(record: Any) -> LeagueDTO:
+    """A function building a league DTO from a league row joined with users.
+
+    Args:
+        record (Any): The DB record.
+
+    Returns:
+        LeagueDTO: The league DTO with owner information.
+    """
+    if config.VALIDATE_RECORDS:
+        return LeagueDTO.from_record(record)
+
+    row = _row(record)
+
+    return _construct(LeagueDTO, {
+        "id": row[_LEAGUE_ID],
+        "name": row[_LEAGUE_NAME],
+        "city": row[_LEAGUE_CITY],
+        "sport_type": _SPORT_TYPES[row[_LEAGUE_SPORT_TYPE]],
+        "is_private": row[_LEAGUE_IS_PRIVATE],
+        "owner": _construct(UserDTO, {
+            "id": row[_OWNER_ID],
+            "email": row[_OWNER_EMAIL],
+        }),
+        "status": _LEAGUE_STATUSES[row[_LEAGUE_STATUS]],
+    })
+
+
+def map_invitation(record: Any) -> Invitation:
+    """A function building an invitation from a row of the invitations table.
+
+    Args:
+        record (Any): The DB record.
+
+    Returns:
+        Invitation: The invitation model.
+    """
+    row = _row(record)
+    values = {field: row[index] for field, index in _INVITATION_FIELDS}
+
+    if config.VALIDATE_RECORDS:
+        return Invitation(**values)
+
+    return _construct(Invitation, values)
+
+
+def map_fixture(record: Any) -> FixtureDTO:
+    """A function building a fixture from a match row with team names.
+
+    The names of the home and away teams follow the match columns.
+
+    Args:
+        record (Any): The DB record.
+
+    Returns:
+        FixtureDTO: The match with the names of its teams.
+    """
+    row = _row(record)
+    values = {field: row[index] for field, index in _FIXTURE_FIELDS}
+
+    if config.VALIDATE_RECORDS:
+        return FixtureDTO(**values)
+
+    return _construct(FixtureDTO, values)
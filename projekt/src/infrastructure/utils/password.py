@@ -1,6 +1,11 @@
 """A module containing password helper methods."""
 
 
+import asyncio
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable
+
 from passlib.context import CryptContext
 
 pwd_context = CryptContext(schemes=["bcrypt"])
@@ -28,4 +33,130 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     Returns:
         bool: True if the password matches the hash, False otherwise.
     """
-    return pwd_context.verify(plain_password, hashed_password)
\ No newline at end of file
+    return pwd_context.verify(plain_password, hashed_password)
+
+
+class PasswordQueueFullError(Exception):
+    """Raised when too many password operations are already pending."""
+
+
+class PasswordHasher:
+    """A class running password hashing in a bounded process pool.
+
+    bcrypt takes hundreds of milliseconds and may hold the GIL, so it is
+    kept off the event loop and out of the API process threads.
+    """
+
+    def __init__(self, workers: int, max_pending: int) -> None:
+        """The initializer of the password hasher.
+
+        Args:
+            workers (int): The number of worker processes.
+            max_pending (int): The maximum number of queued and running
+                operations before new ones are rejected.
+        """
+        self._workers = workers
+        self._max_pending = max_pending
+        self._executor: ProcessPoolExecutor | None = None
+        self._pending = 0
+        self._rejected = 0
+        self._timings = {
+            "hash": {"count": 0, "total": 0.0, "max": 0.0},
+            "verify": {"count": 0, "total": 0.0, "max": 0.0},
+        }
+
+    async def hash(self, password: str) -> str:
+        """Hash a password in a worker process.
+
+        Args:
+            password (str): A raw form of the password.
+
+        Raises:
+            PasswordQueueFullError: If too many operations are pending.
+
+        Returns:
+            str: The hashed password.
+        """
+        return await self._run("hash", hash_password, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        """Verify a password against its hash in a worker process.
+
+        Args:
+            plain_password (str): The raw password.
+            hashed_password (str): The hashed password.
+
+        Raises:
+            PasswordQueueFullError: If too many operations are pending.
+
+        Returns:
+            bool: True if the password matches the hash, False otherwise.
+        """
+        return await self._run(
+            "verify",
+            verify_password,
+            plain_password,
+            hashed_password,
+        )
+
+    def shutdown(self) -> None:
+        """Stop the worker processes."""
+        if self._executor:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+
+    def stats(self) -> dict:
+        """Get the usage statistics of the hasher.
+
+        Returns:
+            dict: The queue state and per-operation timings.
+        """
+        stats: dict[str, Any] = {
+            "workers": self._workers,
+            "pending": self._pending,
+            "max_pending": self._max_pending,
+            "rejected": self._rejected,
+        }
+        for operation, timing in self._timings.items():
+            count = timing["count"]
+            stats[f"{operation}_count"] = count
+            stats[f"{operation}_avg_ms"] = (
+                timing["total"] / count * 1000 if count else 0.0
+            )
+            stats[f"{operation}_max_ms"] = timing["max"] * 1000
+
+        return stats
+
+    async def _run(self, operation: str, func: Callable, *args: Any) -> Any:
+        """A private method running a function in the process pool.
+
+        Args:
+            operation (str): The name of the operation for the timings.
+            func (Callable): The function to run.
+            *args (Any): The arguments of the function.
+
+        Raises:
+            PasswordQueueFullError: If too many operations are pending.
+
+        Returns:
+            Any: The result of the function.
+        """
+        if self._pending >= self._max_pending:
+            self._rejected += 1
+            raise PasswordQueueFullError()
+
+        if not self._executor:
+            self._executor = ProcessPoolExecutor(max_workers=self._workers)
+
+        self._pending += 1
+        started = time.perf_counter()
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, func, *args)
+        finally:
+            self._pending -= 1
+            elapsed = time.perf_counter() - started
+            timing = self._timings[operation]
+            timing["count"] += 1
+            timing["total"] += elapsed
+            timing["max"] = max(timing["max"], elapsed)
@@ -0,0 +1,264 @@
+"""A module containing the registry of prepared repository statements.
+
+Repository queries with a fixed shape are built and compiled once, when
+their module is imported, and later run directly on the asyncpg connection
+of the current task. asyncpg prepares each distinct SQL text once per pooled
+connection and keeps it in its statement cache (`DB_STATEMENT_CACHE_SIZE`),
+so repeated calls skip both the SQLAlchemy compilation and the server-side
+planning of the statement.
+"""
+
+import json
+import time
+from typing import Any, Iterator
+
+import asyncpg  # type: ignore
+from sqlalchemy import literal, literal_column
+from sqlalchemy.dialects.postgresql.asyncpg import dialect as asyncpg_dialect
+from sqlalchemy.sql import ColumnElement, Executable
+from sqlalchemy.types import TypeEngine
+
+from src.db import database
+
+_dialect = asyncpg_dialect()
+
+
+def constant(value: Any, type_: TypeEngine) -> ColumnElement:
+    """A function rendering a value into the statement text.
+
+    Constants sent as parameters are unknown to a generic plan, so the
+    planner could not match them with the predicates of partial indexes.
+
+    Args:
+        value (Any): The constant value.
+        type_ (TypeEngine): The SQL type of the value.
+
+    Returns:
+        ColumnElement: The literal SQL expression.
+    """
+    rendered = literal(value, type_).compile(
+        dialect=_dialect,
+        compile_kwargs={"literal_binds": True},
+    )
+
+    return literal_column(str(rendered), type_)
+
+
+class Statement:
+    """A query compiled once and run as a prepared statement."""
+
+    def __init__(self, name: str, query: Executable) -> None:
+        """The initializer of the statement.
+
+        Args:
+            name (str): The name of the statement used in the statistics.
+            query (Executable): The query with `bindparam` placeholders.
+        """
+        compiled = query.compile(dialect=_dialect)
+
+        self.name = name
+        self.sql = compiled.string
+        self.parameters = tuple(compiled.positiontup or ())
+        self._defaults = compiled.params
+        self.calls = 0
+        self.rows = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+
+    async def fetch_all(self, **params: Any) -> list[asyncpg.Record]:
+        """Run the statement and fetch all rows.
+
+        Args:
+            **params (Any): The values of the statement placeholders.
+
+        Returns:
+            list[Record]: The fetched rows.
+        """
+        rows = await self._run("fetch", params)
+        self.rows += len(rows)
+
+        return rows
+
+    async def fetch_one(self, **params: Any) -> asyncpg.Record | None:
+        """Run the statement and fetch the first row.
+
+        Args:
+            **params (Any): The values of the statement placeholders.
+
+        Returns:
+            Record | None: The fetched row if exists.
+        """
+        row = await self._run("fetchrow", params)
+        self.rows += row is not None
+
+        return row
+
+    async def fetch_value(self, **params: Any) -> Any:
+        """Run the statement and fetch the first column of the first row.
+
+        Args:
+            **params (Any): The values of the statement placeholders.
+
+        Returns:
+            Any: The fetched value.
+        """
+        value = await self._run("fetchval", params)
+        self.rows += 1
+
+        return value
+
+    async def estimate_rows(self, **params: Any) -> int:
+        """Estimate the number of rows of the statement from its plan.
+
+        Args:
+            **params (Any): The values of the statement placeholders.
+
+        Returns:
+            int: The number of rows estimated by the planner.
+        """
+        plan = await self.explain(**params)
+
+        return int(plan["Plan Rows"])
+
+    async def scanned_relations(self, **params: Any) -> list[str]:
+        """Get the tables and partitions the plan of the statement reads.
+
+        Partitions pruned by the planner are not listed, so it shows
+        whether the statement is confined to the partitions of its filter.
+
+        Args:
+            **params (Any): The values of the statement placeholders.
+
+        Returns:
+            list[str]: The names of the scanned relations, in plan order.
+        """
+        nodes = [await self.explain(**params)]
+        relations = []
+
+        while nodes:
+            node = nodes.pop(0)
+            if "Relation Name" in node:
+                relations.append(node["Relation Name"])
+            nodes += node.get("Plans", [])
+
+        return relations
+
+    async def explain(self, **params: Any) -> dict:
+        """Get the plan of the statement without running it.
+
+        Args:
+            **params (Any): The values of the statement placeholders.
+
+        Returns:
+            dict: The root node of the JSON plan.
+        """
+        plan = await self._run(
+            "fetchval",
+            params,
+            prefix="EXPLAIN (FORMAT JSON) ",
+        )
+
+        return json.loads(plan)[0]["Plan"]
+
+    async def _run(self, method: str, params: dict, prefix: str = "") -> Any:
+        """A private method running the statement on the task connection.
+
+        The connection of the current task is reused, so the statement
+        takes part in an open `database.transaction()`.
+
+        Args:
+            method (str): The name of the asyncpg connection method.
+            params (dict): The values of the statement placeholders.
+            prefix (str, optional): The SQL prepended to the statement,
+                e.g. `EXPLAIN`. Defaults to "".
+
+        Returns:
+            Any: The result of the asyncpg method.
+        """
+        args = [
+            params[name] if name in params else self._defaults[name]
+            for name in self.parameters
+        ]
+
+        started = time.perf_counter()
+        async with database.connection() as connection:
+            result = await getattr(connection.raw_connection, method)(
+                prefix + self.sql,
+                *args,
+            )
+
+        elapsed = time.perf_counter() - started
+        self.calls += 1
+        self.total_time += elapsed
+        self.max_time = max(self.max_time, elapsed)
+
+        return result
+
+    def stats(self) -> dict:
+        """Get the usage statistics of the statement.
+
+        Returns:
+            dict: The call and row counters with timings.
+        """
+        return {
+            "name": self.name,
+            "calls": self.calls,
+            "rows": self.rows,
+            "total_ms": self.total_time * 1000,
+            "avg_ms": (
+                self.total_time / self.calls * 1000 if self.calls else 0.0
+            ),
+            "max_ms": self.max_time * 1000,
+        }
+
+
+class StatementRegistry:
+    """A registry of the named repository statements."""
+
+    def __init__(self) -> None:
+        """The initializer of the registry."""
+        self._statements: dict[str, Statement] = {}
+
+    def register(self, name: str, query: Executable) -> Statement:
+        """Compile a query and register it under a unique name.
+
+        Args:
+            name (str): The name of the statement.
+            query (Executable): The query with `bindparam` placeholders.
+
+        Raises:
+            ValueError: If the name is already registered.
+
+        Returns:
+            Statement: The compiled statement.
+        """
+        if name in self._statements:
+            raise ValueError(f"Statement {name} is already registered")
+
+        statement = Statement(name, query)
+        self._statements[name] = statement
+
+        return statement
+
+    def __iter__(self) -> Iterator[Statement]:
+        """Iterate over the registered statements.
+
+        Returns:
+            Iterator[Statement]: The statements in registration order.
+        """
+        return iter(list(self._statements.values()))
+
+    def stats(self) -> list[dict]:
+        """Get the usage statistics of all statements.
+
+        Returns:
+            list[dict]: The statistics ordered by the total time.
+        """
+        return sorted(
+            (statement.stats() for statement in self._statements.values()),
+            key=lambda stats: stats["total_ms"],
+            reverse=True,
+        )
+
+
+statements = StatementRegistry()
@@ -1,10 +1,13 @@
 """A module containing helper functions for token generation."""
 
+import hashlib
+import time
 from datetime import datetime, timedelta, timezone
 
-from jose import jwt
+from jose import JWTError, jwt
 from pydantic import UUID4
 
+from src.infrastructure.utils.cache import LRUCache
 from src.infrastructure.utils.consts import (
     EXPIRATION_MINUTES,
     ALGORITHM,
@@ -25,4 +28,41 @@ def generate_user_token(user_uuid: UUID4) -> dict:
     jwt_data = {"sub": str(user_uuid), "exp": expire, "type": "confirmation"}
     encoded_jwt = jwt.encode(jwt_data, key=SECRET_KEY, algorithm=ALGORITHM)
 
-    return {"user_token": encoded_jwt, "expires": expire}
\ No newline at end of file
+    return {"user_token": encoded_jwt, "expires": expire}
+
+
+def decode_user_token(token: str, cache: LRUCache) -> int | None:
+    """A function returning the user ID from a verified JWT token.
+
+    Verified tokens are cached by their digest until they expire, so repeated
+    requests with the same token skip the signature verification.
+
+    Args:
+        token (str): The encoded JWT token.
+        cache (LRUCache): The cache of already verified tokens.
+
+    Returns:
+        int | None: The user ID if the token is valid.
+    """
+    key = hashlib.sha256(token.encode()).digest()
+
+    if cached := cache.get(key):
+        user_id, expires = cached
+        if expires > time.time():
+            return user_id
+
+        cache.invalidate(key)
+
+    try:
+        payload = jwt.decode(token, key=SECRET_KEY, algorithms=[ALGORITHM])
+        user_id = int(payload.get("sub"))
+        expires = float(payload["exp"])
+    except (JWTError, KeyError, TypeError, ValueError):
+        return None
+
+    if not user_id:
+        return None
+
+    cache.set(key, (user_id, expires))
+
+    return user_id
@@ -1,8 +1,10 @@
 """Main module of the app"""
 
-from contextlib import asynccontextmanager
+import asyncio
+from contextlib import asynccontextmanager, suppress
 from typing import AsyncGenerator
 
+import asyncpg  # type: ignore
 from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.exception_handlers import http_exception_handler
 
@@ -10,25 +12,41 @@ from src.api.routers.user import router as user_router
 from src.api.routers.league import router as league_router
 from src.api.routers.team import router as team_router
 from src.api.routers.match import router as match_router
+from src.api.routers.metrics import router as metrics_router
+from src.config import config
 from src.container import Container
 from src.db import database, init_db
 
 container = Container()
 container.wire(modules=[
+    "src.api.auth",
     "src.api.routers.user",
     "src.api.routers.league",
     "src.api.routers.team",
     "src.api.routers.match",
+    "src.api.routers.metrics",
 ])
 
 
+async def purge_invitations() -> None:
+    """A background task deleting expired invitations periodically."""
+    while True:
+        await asyncio.sleep(config.INVITATION_PURGE_INTERVAL)
+        with suppress(asyncpg.PostgresError, OSError):
+            await container.invitation_service().purge_expired()
+
+
 @asynccontextmanager
 async def lifespan(_: FastAPI) -> AsyncGenerator:
     """Lifespan function working on app startup."""
     await init_db()
-    await database.connect()
+    purge_task = asyncio.create_task(purge_invitations())
     yield
+    purge_task.cancel()
+    with suppress(asyncio.CancelledError):
+        await purge_task
     await database.disconnect()
+    container.password_hasher().shutdown()
 
 
 app = FastAPI(lifespan=lifespan)
@@ -36,6 +54,7 @@ app.include_router(user_router, prefix="/auth")
 app.include_router(league_router, prefix="/leagues")
 app.include_router(team_router, prefix="/teams")
 app.include_router(match_router, prefix="/matches")
+app.include_router(metrics_router, prefix="/metrics")
 
 
 @app.exception_handler(HTTPException)
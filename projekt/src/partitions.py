@@ -0,0 +1,101 @@
+"""Maintenance commands of the partitions of the matches table.
+
+Usage:
+    python -m src.partitions list
+    python -m src.partitions check [--league-id LEAGUE_ID]
+
+`check` explains the repository statements scoped to a league and fails
+if any of them reads more than one partition of the matches table.
+"""
+
+import argparse
+import asyncio
+import sys
+
+from src.db import (
+    database,
+    match_partitions,
+    match_table,
+)
+from src.infrastructure.repositories.matchdb import (
+    BY_ID,
+    BY_IDS,
+    BY_LEAGUE,
+    DELETE,
+)
+from src.infrastructure.repositories.standingsdb import CALCULATE
+
+# Statements which have to be pruned to the partition of their league.
+LEAGUE_SCOPED = [BY_LEAGUE, BY_ID, BY_IDS, DELETE, CALCULATE]
+
+
+async def check_pruning(league_id: int) -> bool:
+    """Function checking that league statements are pruned to one partition.
+
+    Args:
+        league_id (int): The ID of the league used in the plans.
+
+    Returns:
+        bool: True if every statement reads at most one partition.
+    """
+    pruned = True
+
+    for statement in LEAGUE_SCOPED:
+        relations = await statement.scanned_relations(
+            league_id=league_id,
+            match_id=0,
+            match_ids=[0],
+        )
+        partitions = sorted({
+            relation for relation in relations
+            if relation.startswith(f"{match_table.name}_p")
+        })
+        pruned &= len(partitions) <= 1
+        print(f"{statement.name}: {', '.join(partitions) or '-'}")
+
+    return pruned
+
+
+async def run(args: argparse.Namespace) -> int:
+    """Function running a maintenance command.
+
+    Args:
+        args (argparse.Namespace): The parsed command line arguments.
+
+    Returns:
+        int: The exit status of the command.
+    """
+    await database.connect()
+
+    try:
+        if args.command == "list":
+            for partition in await match_partitions():
+                print(
+                    f"{partition['name']}: "
+                    f"{partition['bound']}, "
+                    f"~{partition['estimated_rows']} rows, "
+                    f"{partition['total_bytes']} bytes"
+                )
+        elif args.command == "check":
+            return 0 if await check_pruning(args.league_id) else 1
+    finally:
+        await database.disconnect()
+
+    return 0
+
+
+def main() -> None:
+    """Function parsing the command line and running the command."""
+    parser = argparse.ArgumentParser(prog="python -m src.partitions")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser("list", help="list the partitions")
+
+    check = commands.add_parser("check", help="check partition pruning")
+    check.add_argument("--league-id", type=int, default=1)
+
+    sys.exit(asyncio.run(run(parser.parse_args())))
+
+
+if __name__ == "__main__":
+    main()
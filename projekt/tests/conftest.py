@@ -0,0 +1,67 @@
+"""Fixtures of the tests running against PostgreSQL.
+
+The tests use the database configured with the `DB_*` variables and are
+skipped when it is not configured or cannot be reached. Every test runs
+in a transaction which is rolled back, so the database is left as found.
+Run them from the `projekt` directory with `python -m pytest`.
+"""
+
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+import asyncpg  # type: ignore
+import pytest
+
+from src.config import config
+from src.db import _create_schema, database
+
+
+@pytest.fixture(scope="session")
+def anyio_backend() -> str:
+    """The event loop implementation of the async tests."""
+    return "asyncio"
+
+
+@asynccontextmanager
+async def _rolled_back() -> AsyncIterator[None]:
+    """A function connecting to the test database inside a transaction.
+
+    Yields:
+        None: Control to the caller while the transaction is open.
+    """
+    if not config.DB_HOST:
+        pytest.skip("DB_HOST is not configured")
+
+    try:
+        await database.connect()
+    except (OSError, asyncpg.PostgresError) as error:
+        pytest.skip(f"Database is not reachable: {error}")
+
+    try:
+        await _create_schema()
+        async with database.transaction(force_rollback=True):
+            yield
+    finally:
+        await database.disconnect()
+
+
+@pytest.fixture
+async def db() -> AsyncIterator[None]:
+    """A fixture connecting to the test database inside a transaction.
+
+    Yields:
+        None: Control to the test while the transaction is open.
+    """
+    async with _rolled_back():
+        yield
+
+
+@pytest.fixture(scope="module")
+async def module_db() -> AsyncIterator[None]:
+    """A fixture sharing one rolled back transaction by a module's tests.
+
+    Yields:
+        None: Control to the tests while the transaction is open.
+    """
+    async with _rolled_back():
+        yield
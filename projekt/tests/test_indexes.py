@@ -0,0 +1,319 @@
+"""Tests checking that the registered statements are planned with indexes.
+
+The tables are seeded once per module with thousands of leagues and their
+teams, matches, standings and invitations, and analyzed, so the plans are
+the ones chosen for a populated database rather than for empty tables.
+Every registered statement is planned, including the listings of the
+filter combinations offered by the API.
+"""
+
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.core.domain.league import LeagueFilter, LeagueStatus, SportType
+from src.core.domain.match import MatchFilter
+from src.db import database
+from src.infrastructure.repositories import (  # noqa: F401
+    invitationdb,
+    standingsdb,
+    teamdb,
+)
+from src.infrastructure.repositories.importdb import CREATE_STAGING
+from src.infrastructure.repositories.leaguedb import _listing_statements
+from src.infrastructure.repositories.matchdb import _range_statements
+from src.infrastructure.utils.statements import Statement, statements
+
+pytestmark = pytest.mark.anyio
+
+# The seeded ids start past the rows a development database may hold.
+BASE = 1_000_000
+USERS = 20_000
+LEAGUES = 5_000
+# Most leagues are new, only the first ones have a schedule.
+PLAYING_LEAGUES = 2_000
+TEAMS_PER_LEAGUE = 8
+# Made-up city names, so the trigrams of one city are rare in the others.
+_random = random.Random(0)
+SYLLABLES = "ka ro li mo se dar wi no bel tu gor zy".split()
+CITIES = sorted({
+    "".join(_random.choices(SYLLABLES, k=4)).capitalize()
+    for _ in range(200)
+})
+SINCE = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+SEED = [
+    f"""
+    INSERT INTO users (id, email, password)
+    SELECT {BASE} + n, 'user' || n || '@example.com', '-'
+    FROM generate_series(1, {USERS}) AS n
+    """,
+    f"""
+    INSERT INTO leagues (
+        id, name, city, sport_type, is_private, owner_id, status
+    )
+    SELECT
+        {BASE} + n,
+        'League ' || n,
+        (ARRAY{CITIES})[n % {len(CITIES)} + 1],
+        (ARRAY['football', 'volleyball', 'basketball', 'handball', 'other'])
+            [n % 5 + 1],
+        n % 7 = 0,
+        {BASE} + n % {USERS} + 1,
+        CASE WHEN n % 5 = 0 THEN 'archived' ELSE 'active' END
+    FROM generate_series(1, {LEAGUES}) AS n
+    """,
+    f"""
+    INSERT INTO teams (id, name, league_id, captain_id)
+    SELECT
+        {BASE} + n + 1,
+        'Team ' || n,
+        {BASE} + n / {TEAMS_PER_LEAGUE} + 1,
+        {BASE} + n % {USERS} + 1
+    FROM generate_series(0, {LEAGUES * TEAMS_PER_LEAGUE - 1}) AS n
+    """,
+    # A double round robin of every league, finished until June.
+    f"""
+    CREATE TEMPORARY TABLE seeded_matches ON COMMIT DROP AS
+    SELECT
+        *,
+        CASE WHEN date < '2024-06-01' THEN 'finished' ELSE 'scheduled' END
+            AS status
+    FROM (
+        SELECT
+            {BASE} + row_number() OVER () AS id,
+            home.league_id,
+            home.id AS home_team_id,
+            away.id AS away_team_id,
+            timestamptz '2024-01-01'
+                + (home.league_id % 30) * interval '1 day'
+                + row_number() OVER (PARTITION BY home.league_id)
+                * interval '3 days' AS date
+        FROM teams AS home
+        JOIN teams AS away
+            ON away.league_id = home.league_id AND away.id <> home.id
+        WHERE home.league_id BETWEEN {BASE} AND {BASE + PLAYING_LEAGUES}
+    ) AS pairs
+    """,
+    f"""
+    INSERT INTO matches (
+        id, league_id, home_team_id, away_team_id,
+        home_score, away_score, date, status, submitted_by
+    )
+    OVERRIDING SYSTEM VALUE
+    SELECT
+        seeded.id, seeded.league_id, home_team_id, away_team_id,
+        CASE WHEN seeded.status = 'finished' THEN seeded.id % 4 END,
+        CASE WHEN seeded.status = 'finished' THEN seeded.id % 3 END,
+        date, seeded.status, leagues.owner_id
+    FROM seeded_matches AS seeded
+    JOIN leagues ON leagues.id = seeded.league_id
+    WHERE leagues.status = 'active'
+    """,
+    f"""
+    INSERT INTO archived_matches (
+        id, league_id, home_team_id, away_team_id,
+        home_score, away_score, date, status, submitted_by
+    )
+    SELECT
+        seeded.id, seeded.league_id, home_team_id, away_team_id,
+        seeded.id % 4, seeded.id % 3, date, 'finished', leagues.owner_id
+    FROM seeded_matches AS seeded
+    JOIN leagues ON leagues.id = seeded.league_id
+    WHERE leagues.status = 'archived'
+    """,
+    f"""
+    INSERT INTO standings (
+        team_id, played, won, drawn, lost, goals_for, goals_against, points
+    )
+    SELECT teams.id, 7, 3, 1, 3, 10, 9, 10
+    FROM teams
+    JOIN leagues ON leagues.id = teams.league_id
+    WHERE teams.id > {BASE} AND leagues.status = 'active'
+    """,
+    f"""
+    INSERT INTO standings_snapshots (
+        league_id, position, team_id, team_name, played, won, drawn, lost,
+        goals_for, goals_against, goal_difference, points
+    )
+    SELECT
+        teams.league_id,
+        row_number() OVER (PARTITION BY teams.league_id ORDER BY teams.id),
+        teams.id, teams.name, 14, 6, 2, 6, 20, 18, 2, 20
+    FROM teams
+    JOIN leagues ON leagues.id = teams.league_id
+    WHERE teams.id > {BASE} AND leagues.status = 'archived'
+    """,
+    """
+    INSERT INTO league_counters (
+        league_id, scheduled, pending, finished, expected
+    )
+    SELECT
+        seeded.league_id,
+        count(*) FILTER (WHERE seeded.status = 'scheduled'),
+        0,
+        count(*) FILTER (WHERE seeded.status = 'finished'),
+        count(*)
+    FROM seeded_matches AS seeded
+    JOIN leagues ON leagues.id = seeded.league_id
+    WHERE leagues.status = 'active'
+    GROUP BY seeded.league_id
+    """,
+    f"""
+    INSERT INTO invitations (id, league_id, token, expires_at)
+    SELECT
+        {BASE} + n,
+        {BASE} + n % {LEAGUES} + 1,
+        'seeded-token-' || n,
+        now() + (n % 50 - 1) * interval '1 day'
+    FROM generate_series(1, {LEAGUES * 5}) AS n
+    """,
+    # The rows added to GIN indexes wait in their pending list until the
+    # table is vacuumed, and the planner prices the indexes accordingly.
+    "SELECT gin_clean_pending_list('ix_leagues_name_trgm'), "
+    "gin_clean_pending_list('ix_leagues_city_trgm')",
+    "ANALYZE users, leagues, teams, matches, archived_matches, standings, "
+    "standings_snapshots, league_counters, invitations",
+]
+SEEDED_TABLES = (
+    "users",
+    "leagues",
+    "teams",
+    "matches",
+    "archived_matches",
+    "standings",
+    "standings_snapshots",
+    "league_counters",
+    "invitations",
+)
+
+# League BASE + 1 is active and public, and owned by user BASE + 2.
+PARAMS = {
+    "league_id": BASE + 1,
+    "league_ids": [BASE + 1, BASE + 2],
+    "owner_id": BASE + 2,
+    "team_id": BASE + 1,
+    "team_ids": [BASE + 1, BASE + 2],
+    "match_id": BASE + 1,
+    "match_ids": [BASE + 1, BASE + 2],
+    "ids": [BASE + 1, BASE + 2],
+    "city": CITIES[7].lower(),
+    "sport_type": SportType.VOLLEYBALL.value,
+    "pattern": f"%{CITIES[7]}%",
+    "query": CITIES[7],
+    "date_from": SINCE,
+    "date_to": SINCE + timedelta(days=30),
+    "after_date": SINCE,
+    "after_id": BASE + 1,
+    "after_name": "Team 1",
+    "after_score": 0.5,
+    "limit": 20,
+    "scheduled": 28,
+    "pending": 0,
+    "finished": 28,
+    "expected": 56,
+    "home_team_ids": [BASE + 1],
+    "away_team_ids": [BASE + 2],
+    "dates": [SINCE],
+    "submitted_by": [BASE + 2],
+    "captain_id": BASE + 2,
+    "tokens": ["new-token"],
+    "expires_at": datetime(2024, 1, 1),
+    "team_name": "Invited",
+    "token": "seeded-token-1",
+    "user_id": BASE + 3,
+}
+
+# The listings of the filter combinations offered by the API are compiled
+# on their first use, so they are registered here to be planned as well.
+for filters in (
+    LeagueFilter(),
+    LeagueFilter(status=LeagueStatus.ACTIVE),
+    LeagueFilter(status=LeagueStatus.ARCHIVED),
+    LeagueFilter(status=LeagueStatus.ACTIVE, is_private=False),
+    LeagueFilter(city=CITIES[7].lower()),
+    LeagueFilter(sport_type=SportType.VOLLEYBALL),
+    LeagueFilter(owner_id=BASE + 2),
+    LeagueFilter(ids=[BASE + 1]),
+    LeagueFilter(
+        city=CITIES[7].lower(),
+        sport_type=SportType.VOLLEYBALL,
+        status=LeagueStatus.ACTIVE,
+        is_private=False,
+    ),
+):
+    _listing_statements(filters)
+
+for filters in (
+    MatchFilter(league_id=BASE + 1),
+    MatchFilter(league_id=BASE + 1, date_from=SINCE),
+    MatchFilter(team_id=BASE + 1),
+    MatchFilter(team_id=BASE + 1, date_from=SINCE, date_to=SINCE),
+    MatchFilter(date_from=SINCE, date_to=SINCE),
+    MatchFilter(ids=[BASE + 1]),
+):
+    _range_statements(filters)
+
+# Counts of the listings matching a large share of the leagues, which read
+# the table rather than most of an index.
+FULL_SCANS = {
+    f"leagues.list[{filters}]_{kind}": "leagues"
+    for filters in (
+        "",
+        "status=active",
+        "status=archived",
+        "status=active,is_private=False",
+        "sport_type",
+    )
+    for kind in ("matching", "count")
+}
+
+def _seq_scans(plan: dict) -> set[str]:
+    """A function listing the seeded tables scanned sequentially in a plan.
+
+    Args:
+        plan (dict): The root node of the JSON plan.
+
+    Returns:
+        set[str]: The tables, with partitions named after their table.
+    """
+    nodes, tables = [plan], set()
+
+    while nodes:
+        node = nodes.pop()
+        relation = node.get("Relation Name", "")
+        if node["Node Type"] == "Seq Scan" and relation.startswith(
+            SEEDED_TABLES
+        ):
+            tables.add(relation.split("_p")[0])
+        nodes += node.get("Plans", [])
+
+    return tables
+
+
+@pytest.fixture(scope="module")
+async def seeded(module_db: None) -> None:
+    """A fixture filling the tables with analyzed rows once per module."""
+    for query in SEED:
+        await database.execute(query)
+    await database.execute(CREATE_STAGING)
+
+
+@pytest.mark.parametrize(
+    "statement",
+    list(statements),
+    ids=lambda statement: statement.name,
+)
+async def test_statements_use_indexes(seeded: None, statement: Statement):
+    missing = [
+        name for name in statement.parameters
+        if name not in PARAMS and statement._defaults[name] is None
+    ]
+    assert not missing, f"{statement.name} needs PARAMS for {missing}"
+
+    # A savepoint keeps the seeded rows if planning the statement fails.
+    async with database.transaction():
+        plan = await statement.explain(**PARAMS)
+
+    assert _seq_scans(plan) <= {FULL_SCANS.get(statement.name)}
@@ -0,0 +1,147 @@
+"""Tests comparing the SQL standings with the Python calculation."""
+
+from datetime import datetime, timezone
+from typing import Any
+
+import pytest
+from sqlalchemy import Table
+
+from src.core.domain.match import Match, MatchStatus
+from src.core.domain.standing import Standing
+from src.core.domain.team import Team
+from src.db import database, league_table, match_table, team_table, user_table
+from src.infrastructure.repositories.standingsdb import CALCULATE
+from src.infrastructure.services.league import calculate_standings
+
+pytestmark = pytest.mark.anyio
+
+KICKOFF = datetime(2024, 3, 1, 18, tzinfo=timezone.utc)
+
+# Home, away, home score, away score and status of the seeded matches.
+MATCHES = [
+    ("Alpha", "Bravo", 2, 1, MatchStatus.FINISHED),
+    ("Delta", "Alpha", 0, 2, MatchStatus.FINISHED),
+    ("Bravo", "Charlie", 3, 1, MatchStatus.FINISHED),
+    # Foxtrot, Golf, Charlie and Delta end on two points. Foxtrot and Golf
+    # tie on goals too and are ordered by name, Charlie and Delta tie on
+    # the goal difference and are ordered by the goals scored.
+    ("Charlie", "Delta", 1, 1, MatchStatus.FINISHED),
+    ("Foxtrot", "Golf", 2, 2, MatchStatus.FINISHED),
+    ("Golf", "Foxtrot", 0, 0, MatchStatus.FINISHED),
+    # A finished match without a score counts as a goalless draw.
+    ("Delta", "Charlie", None, None, MatchStatus.FINISHED),
+    # Unfinished matches are not counted.
+    ("Alpha", "Charlie", None, None, MatchStatus.SCHEDULED),
+    ("Bravo", "Delta", 5, 0, MatchStatus.PENDING),
+]
+# Echo and both Hotel teams have no matches; the Hotels are ordered by ID.
+TEAMS = ["Alpha", "Bravo", "Charlie", "Delta", "Echo", "Foxtrot", "Golf"]
+TEAMS += ["Hotel", "Hotel"]
+
+
+async def _insert(table: Table, **values: Any) -> int:
+    """A function inserting a row and returning its ID."""
+    return await database.execute(table.insert().values(**values))
+
+
+async def _seed_league(owner_id: int, name: str) -> tuple[int, list[Team]]:
+    """A function seeding a league with its teams.
+
+    Args:
+        owner_id (int): The ID of the league owner.
+        name (str): The name of the league.
+
+    Returns:
+        tuple[int, list[Team]]: The ID of the league and its teams.
+    """
+    league_id = await _insert(
+        league_table,
+        name=name,
+        city="Siedlce",
+        sport_type="football",
+        is_private=False,
+        owner_id=owner_id,
+        status="active",
+    )
+    teams = [
+        Team(
+            id=await _insert(
+                team_table,
+                name=team,
+                league_id=league_id,
+                captain_id=owner_id,
+            ),
+            name=team,
+            league_id=league_id,
+            captain_id=owner_id,
+        )
+        for team in TEAMS
+    ]
+
+    return league_id, teams
+
+
+async def _seed_matches(league_id: int, teams: list[Team]) -> list[Match]:
+    """A function seeding the matches of a league.
+
+    Args:
+        league_id (int): The ID of the league.
+        teams (list[Team]): The teams of the league.
+
+    Returns:
+        list[Match]: The seeded matches.
+    """
+    ids = {team.name: team.id for team in teams}
+    matches = []
+
+    for home, away, home_score, away_score, status in MATCHES:
+        values = dict(
+            league_id=league_id,
+            home_team_id=ids[home],
+            away_team_id=ids[away],
+            home_score=home_score,
+            away_score=away_score,
+            date=KICKOFF,
+            status=status.value,
+        )
+        match_id = await _insert(match_table, **values)
+        matches.append(Match(id=match_id, **values))
+
+    return matches
+
+
+async def test_sql_standings_match_python_calculation(db: None):
+    owner_id = await _insert(
+        user_table,
+        email="standings@example.com",
+        password="-",
+    )
+    league_id, teams = await _seed_league(owner_id, "Parity")
+    matches = await _seed_matches(league_id, teams)
+
+    # Matches of another league must not leak into the table.
+    other_id, other_teams = await _seed_league(owner_id, "Other")
+    await _seed_matches(other_id, other_teams)
+
+    rows = await CALCULATE.fetch_all(league_id=league_id)
+    calculated = [Standing(**dict(row)) for row in rows]
+    expected = calculate_standings(
+        sorted(teams, key=lambda team: (team.name, team.id)),
+        matches,
+    )
+
+    assert [row["position"] for row in rows] == list(range(1, len(TEAMS) + 1))
+    assert calculated == expected
+    assert [standing.team_name for standing in calculated] == [
+        "Alpha",
+        "Bravo",
+        "Foxtrot",
+        "Golf",
+        "Charlie",
+        "Delta",
+        "Echo",
+        "Hotel",
+        "Hotel",
+    ]
+    assert calculated[-2].team_id < calculated[-1].team_id
+    assert calculated[-1].played == 0